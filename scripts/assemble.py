@@ -0,0 +1,220 @@
+"""
+シーン動画をタイムラインどおりに連結して本編を作る
+
+タイムライン（JSON）に並べたクリップを順に連結する：
+- {"scene": "DamageEstimation"}                 : レンダリング済みのシーン動画
+- {"file": "slides.mp4", "in": 3.0, "out": 12.5} : 任意の動画（in / out で切り出し）
+- {"gap": 1.5}                                   : 黒画面（秒）
+
+先頭のクリップのストリーム（コーデック・解像度・フレームレートなど）を基準にし、
+基準と同じで切り出しもないクリップは再エンコードせずにそのまま連結する。
+基準と違うクリップ、切り出すクリップ、黒画面だけを基準に合わせてエンコードし、
+media/assembly/segments/ に入力ファイルと設定のハッシュで保存して使い回す。
+1シーンを描き直した後の再構成では、そのシーン以外はエンコードせずに済む。
+
+使い方:
+  python assemble.py                         # scripts/timeline.json
+  python assemble.py my_timeline.json -q l   # 画質を上書き
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from fractions import Fraction
+from pathlib import Path
+
+from ffmpeg_tools import concat_copy, probe_duration, probe_streams, run_ffmpeg
+from scene_catalog import DEFAULT_MEDIA_DIR, QUALITY_DIRS, SCRIPTS_DIR, discover_scenes, select_scenes
+
+DEFAULT_TIMELINE = SCRIPTS_DIR / "timeline.json"
+ASSEMBLY_DIR = DEFAULT_MEDIA_DIR / "assembly"
+
+# 基準に合わせてエンコードするときの設定
+ENCODE_ARGS = ("-c:v", "libx264", "-crf", "18", "-preset", "medium")
+# エンコードのしかたを変えたら上げる（古いセグメントを使い回さないように）
+SEGMENT_VERSION = 3
+
+
+@dataclass
+class Clip:
+    """タイムラインの1クリップ（source が None なら黒画面）"""
+
+    label: str
+    source: Path | None = None
+    start: float = 0.0
+    end: float | None = None
+    gap: float = 0.0
+
+    @property
+    def trimmed(self) -> bool:
+        return self.start > 0 or self.end is not None
+
+
+def load_timeline(
+    path: Path,
+    media_dir: Path = DEFAULT_MEDIA_DIR,
+    quality: str | None = None,
+) -> tuple[list[Clip], str]:
+    """タイムラインを読み、（クリップ, 出力ファイル名）を返す"""
+    timeline = json.loads(Path(path).read_text(encoding="utf-8"))
+    quality = quality or timeline.get("quality", "h")
+    specs = {spec.name: spec for spec in discover_scenes()}
+
+    clips = []
+    for item in timeline["clips"]:
+        if "gap" in item:
+            clips.append(Clip(f"黒 {item['gap']}秒", gap=float(item["gap"])))
+            continue
+        if "scene" in item:
+            (spec,) = select_scenes(list(specs.values()), [item["scene"]])
+            source = spec.output_path(media_dir, quality)
+            label = spec.name
+        else:
+            source = (Path(path).parent / item["file"]).resolve()
+            label = source.name
+        if not source.exists():
+            raise SystemExit(f"動画がありません: {source}（先にレンダリングしてください）")
+        clips.append(Clip(label, source, float(item.get("in", 0.0)), item.get("out")))
+    return clips, timeline.get("output", "assembled.mp4")
+
+
+def _segment_key(clip: Clip, reference: list[dict]) -> str:
+    """エンコード済みセグメントのキャッシュキー（入力・切り出し・基準・設定）"""
+    source = None
+    if clip.source is not None:
+        stat = clip.source.stat()
+        source = [str(clip.source), stat.st_size, stat.st_mtime_ns]
+    payload = [source, clip.start, clip.end, clip.gap, reference, ENCODE_ARGS, SEGMENT_VERSION]
+    return hashlib.sha256(json.dumps(payload).encode()).hexdigest()[:16]
+
+
+def encode_command(
+    clip: Clip,
+    reference: list[dict],
+    output: Path,
+    source_has_audio: bool = False,
+) -> list[str]:
+    """クリップを基準のストリームに合わせてエンコードする ffmpeg の引数"""
+    video = next(s for s in reference if s["codec_type"] == "video")
+    audio = next((s for s in reference if s["codec_type"] == "audio"), None)
+    width, height, fps = video["width"], video["height"], video["r_frame_rate"]
+
+    if clip.source is None:
+        args = ["-f", "lavfi", "-i", f"color=c=black:s={width}x{height}:r={fps}:d={clip.gap}"]
+    else:
+        # -ss / -t はどちらも入力オプションとして -i の前に置く（後ろに置くと、続く
+        # anullsrc の入力に掛かってしまい、音声つきのクリップが切り出されない）
+        args = ["-ss", str(clip.start)] if clip.start else []
+        if clip.end is not None:
+            args += ["-t", str(clip.end - clip.start)]
+        args += ["-i", str(clip.source)]
+    if audio is not None:
+        layout = "stereo" if audio["channels"] == 2 else "mono"
+        # 音声の無いクリップには無音を付ける
+        args += ["-f", "lavfi", "-i", f"anullsrc=r={audio['sample_rate']}:cl={layout}"]
+        args += ["-map", "0:v", "-map", "0:a" if source_has_audio else "1:a", "-shortest"]
+        args += ["-c:a", "aac", "-ar", str(audio["sample_rate"]), "-ac", str(audio["channels"])]
+    else:
+        # 基準に音声が無ければ、クリップの音声は捨てる（ストリームが揃わず連結できない）
+        args += ["-map", "0:v", "-an"]
+
+    args += [
+        "-vf",
+        f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+        f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,fps={fps},format={video['pix_fmt']}",
+        *ENCODE_ARGS,
+    ]
+    if video.get("profile"):
+        args += ["-profile:v", video["profile"].lower()]
+    return [*args, str(output)]
+
+
+def check_trimmed_duration(clip: Clip, reference: list[dict], path: Path) -> None:
+    """切り出したクリップの長さが out - in（元の動画より長ければ元の終わりまで）か確かめる
+
+    映像1フレームと AAC の1フレーム（1024サンプル）までのずれは許す。
+    """
+    expected = min(clip.end, probe_duration(clip.source)) - clip.start
+    video = next(s for s in reference if s["codec_type"] == "video")
+    audio = next((s for s in reference if s["codec_type"] == "audio"), None)
+    tolerance = float(1 / Fraction(video["r_frame_rate"]))
+    if audio is not None:
+        tolerance += 1024 / int(audio["sample_rate"])
+    actual = probe_duration(path)
+    if abs(actual - expected) > tolerance:
+        raise RuntimeError(
+            f"{clip.label}: 切り出した長さが {actual:.3f}秒です（期待値 {expected:.3f}秒）"
+        )
+
+
+def prepare_clip(clip: Clip, reference: list[dict], segment_dir: Path) -> tuple[Path, str]:
+    """連結に使うファイルを用意し、（パス, copy / cached / encode）を返す"""
+    streams = probe_streams(clip.source) if clip.source is not None else []
+    if clip.source is not None and not clip.trimmed and streams == reference:
+        return clip.source, "copy"
+
+    output = segment_dir / f"{_segment_key(clip, reference)}.mp4"
+    if output.exists():
+        return output, "cached"
+    tmp = output.with_name(f".{output.name}.tmp.mp4")
+    try:
+        has_audio = any(stream["codec_type"] == "audio" for stream in streams)
+        run_ffmpeg(encode_command(clip, reference, tmp, has_audio))
+        if clip.end is not None:
+            check_trimmed_duration(clip, reference, tmp)
+        os.replace(tmp, output)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return output, "encode"
+
+
+def assemble(
+    clips: list[Clip],
+    output: Path,
+    segment_dir: Path = ASSEMBLY_DIR / "segments",
+    jobs: int | None = None,
+) -> list[tuple[Clip, str]]:
+    """クリップを連結して output に書き出し、クリップごとの処理方法を返す"""
+    sources = [clip for clip in clips if clip.source is not None]
+    if not sources:
+        raise SystemExit("タイムラインに動画がありません")
+    reference = probe_streams(sources[0].source)
+    segment_dir.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        prepared = list(pool.map(lambda clip: prepare_clip(clip, reference, segment_dir), clips))
+    concat_copy([path for path, _ in prepared], output)
+    return [(clip, mode) for clip, (_, mode) in zip(clips, prepared)]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="シーン動画をタイムラインどおりに連結する")
+    parser.add_argument("timeline", nargs="?", type=Path, default=DEFAULT_TIMELINE)
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default=None)
+    parser.add_argument("--media-dir", type=Path, default=DEFAULT_MEDIA_DIR)
+    parser.add_argument("-o", "--output", type=Path, default=None)
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="並列数（既定: CPUコア数）")
+    args = parser.parse_args(argv)
+
+    media_dir = args.media_dir.resolve()
+    clips, name = load_timeline(args.timeline, media_dir, args.quality)
+    output = args.output or media_dir / "assembly" / name
+
+    start = time.perf_counter()
+    results = assemble(clips, output, media_dir / "assembly" / "segments", args.jobs)
+    for clip, mode in results:
+        print(f"  [{mode:<6}] {clip.label}")
+    encoded = sum(mode == "encode" for _, mode in results)
+    print(f"{output} ({time.perf_counter() - start:.1f}秒、エンコード {encoded}/{len(results)}クリップ)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+全シーンの一括並列レンダリング
+
+scripts/ 以下の Scene サブクラスをすべて検出し、マシンのコア数に合わせた
+並列度で manim を実行する：
+- シーンごとに manim プロセスを1つ起動し、ログは media/logs/<クラス名>.log へ
+- 終了後にシーンごとの結果（成否・所要時間・出力先）を表で表示
+- ソースと画質が前回から変わっていないシーンはキャッシュを使って省略
+- --lang で画面の文字列の言語を選ぶ（言語ごとに media/i18n/<言語>/ へ出力）
+- --check-layout で描画の前に layout_check.py の検査を行い、問題があれば描画しない
+
+使い方:
+  python batch_render.py                      # 全シーンを -ql で
+  python batch_render.py -q h -j 4            # 1080p60、4並列
+  python batch_render.py DamageEstimation     # 指定したシーンのみ
+  python batch_render.py --force              # キャッシュを無視して全て再レンダリング
+  python batch_render.py --lang en --lang ko  # 英語版と韓国語版
+  python batch_render.py --lang all           # 全シーン × 全言語
+  python batch_render.py --lang all --check-layout
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+from i18n import LANGUAGE_ENV, SOURCE_LANGUAGE, current_language, language_media_dir
+from render_cache import RenderCache, scene_cache_key
+from scene_catalog import (
+    DEFAULT_MEDIA_DIR,
+    QUALITY_DIRS,
+    SceneSpec,
+    discover_scenes,
+    select_scenes,
+)
+from subtitles import LANGUAGES
+
+
+@dataclass
+class RenderResult:
+    """1シーン分のレンダリング結果"""
+
+    spec: SceneSpec
+    returncode: int
+    seconds: float
+    log_path: Path
+    output: Path
+    language: str = SOURCE_LANGUAGE
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+    @property
+    def label(self) -> str:
+        if self.language == SOURCE_LANGUAGE:
+            return self.spec.name
+        return f"{self.spec.name} [{self.language}]"
+
+
+def manim_command(
+    spec: SceneSpec,
+    quality: str,
+    media_dir: Path,
+    extra: tuple[str, ...] = (),
+) -> list[str]:
+    """1シーンをレンダリングする manim コマンドを組み立てる"""
+    return [
+        sys.executable,
+        "-m",
+        "manim",
+        "render",
+        f"-q{quality}",
+        "--media_dir",
+        str(media_dir),
+        *extra,
+        str(spec.path),
+        spec.name,
+    ]
+
+
+def render_scene(
+    spec: SceneSpec,
+    quality: str,
+    media_dir: Path,
+    log_dir: Path,
+    extra: tuple[str, ...] = (),
+    log_name: str | None = None,
+    language: str | None = None,
+) -> RenderResult:
+    """manim を別プロセスで実行し、出力をログファイルに書き出す
+
+    画面の文字列は language の訳で描く（None なら環境変数 LISBON_LANG のまま）。
+    media_dir は呼び出し側で言語ごとに分けておく。
+    """
+    env = None
+    if language is None:
+        language = current_language()
+    else:
+        env = {**os.environ, LANGUAGE_ENV: language}
+    if log_name is None:
+        log_name = spec.name if language == SOURCE_LANGUAGE else f"{spec.name}.{language}"
+    log_path = log_dir / f"{log_name}.log"
+    start = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        proc = subprocess.run(
+            manim_command(spec, quality, media_dir, extra),
+            cwd=spec.path.parent,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            env=env,
+        )
+    return RenderResult(
+        spec=spec,
+        returncode=proc.returncode,
+        seconds=time.perf_counter() - start,
+        log_path=log_path,
+        output=spec.output_path(media_dir, quality),
+        language=language,
+    )
+
+
+def render_all(
+    specs: list[SceneSpec],
+    quality: str = "l",
+    jobs: int | None = None,
+    media_dir: Path = DEFAULT_MEDIA_DIR,
+    languages: list[str] | None = None,
+) -> list[RenderResult]:
+    """シーン × 言語を並列にレンダリングする"""
+    tasks = [(spec, lang) for lang in languages or [SOURCE_LANGUAGE] for spec in specs]
+    return render_tasks(tasks, quality, jobs, media_dir)
+
+
+def render_tasks(
+    tasks: list[tuple[SceneSpec, str]],
+    quality: str = "l",
+    jobs: int | None = None,
+    media_dir: Path = DEFAULT_MEDIA_DIR,
+) -> list[RenderResult]:
+    """（シーン, 言語）の組を並列にレンダリングする
+
+    各シーンは独立した manim プロセスで描画されるため、
+    ここでのスレッドはプロセスの終了を待つだけで GIL を取り合わない。
+    言語ごとに media ディレクトリが分かれるので、同じシーンの別言語も並列に描ける。
+    """
+    media_dir = Path(media_dir).resolve()
+    log_dir = media_dir / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+
+    results = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            pool.submit(
+                render_scene,
+                spec,
+                quality,
+                language_media_dir(media_dir, lang),
+                log_dir,
+                language=lang,
+            )
+            for spec, lang in tasks
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            status = "完了" if result.ok else "失敗"
+            print(f"[{status}] {result.label} ({result.seconds:.1f}秒)")
+            results.append(result)
+
+    order = {task: i for i, task in enumerate(tasks)}
+    results.sort(key=lambda r: order[r.spec, r.language])
+    return results
+
+
+def print_summary(
+    results: list[RenderResult],
+    wall_seconds: float,
+    cached: int = 0,
+) -> None:
+    """結果を表形式で表示する"""
+    name_width = max([len(r.label) for r in results] + [len("シーン")])
+    print()
+    print(f"{'シーン':<{name_width - 3}}  状態  {'時間(秒)':>7}  出力 / ログ")
+    print("-" * (name_width + 40))
+    for r in results:
+        status = "OK  " if r.ok else "失敗"
+        target = r.output if r.ok else r.log_path
+        print(f"{r.label:<{name_width}}  {status}  {r.seconds:>8.1f}  {target}")
+    print("-" * (name_width + 40))
+
+    cpu_seconds = sum(r.seconds for r in results)
+    failed = sum(not r.ok for r in results)
+    print(
+        f"{len(results)}シーン（失敗 {failed}、キャッシュ {cached}）"
+        f" 経過 {wall_seconds:.1f}秒 / 合計 {cpu_seconds:.1f}秒"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="全シーンを並列にレンダリングする")
+    parser.add_argument("scenes", nargs="*", help="レンダリングするシーン名（省略時は全シーン）")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="並列数（既定: CPUコア数）")
+    parser.add_argument("--media-dir", type=Path, default=DEFAULT_MEDIA_DIR)
+    parser.add_argument(
+        "--lang", dest="languages", action="append", choices=[*LANGUAGES, "all"],
+        help="画面の文字列の言語（複数指定可、all で全言語、既定: 環境変数 LISBON_LANG か jp）",
+    )
+    parser.add_argument("--force", action="store_true", help="キャッシュを無視する")
+    parser.add_argument(
+        "--check-layout", action="store_true",
+        help="描画の前にはみ出しと重なりを調べ、問題があれば描画しない",
+    )
+    parser.add_argument("--list", action="store_true", help="検出したシーンを表示して終了")
+    args = parser.parse_args(argv)
+
+    specs = select_scenes(discover_scenes(), args.scenes)
+    if args.list:
+        for spec in specs:
+            print(f"{spec.path.name}:{spec.lineno}  {spec.name}")
+        return 0
+
+    languages = args.languages or [current_language()]
+    if "all" in languages:
+        languages = list(LANGUAGES)
+    languages = list(dict.fromkeys(languages))
+
+    media_dir = args.media_dir.resolve()
+    caches = {lang: RenderCache(language_media_dir(media_dir, lang)) for lang in languages}
+    keys = {
+        (spec, lang): scene_cache_key(spec, args.quality, lang)
+        for lang in languages
+        for spec in specs
+    }
+    pending = []
+    for (spec, lang), key in keys.items():
+        if not args.force and caches[lang].is_fresh(spec, args.quality, key):
+            label = spec.name if lang == SOURCE_LANGUAGE else f"{spec.name} [{lang}]"
+            print(f"[キャッシュ] {label}")
+        else:
+            pending.append((spec, lang))
+
+    if args.check_layout and pending:
+        from layout_check import check_tasks
+
+        issues = check_tasks(pending, args.jobs)
+        for issue in issues:
+            print(issue.format())
+        if issues:
+            print(f"レイアウトの問題 {len(issues)}件のため描画しません（python layout_check.py で確認）")
+            return 1
+
+    start = time.perf_counter()
+    results = render_tasks(pending, args.quality, args.jobs, media_dir)
+    for result in results:
+        if result.ok:
+            caches[result.language].record(
+                result.spec, args.quality, keys[result.spec, result.language]
+            )
+    for cache in caches.values():
+        cache.save()
+
+    print_summary(results, time.perf_counter() - start, len(keys) - len(pending))
+    return 0 if all(r.ok for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
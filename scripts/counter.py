@@ -0,0 +1,178 @@
+"""
+数字を1文字ずつ組み立てるカウンター（オドメーター）
+
+Integer / DecimalNumber は値が変わるたびに数字の mobject を作り直す。
+Odometer は 0〜9 と区切り文字、テンプレートの文字（「〜」「万」など）の形を
+フォント・サイズ・色ごとに1回だけ作っておき、フレームごとには
+値の文字列に合わせてその点列を並べ直すだけにする：
+- 同じ見た目のカウンターは形を共有するので、いくつ並べても形の生成は1回
+- 数字は一番幅の広い数字に揃えた等幅の枠に置くので、数えている間に位置が揺れない
+- 値は1つの数でも、範囲（"3万〜4万" のような組）でもよい
+
+使い方:
+  counter = Odometer((0, 0), template=_("{}〜{}"), font_size=72, color=RED)
+  self.play(FadeIn(counter))
+  self.play(CountTo(counter, (30000, 40000)), run_time=2, rate_func=smooth)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from manim import DEFAULT_FONT_SIZE, WHITE, Animation, ManimColor, VMobject
+
+from fonts import scene_font
+from i18n import current_language
+from text_cache import CachedText
+
+DIGITS = "0123456789"
+
+# 言語ごとの桁区切りと小数点（無い言語は "," と "."）
+GROUP_SEPARATORS = {"es": ".", "ru": " "}
+DECIMAL_SEPARATORS = {"es": ",", "ru": ","}
+
+# 数字の枠の幅に対する字間、空白の幅
+GAP_RATIO = 0.18
+SPACE_RATIO = 0.6
+
+
+@dataclass
+class GlyphSet:
+    """1つの見た目（フォント・サイズ・色）で形を作った文字の集まり"""
+
+    points: dict[str, np.ndarray]  # 左端を x=0 にそろえた点列
+    widths: dict[str, float]
+    cell: float  # 数字の枠の幅（一番広い数字）
+
+    def advance(self, char: str) -> float:
+        if char.isspace():
+            return self.cell * SPACE_RATIO
+        return (self.cell if char in DIGITS else self.widths[char]) + self.cell * GAP_RATIO
+
+
+_glyph_sets: dict[tuple, GlyphSet] = {}
+
+
+def glyph_set(chars: str, font_size: float, color: ManimColor, weight: str) -> GlyphSet:
+    """文字の形を作る（同じ見た目ならプロセス内で使い回す）
+
+    文字を1つの Text にまとめて作るので、各文字の高さはベースラインを共有する。
+    """
+    chars = "".join(sorted(set(chars + DIGITS) - set("  ")))
+    key = (chars, font_size, color.to_hex(), weight, scene_font())
+    glyphs = _glyph_sets.get(key)
+    if glyphs is None:
+        text = CachedText(
+            chars, font_size=font_size, color=color, weight=weight, disable_ligatures=True
+        )
+        points, widths = {}, {}
+        for char, mob in zip(chars, text.chars):
+            left, right = mob.points[:, 0].min(), mob.points[:, 0].max()
+            points[char] = mob.points - np.array([left, 0.0, 0.0])
+            widths[char] = right - left
+        cell = max(widths[digit] for digit in DIGITS)
+        glyphs = _glyph_sets[key] = GlyphSet(points, widths, cell)
+    return glyphs
+
+
+class Odometer(VMobject):
+    """キャッシュした文字の形を並べて値を表示するカウンター
+
+    value は数か数の組で、template の "{}" に順に入る。
+    表示の大きさは font_size で決め、scale は値を変えるたびに元に戻る。
+    """
+
+    def __init__(
+        self,
+        value: float | tuple[float, ...] = 0,
+        template: str = "{}",
+        decimals: int = 0,
+        font_size: float = DEFAULT_FONT_SIZE,
+        color=WHITE,
+        weight: str = "NORMAL",
+        language: str | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        language = language or current_language()
+        self.template = template
+        self.decimals = decimals
+        self.group_separator = GROUP_SEPARATORS.get(language, ",")
+        self.decimal_separator = DECIMAL_SEPARATORS.get(language, ".")
+        self.glyph_color = ManimColor(color)
+        literal = template.replace("{}", "")
+        self.glyphs = glyph_set(
+            literal + self.group_separator + self.decimal_separator + "-",
+            font_size,
+            self.glyph_color,
+            weight,
+        )
+        self.value = np.atleast_1d(np.asarray(value, dtype=float))
+        self._compose(center=np.zeros(3))
+
+    def format_number(self, number: float) -> str:
+        text = f"{number:,.{self.decimals}f}"
+        return (
+            text.replace(",", "\0")
+            .replace(".", self.decimal_separator)
+            .replace("\0", self.group_separator)
+        )
+
+    def text(self) -> str:
+        return self.template.format(*(self.format_number(v) for v in self.value))
+
+    def get_value(self) -> float | tuple[float, ...]:
+        return float(self.value[0]) if len(self.value) == 1 else tuple(self.value.tolist())
+
+    def set_value(self, value: float | tuple[float, ...]) -> Odometer:
+        self.value = np.atleast_1d(np.asarray(value, dtype=float))
+        self._compose(center=self.get_center())
+        return self
+
+    def _slot(self, index: int) -> VMobject:
+        """index 番目の文字の枠（足りなければ足す、作った枠は消さずに使い回す）"""
+        while len(self.submobjects) <= index:
+            slot = VMobject(fill_color=self.glyph_color, fill_opacity=1.0, stroke_width=0)
+            if self.submobjects:
+                slot.match_style(self.submobjects[0])
+            self.add(slot)
+        return self.submobjects[index]
+
+    def _compose(self, center: np.ndarray) -> None:
+        """文字列に合わせて各枠の点列を置き直し、全体の中心を center にする"""
+        text = self.text()
+        visible = [char for char in text if not char.isspace()]
+        advances = np.array([self.glyphs.advance(char) for char in text])
+        starts = np.concatenate([[0.0], np.cumsum(advances)[:-1]])
+        width = advances.sum() - self.glyphs.cell * GAP_RATIO
+        shift = center - np.array([width / 2, 0.0, 0.0])
+
+        index = 0
+        for char, start in zip(text, starts):
+            if char.isspace():
+                continue
+            offset = np.array([start, 0.0, 0.0])
+            if char in DIGITS:
+                # 数字は枠の中央に置く
+                offset[0] += (self.glyphs.cell - self.glyphs.widths[char]) / 2
+            self._slot(index).points = self.glyphs.points[char] + offset + shift
+            index += 1
+        for slot in self.submobjects[len(visible) :]:
+            slot.points = np.zeros((0, 3))
+
+
+class CountTo(Animation):
+    """Odometer の値を target まで数え上げる（範囲は両端を同時に、rate_func に従う）"""
+
+    def __init__(self, odometer: Odometer, target: float | tuple[float, ...], **kwargs) -> None:
+        self.target = np.atleast_1d(np.asarray(target, dtype=float))
+        super().__init__(odometer, **kwargs)
+
+    def begin(self) -> None:
+        self.start = self.mobject.value.copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        # ChangingDecimal と同じく、数える速さに rate_func を掛ける
+        self.mobject.set_value(self.start + (self.target - self.start) * self.rate_func(alpha))
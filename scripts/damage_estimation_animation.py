@@ -9,23 +9,29 @@
 
 from manim import *
 
+from counter import CountTo, Odometer
+from fonts import apply_scene_fonts
+from i18n import _
+from shake import Shake
+from text_fit import FittedText, fit_to_frame, frame_width
+
 
 class DamageEstimation(Scene):
     """被害想定を順番にアニメーション表示するシーン"""
 
     def construct(self):
-        # 日本語フォント設定
-        Text.set_default(font="Hiragino Sans")
+        # フォント設定（言語ごとのフォールバックつき）
+        apply_scene_fonts()
 
         # タイトル表示
-        title = Text("被害想定", font_size=72, color=WHITE)
+        title = FittedText(_("被害想定"), font_size=72, color=WHITE)
         self.play(Write(title), run_time=1.5)
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # 1. マグニチュード
-        mag_label = Text("推定マグニチュード", font_size=36, color=YELLOW)
-        mag_value = Text("M8.5〜9", font_size=72, color=RED)
+        mag_label = FittedText(_("推定マグニチュード"), font_size=36, color=YELLOW)
+        mag_value = FittedText(_("M8.5〜9"), font_size=72, color=RED)
         mag_group = VGroup(mag_label, mag_value).arrange(DOWN, buff=0.3)
         mag_group.move_to(ORIGIN + UP * 0.5)
 
@@ -34,37 +40,29 @@ class DamageEstimation(Scene):
             Write(mag_value),
             run_time=1,
         )
-        # 揺れるアニメーション
-        self.play(
-            mag_value.animate.shift(LEFT * 0.1),
-            run_time=0.1,
-        )
+        # 揺れるアニメーション（3回の本震に合わせて3回揺れる）
         self.play(
-            mag_value.animate.shift(RIGHT * 0.2),
-            run_time=0.1,
+            Shake(mag_value, amplitude=0.1, bursts=(1.0, 0.6, 0.8), direction=RIGHT),
+            run_time=1.0,
         )
-        self.play(
-            mag_value.animate.shift(LEFT * 0.1),
-            run_time=0.1,
-        )
-        self.wait(1)
+        self.wait(0.3)
         self.play(FadeOut(mag_group))
 
         # 2. 死者数
-        death_label = Text("死者数", font_size=36, color=YELLOW)
-        death_value = Text("3万〜4万人", font_size=72, color=RED)
+        death_label = FittedText(_("死者数"), font_size=36, color=YELLOW)
+        death_value = FittedText(_("3万〜4万人"), font_size=72, color=RED)
         death_group = VGroup(death_label, death_value).arrange(DOWN, buff=0.3)
         death_group.move_to(ORIGIN + UP * 0.5)
 
         self.play(FadeIn(death_label, shift=UP))
 
-        # カウントアップアニメーション
-        counter = Integer(0, font_size=72, color=RED)
+        # カウントアップアニメーション（範囲の両端を同時に数える）
+        counter = Odometer((0, 0), template=_("{}〜{}"), font_size=72, color=RED)
         counter.move_to(death_value.get_center())
 
         self.play(FadeIn(counter))
         self.play(
-            counter.animate.set_value(30000),
+            CountTo(counter, (30000, 40000)),
             run_time=2,
             rate_func=smooth,
         )
@@ -78,8 +76,8 @@ class DamageEstimation(Scene):
         self.play(FadeOut(death_group))
 
         # 3. 建物破壊率
-        building_label = Text("リスボン市内の建物", font_size=36, color=YELLOW)
-        building_value = Text("約85%が破壊", font_size=60, color=RED)
+        building_label = FittedText(_("リスボン市内の建物"), font_size=36, color=YELLOW)
+        building_value = FittedText(_("約85%が破壊"), font_size=60, color=RED)
         building_group = VGroup(building_label, building_value).arrange(DOWN, buff=0.3)
         building_group.move_to(ORIGIN + UP * 1)
 
@@ -107,14 +105,16 @@ class DamageEstimation(Scene):
         # 凡例
         legend_destroyed = VGroup(
             Square(side_length=0.3, color=RED, fill_opacity=0.8),
-            Text("破壊 85%", font_size=24),
+            FittedText(_("破壊 85%"), font_size=24),
         ).arrange(RIGHT, buff=0.2)
         legend_remaining = VGroup(
             Square(side_length=0.3, color=GREEN, fill_opacity=0.8),
-            Text("残存 15%", font_size=24),
+            FittedText(_("残存 15%"), font_size=24),
         ).arrange(RIGHT, buff=0.2)
         legend = VGroup(legend_destroyed, legend_remaining).arrange(DOWN, buff=0.2)
         legend.next_to(pie_chart, RIGHT, buff=1)
+        # 円グラフに掛からないよう、円グラフの右の空きに収める
+        fit_to_frame(legend, max_width=frame_width() / 2 - legend.get_left()[0])
 
         self.play(
             Create(pie_destroyed),
@@ -133,9 +133,9 @@ class DamageEstimation(Scene):
 
         # 全項目を一覧表示
         summary = VGroup(
-            Text("• 推定マグニチュード: M8.5〜9", font_size=36),
-            Text("• 死者数: 3万〜4万人", font_size=36),
-            Text("• 建物の約85%が破壊", font_size=36),
+            FittedText(_("• 推定マグニチュード: M8.5〜9"), font_size=36),
+            FittedText(_("• 死者数: 3万〜4万人"), font_size=36),
+            FittedText(_("• 建物の約85%が破壊"), font_size=36),
         ).arrange(DOWN, buff=0.5, aligned_edge=LEFT)
         summary.move_to(ORIGIN)
 
@@ -149,32 +149,33 @@ class DamageEstimationSimple(Scene):
     """シンプル版：テキストのみのアニメーション"""
 
     def construct(self):
-        Text.set_default(font="Hiragino Sans")
+        apply_scene_fonts()
 
         # タイトル
-        title = Text("被害想定", font_size=64, color=WHITE)
+        title = FittedText(_("被害想定"), font_size=64, color=WHITE)
         self.play(Write(title))
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # 箇条書き項目
         items = [
-            ("推定マグニチュード", "M8.5〜9", ORANGE),
-            ("死者数", "3万〜4万人", RED),
-            ("建物破壊率", "約85%", PURPLE),
+            (_("推定マグニチュード"), _("M8.5〜9"), ORANGE),
+            (_("死者数"), _("3万〜4万人"), RED),
+            (_("建物破壊率"), _("約85%"), PURPLE),
         ]
 
         bullet_group = VGroup()
 
         for i, (label, value, color) in enumerate(items):
             # ラベル部分
-            label_text = Text(f"• {label}:", font_size=36, color=GRAY_A)
+            label_text = FittedText(f"• {label}:", font_size=36, color=GRAY_A)
             # 値部分
-            value_text = Text(value, font_size=48, color=color)
+            value_text = FittedText(value, font_size=48, color=color)
             value_text.next_to(label_text, RIGHT, buff=0.3)
 
             item_group = VGroup(label_text, value_text)
             item_group.shift(DOWN * (i * 1.5) + UP * 1)
+            fit_to_frame(item_group)
 
             bullet_group.add(item_group)
 
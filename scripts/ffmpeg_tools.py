@@ -0,0 +1,113 @@
+"""
+ffmpeg の呼び出しをまとめたヘルパー
+
+レンダリング後の動画の結合や情報取得で使う ffmpeg / ffprobe コマンドを組み立てて実行する。
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+FFMPEG = "ffmpeg"
+FFPROBE = "ffprobe"
+
+
+def run_ffmpeg(args: list[str]) -> None:
+    """ffmpeg を実行する（失敗したら CalledProcessError）"""
+    subprocess.run(
+        [FFMPEG, "-y", "-hide_banner", "-loglevel", "error", "-nostdin", *args],
+        check=True,
+    )
+
+
+def concat_copy(inputs: list[Path], output: Path) -> None:
+    """コーデックが揃った動画を再エンコードせずに連結する（concat demuxer）"""
+    output.parent.mkdir(parents=True, exist_ok=True)
+    file_list = output.with_name(f"{output.stem}_file_list.txt")
+    with file_list.open("w", encoding="utf-8") as fp:
+        for path in inputs:
+            fp.write(f"file 'file:{Path(path).resolve().as_posix()}'\n")
+    try:
+        run_ffmpeg(["-f", "concat", "-safe", "0", "-i", str(file_list), "-c", "copy", str(output)])
+    finally:
+        file_list.unlink(missing_ok=True)
+
+
+def probe_frame_count(path: Path) -> int:
+    """動画の最初の映像ストリームのフレーム数（パケット数）を返す"""
+    proc = subprocess.run(
+        [
+            FFPROBE,
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-count_packets",
+            "-show_entries",
+            "stream=nb_read_packets",
+            "-of",
+            "csv=p=0",
+            str(path),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return int(proc.stdout.strip())
+
+
+def probe_duration(path: Path) -> float:
+    """動画全体の長さ（秒、コンテナの duration）を返す"""
+    proc = subprocess.run(
+        [
+            FFPROBE,
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "csv=p=0",
+            str(path),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(proc.stdout.strip())
+
+
+# 連結できるかどうかの比較に使うストリームの属性
+STREAM_FIELDS = (
+    "codec_type",
+    "codec_name",
+    "profile",
+    "width",
+    "height",
+    "pix_fmt",
+    "r_frame_rate",
+    "sample_rate",
+    "channels",
+)
+
+
+def probe_streams(path: Path) -> list[dict]:
+    """各ストリームの STREAM_FIELDS の値を返す"""
+    proc = subprocess.run(
+        [
+            FFPROBE,
+            "-v",
+            "error",
+            "-show_entries",
+            "stream=" + ",".join(STREAM_FIELDS),
+            "-of",
+            "json",
+            str(path),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    streams = json.loads(proc.stdout)["streams"]
+    return [{key: stream.get(key) for key in STREAM_FIELDS} for stream in streams]
@@ -0,0 +1,207 @@
+"""
+シーンと字幕のフォント解決
+
+文字の種類（スクリプト）ごとにフォントの候補を並べ、インストールされている
+最初の候補をつないだフォールバックの連鎖を言語ごとに決める：
+- 連鎖は "Noto Sans CJK JP, Noto Sans, Noto Color Emoji" のような Pango の
+  ファミリー指定になり、足りない文字は Pango が後ろのフォントで補う
+- 言語の文字を先頭に置き、残りのスクリプトを既定の順に続ける
+  （訳の無い原文や絵文字もどのマシンでも同じフォントで描かれる）
+- fontconfig への問い合わせ（fc-list）は結果を media/font_cache.json に保存し、
+  フォントのディレクトリが変わるまで再利用する。プロセス内ではさらにメモリに持つ
+
+Hiragino Sans が無い Linux でも、Pango の暗黙の置き換えに任せずに済む。
+
+使い方:
+  from fonts import apply_scene_fonts
+  apply_scene_fonts()                # construct() の先頭で（Text の既定フォントを設定）
+
+  python fonts.py                    # 言語ごとの連鎖を表示
+  python fonts.py --refresh          # キャッシュを作り直す
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from i18n import current_language
+from scene_catalog import DEFAULT_MEDIA_DIR
+from subtitles import LANGUAGES
+
+CACHE_PATH = DEFAULT_MEDIA_DIR / "font_cache.json"
+
+# スクリプトごとのフォント候補（先頭から順に、インストールされているものを使う）
+SCRIPT_FONTS = {
+    "cjk-ja": ("Hiragino Sans", "Noto Sans CJK JP", "Noto Sans JP", "IPAexGothic"),
+    "cjk-ko": ("Apple SD Gothic Neo", "Noto Sans CJK KR", "Noto Sans KR", "NanumGothic"),
+    "cjk-zh": ("PingFang TC", "Noto Sans CJK TC", "Noto Sans TC"),
+    "latin": ("Hiragino Sans", "Noto Sans", "DejaVu Sans"),
+    "cyrillic": ("Hiragino Sans", "Noto Sans", "DejaVu Sans"),
+    "emoji": ("Apple Color Emoji", "Noto Color Emoji"),
+}
+
+# 言語ごとに先頭に置くスクリプト（残りは SCRIPT_FONTS の順に続ける）
+LANGUAGE_SCRIPTS = {
+    "jp": ("cjk-ja",),
+    "en": ("latin",),
+    "es": ("latin",),
+    "ko": ("cjk-ko",),
+    "ru": ("cyrillic", "latin"),
+    "zh": ("cjk-zh",),
+}
+
+# 追加・削除で fontconfig の内容が変わるディレクトリ（キャッシュの有効性の判定に使う）
+FONT_DIRS = (
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    "/var/cache/fontconfig",
+    "~/.local/share/fonts",
+    "~/.fonts",
+    "~/.cache/fontconfig",
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    "~/Library/Fonts",
+)
+
+
+@lru_cache(maxsize=None)
+def installed_font_families() -> frozenset[str]:
+    """fontconfig に登録されているフォントファミリー（fc-list が無ければ空）"""
+    try:
+        proc = subprocess.run(
+            ["fc-list", ":", "family"], check=True, capture_output=True, text=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+    return frozenset(
+        family.strip() for line in proc.stdout.splitlines() for family in line.split(",")
+    )
+
+
+def script_order(language: str) -> list[str]:
+    """言語の連鎖に並べるスクリプトの順序"""
+    first = LANGUAGE_SCRIPTS[language]
+    return [*first, *(script for script in SCRIPT_FONTS if script not in first)]
+
+
+def resolve_font_chain(language: str, installed: frozenset[str]) -> tuple[str, ...]:
+    """スクリプトごとに最初のインストール済み候補を選び、重複を除いて並べる
+
+    fc-list が使えない（installed が空の）ときは各スクリプトの第1候補を使う。
+    """
+    chain: list[str] = []
+    for script in script_order(language):
+        candidates = SCRIPT_FONTS[script]
+        font = next((font for font in candidates if font in installed), None)
+        if font is None and not installed:
+            font = candidates[0]
+        if font is not None and font not in chain:
+            chain.append(font)
+    return tuple(chain)
+
+
+def font_fingerprint() -> str:
+    """フォント候補とフォントディレクトリの更新時刻のハッシュ"""
+    dirs = []
+    for name in FONT_DIRS:
+        path = Path(name).expanduser()
+        try:
+            dirs.append([str(path), path.stat().st_mtime_ns])
+        except OSError:
+            continue
+    payload = [SCRIPT_FONTS, LANGUAGE_SCRIPTS, sys.platform, dirs]
+    return hashlib.sha256(json.dumps(payload).encode()).hexdigest()
+
+
+def _load_cache(path: Path, fingerprint: str) -> dict[str, list[str]] | None:
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if cache.get("fingerprint") != fingerprint:
+        return None
+    return cache["chains"]
+
+
+def _save_cache(path: Path, fingerprint: str, chains: dict[str, list[str]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        json.dumps({"fingerprint": fingerprint, "chains": chains}, indent=2, ensure_ascii=False)
+        + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp, path)
+
+
+def resolve_all(cache_path: Path = CACHE_PATH, refresh: bool = False) -> dict[str, list[str]]:
+    """全言語の連鎖を返す（ディスクのキャッシュが有効ならそれを使う）"""
+    fingerprint = font_fingerprint()
+    chains = None if refresh else _load_cache(cache_path, fingerprint)
+    if chains is None or set(chains) != set(LANGUAGES):
+        installed = installed_font_families()
+        chains = {lang: list(resolve_font_chain(lang, installed)) for lang in LANGUAGES}
+        _save_cache(cache_path, fingerprint, chains)
+    return chains
+
+
+def font_chain(language: str | None = None) -> tuple[str, ...]:
+    """言語のフォールバックの連鎖（プロセスごとに1回だけ解決する）
+
+    language を省略したときは呼んだ時点の LISBON_LANG を使う（プロセスの途中で
+    言語を切り替えるレンダリングサーバーやレイアウト検査のため、省略を覚えない）。
+    """
+    return tuple(_all_chains()[language or current_language()])
+
+
+@lru_cache(maxsize=None)
+def _all_chains() -> dict[str, list[str]]:
+    return resolve_all()
+
+
+def scene_font(language: str | None = None) -> str:
+    """Text(font=...) に渡す Pango のファミリー指定"""
+    return ", ".join(font_chain(language))
+
+
+def primary_font(language: str) -> str:
+    """連鎖の先頭（1つのファミリーしか指定できない字幕形式で使う）"""
+    return font_chain(language)[0]
+
+
+def apply_scene_fonts(language: str | None = None) -> None:
+    """Text の既定フォントを言語の連鎖にする
+
+    連鎖の各フォントはインストール済みと確認してあるので、Text ごとの
+    フォント一覧との照合（と連鎖全体が一覧に無いという警告）は省く。
+    """
+    from manim import Text
+
+    Text.set_default(font=scene_font(language), warn_missing_font=False)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="言語ごとのフォントの連鎖を表示する")
+    parser.add_argument("--refresh", action="store_true", help="キャッシュを無視して解決し直す")
+    args = parser.parse_args(argv)
+
+    chains = resolve_all(refresh=args.refresh)
+    for language in LANGUAGES:
+        print(f"{language}: {', '.join(chains[language])}")
+    installed = installed_font_families()
+    for script, candidates in SCRIPT_FONTS.items():
+        if installed and not any(font in installed for font in candidates):
+            print(f"  [未インストール] {script}: {', '.join(candidates)}")
+    print(f"キャッシュ: {CACHE_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
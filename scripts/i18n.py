@@ -0,0 +1,147 @@
+"""
+画面上の文字列の多言語化
+
+シーンの文字列は日本語の原文をそのままキー（msgid）にして _("被害想定") と書く。
+訳は scripts/locales/<言語>.json（原文 → 訳文）に置き、言語は環境変数 LISBON_LANG
+（en / es / jp / ko / ru / zh、既定は jp）で選ぶ：
+- カタログはプロセスごとに1回だけ読み込み、訳のある項目だけの辞書にしておく
+- _() は辞書を1回引くだけで、訳が無ければ原文をそのまま返す
+- 言語ごとに media ディレクトリを分けるので、同じシーンを複数の言語で並列に描画できる
+
+使い方:
+  from i18n import _
+  title = Text(_("被害想定"), font_size=72)
+
+  LISBON_LANG=en manim -pql damage_estimation_animation.py DamageEstimation
+  python batch_render.py --lang all          # 全シーン × 全言語
+  python i18n.py check                       # 訳の抜けを確認
+  python i18n.py extract                     # シーンの msgid をカタログに追加
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+from scene_catalog import SCRIPTS_DIR
+from subtitles import LANGUAGES
+
+LOCALES_DIR = SCRIPTS_DIR / "locales"
+LANGUAGE_ENV = "LISBON_LANG"
+
+# 原文の言語（カタログを持たない）
+SOURCE_LANGUAGE = "jp"
+
+
+def current_language() -> str:
+    language = os.environ.get(LANGUAGE_ENV, SOURCE_LANGUAGE)
+    if language not in LANGUAGES:
+        raise ValueError(f"{LANGUAGE_ENV}={language} は対応していない言語です: {LANGUAGES}")
+    return language
+
+
+def catalog_path(language: str) -> Path:
+    return LOCALES_DIR / f"{language}.json"
+
+
+@lru_cache(maxsize=None)
+def compile_catalog(language: str) -> dict[str, str]:
+    """カタログを読み、訳のある項目だけの辞書にする"""
+    if language == SOURCE_LANGUAGE:
+        return {}
+    entries = json.loads(catalog_path(language).read_text(encoding="utf-8"))
+    return {msgid: msgstr for msgid, msgstr in entries.items() if msgstr}
+
+
+def catalog_digest(language: str) -> str:
+    """カタログの内容のハッシュ（レンダリングキャッシュのキーに使う）"""
+    if language == SOURCE_LANGUAGE:
+        return ""
+    return hashlib.sha256(catalog_path(language).read_bytes()).hexdigest()
+
+
+def language_media_dir(media_dir: Path, language: str | None) -> Path:
+    """言語ごとの media ディレクトリ（原文の言語はそのまま）"""
+    if language is None or language == SOURCE_LANGUAGE:
+        return Path(media_dir)
+    return Path(media_dir) / "i18n" / language
+
+
+def translator(language: str) -> Callable[[str], str]:
+    """msgid を訳文に変換する関数を作る"""
+    lookup = compile_catalog(language).get
+
+    def gettext(message: str) -> str:
+        return lookup(message, message)
+
+    return gettext
+
+
+_ = translator(current_language())
+
+
+def scene_messages(directory: Path = SCRIPTS_DIR) -> dict[str, list[str]]:
+    """シーンのスクリプトから _("...") の msgid と出現位置を集める"""
+    messages: dict[str, list[str]] = {}
+    for path in sorted(directory.glob("*_animation.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Name)
+                and node.func.id == "_"
+                and node.args
+                and isinstance(node.args[0], ast.Constant)
+                and isinstance(node.args[0].value, str)
+            ):
+                messages.setdefault(node.args[0].value, []).append(f"{path.name}:{node.lineno}")
+    # ソースでの出現順（ファイル名・行番号順）に並べる
+    return dict(sorted(messages.items(), key=lambda item: _site_order(item[1][0])))
+
+
+def _site_order(site: str) -> tuple[str, int]:
+    name, line = site.rsplit(":", 1)
+    return name, int(line)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="画面上の文字列のカタログを管理する")
+    parser.add_argument("command", choices=["check", "extract"])
+    parser.add_argument("-l", "--language", dest="languages", action="append", choices=LANGUAGES)
+    args = parser.parse_args(argv)
+
+    messages = scene_messages()
+    languages = [lang for lang in args.languages or LANGUAGES if lang != SOURCE_LANGUAGE]
+    missing_total = 0
+    for language in languages:
+        path = catalog_path(language)
+        entries = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        missing = [msgid for msgid in messages if not entries.get(msgid)]
+        unused = [msgid for msgid in entries if msgid not in messages]
+
+        if args.command == "extract":
+            merged = {msgid: entries.get(msgid, "") for msgid in messages}
+            merged.update({msgid: entries[msgid] for msgid in unused})
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(
+                json.dumps(merged, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+            )
+
+        print(f"{language}: {len(messages) - len(missing)}/{len(messages)} 訳あり")
+        for msgid in missing:
+            print(f"  [未訳] {msgid!r}  {messages[msgid][0]}")
+        for msgid in unused:
+            print(f"  [未使用] {msgid!r}")
+        missing_total += len(missing)
+    return 1 if args.command == "check" and missing_total else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+描画しないレイアウト検査（画面外へのはみ出しと文字の重なり）
+
+scene_timeline.py の NullRenderer でシーンを最後まで実行し、self.play / self.wait が
+終わるたびに画面上の mobject の外接矩形を調べる：
+- frame   : 16:9 の画面からはみ出している mobject
+- overlap : 別々の Text の外接矩形が重なっている
+ラスタライズも書き出しもしないので、全シーン × 全言語を数秒〜数十秒で検査できる。
+見えていない（不透明度 0 の）mobject は対象にしない。
+
+同じ問題はシーン・言語ごとに最初に見つかった時刻と呼び出し位置だけを表示する。
+問題があれば終了コード 1 を返すので、batch_render.py --check-layout で描画前の関門にできる。
+
+使い方:
+  python layout_check.py                        # 全シーン × 全言語
+  python layout_check.py WhyVsHow --lang ru
+  python layout_check.py --json layout.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+import i18n
+from i18n import LANGUAGE_ENV
+from scene_catalog import SceneSpec, discover_scenes, select_scenes
+from scene_timeline import run_null
+from subtitles import LANGUAGES
+
+# 外接矩形の比較で無視する幅（manim の単位、線の太さや丸め誤差の分）
+TOLERANCE = 0.02
+
+
+@dataclass
+class LayoutIssue:
+    """1件のレイアウトの問題"""
+
+    scene: str
+    language: str
+    kind: str
+    time: float
+    site: str
+    subjects: list[str]
+    amount: float  # はみ出した距離 / 重なった幅（小さい方の辺）
+
+    def format(self) -> str:
+        subjects = " と ".join(self.subjects)
+        unit = "はみ出し" if self.kind == "frame" else "重なり"
+        return (
+            f"{self.scene} [{self.language}] {self.time:7.2f}秒 {self.site:<40}"
+            f" {self.kind:<7} {subjects}（{unit} {self.amount:.2f}）"
+        )
+
+
+def _describe(mob) -> str:
+    """Text はその文字列、グループは型名と中の最初の文字列で表す"""
+    text = next(
+        (m.original_text for m in mob.get_family() if hasattr(m, "original_text")), None
+    )
+    if text is None:
+        return type(mob).__name__
+    text = text.replace("\n", " ")
+    label = repr(text if len(text) <= 30 else text[:29] + "…")
+    return label if hasattr(mob, "original_text") else f"{type(mob).__name__}({label})"
+
+
+def _visible(mob) -> bool:
+    """ファミリーのどこかに不透明度が 0 でない点があるか"""
+    from manim import VMobject
+
+    for member in mob.family_members_with_points():
+        if not isinstance(member, VMobject):
+            return True
+        if np.any(member.get_fill_opacities() > 0):
+            return True
+        if member.get_stroke_width() > 0 and np.any(member.get_stroke_opacities() > 0):
+            return True
+    return False
+
+
+def _bounds(mob) -> np.ndarray:
+    """外接矩形 [[x0, y0], [x1, y1]]"""
+    points = mob.get_all_points()
+    return np.array([points[:, :2].min(axis=0), points[:, :2].max(axis=0)])
+
+
+def check_frame(scene, frame: np.ndarray) -> list[tuple[list[str], float]]:
+    """画面からはみ出している最上位の mobject と、はみ出した距離"""
+    issues = []
+    for mob in scene.mobjects:
+        if not _visible(mob):
+            continue
+        bounds = _bounds(mob)
+        overflow = max(
+            *(frame[0] - bounds[0]),  # 左・下
+            *(bounds[1] - frame[1]),  # 右・上
+        )
+        if overflow > TOLERANCE:
+            issues.append(([_describe(mob)], float(overflow)))
+    return issues
+
+
+def check_overlap(scene) -> list[tuple[list[str], float]]:
+    """外接矩形が重なっている Text の組と、重なった幅（小さい方の辺）"""
+    from manim import Text
+
+    # 同じ Text が複数のグループに入っていることがあるので id で重複を除く
+    found = {
+        id(mob): mob
+        for top in scene.mobjects
+        for mob in top.get_family()
+        if isinstance(mob, Text) and _visible(mob)
+    }
+    texts = [(mob, _bounds(mob)) for mob in found.values()]
+    issues = []
+    for i, (a, box_a) in enumerate(texts):
+        for b, box_b in texts[i + 1 :]:
+            overlap = np.minimum(box_a[1], box_b[1]) - np.maximum(box_a[0], box_b[0])
+            if overlap.min() > TOLERANCE:
+                issues.append(([_describe(a), _describe(b)], float(overlap.min())))
+    return issues
+
+
+def check_scene(spec: SceneSpec, language: str) -> list[LayoutIssue]:
+    """1つの言語でシーンを実行し、アニメーションの区切りごとに検査する"""
+    from manim import config
+
+    # シーンのモジュールは run_null の中で読み込まれ、その時点の i18n._ を取り込む
+    os.environ[LANGUAGE_ENV] = language
+    i18n._ = i18n.translator(language)
+
+    issues: dict[tuple, LayoutIssue] = {}
+
+    def on_play(scene, entry) -> None:
+        half = np.array([config.frame_width, config.frame_height]) / 2
+        frame = np.array([-half, half])
+        found = [("frame", *issue) for issue in check_frame(scene, frame)]
+        found += [("overlap", *issue) for issue in check_overlap(scene)]
+        for kind, subjects, amount in found:
+            key = (kind, *subjects)
+            if key not in issues:
+                issues[key] = LayoutIssue(
+                    spec.name, language, kind, entry.end, entry.site, subjects, amount
+                )
+            else:
+                issues[key].amount = max(issues[key].amount, amount)
+
+    run_null(spec, "l", on_play=on_play)
+    return sorted(issues.values(), key=lambda issue: issue.time)
+
+
+def _check_worker(args: tuple[SceneSpec, str]) -> list[dict]:
+    spec, language = args
+    return [asdict(issue) for issue in check_scene(spec, language)]
+
+
+def check_all(
+    specs: list[SceneSpec],
+    languages: list[str],
+    jobs: int | None = None,
+) -> list[LayoutIssue]:
+    """シーン × 言語を並列に検査する"""
+    return check_tasks([(spec, lang) for spec in specs for lang in languages], jobs)
+
+
+def check_tasks(
+    tasks: list[tuple[SceneSpec, str]],
+    jobs: int | None = None,
+) -> list[LayoutIssue]:
+    """（シーン, 言語）の組を並列に検査する"""
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        results = pool.map(_check_worker, tasks)
+        return [LayoutIssue(**issue) for issues in results for issue in issues]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="描画せずにレイアウトのはみ出しと重なりを調べる")
+    parser.add_argument("scenes", nargs="*", help="対象のシーン名（省略時は全シーン）")
+    parser.add_argument(
+        "--lang", dest="languages", action="append", choices=LANGUAGES,
+        help="検査する言語（複数指定可、既定: すべて）",
+    )
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="並列数（既定: CPUコア数）")
+    parser.add_argument("--json", type=Path, default=None, help="結果を JSON で保存する")
+    args = parser.parse_args(argv)
+
+    specs = select_scenes(discover_scenes(), args.scenes)
+    languages = args.languages or list(LANGUAGES)
+    issues = check_all(specs, languages, args.jobs)
+    for issue in issues:
+        print(issue.format())
+    print(f"{len(specs)}シーン × {len(languages)}言語: 問題 {len(issues)}件")
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(issue) for issue in issues], indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+    return 1 if issues else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
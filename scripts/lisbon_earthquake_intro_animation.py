@@ -9,23 +9,28 @@
 
 from manim import *
 
+from fonts import apply_scene_fonts
+from i18n import _
+from ripple import Emit, RippleEmitter
+from text_fit import FittedText, fit_to_frame
+
 
 class LisbonEarthquakeIntro(Scene):
     """リスボン大震災の概要を順番にアニメーション表示するシーン"""
 
     def construct(self):
-        # 日本語フォント設定
-        Text.set_default(font="Hiragino Sans")
+        # フォント設定（言語ごとのフォールバックつき）
+        apply_scene_fonts()
 
         # タイトル表示
-        title = Text("リスボン大震災", font_size=72, color=WHITE)
+        title = FittedText(_("リスボン大震災"), font_size=72, color=WHITE)
         self.play(Write(title), run_time=1.5)
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # 1. 概要説明
-        intro_text = Text(
-            "ポルトガルの首都リスボンを襲った大地震",
+        intro_text = FittedText(
+            _("ポルトガルの首都リスボンを襲った大地震"),
             font_size=36,
             color=WHITE,
         )
@@ -40,9 +45,9 @@ class LisbonEarthquakeIntro(Scene):
         self.play(FadeOut(intro_text))
 
         # 2. 発生日時
-        date_label = Text("発生日時", font_size=36, color=YELLOW)
-        date_value = Text("1755年11月1日", font_size=56, color=WHITE)
-        time_value = Text("午前9時40分頃", font_size=48, color=ORANGE)
+        date_label = FittedText(_("発生日時"), font_size=36, color=YELLOW)
+        date_value = FittedText(_("1755年11月1日"), font_size=56, color=WHITE)
+        time_value = FittedText(_("午前9時40分頃"), font_size=48, color=ORANGE)
 
         date_group = VGroup(date_label, date_value, time_value).arrange(DOWN, buff=0.4)
         date_group.move_to(ORIGIN)
@@ -54,6 +59,7 @@ class LisbonEarthquakeIntro(Scene):
         clock = self.create_clock_icon()
         clock.scale(0.6)
         clock.next_to(time_value, LEFT, buff=0.5)
+        fit_to_frame(VGroup(clock, time_value))
 
         self.play(
             Write(time_value),
@@ -66,10 +72,10 @@ class LisbonEarthquakeIntro(Scene):
         self.play(FadeOut(date_group), FadeOut(clock))
 
         # 3. 震源
-        epicenter_label = Text("震源", font_size=36, color=YELLOW)
-        epicenter_location = Text("大西洋", font_size=48, color=BLUE)
-        epicenter_detail = Text(
-            "サン・ヴィンセント岬沖 約220km",
+        epicenter_label = FittedText(_("震源"), font_size=36, color=YELLOW)
+        epicenter_location = FittedText(_("大西洋"), font_size=48, color=BLUE)
+        epicenter_detail = FittedText(
+            _("サン・ヴィンセント岬沖 約220km"),
             font_size=36,
             color=GRAY_A,
         )
@@ -89,15 +95,17 @@ class LisbonEarthquakeIntro(Scene):
 
         self.play(FadeIn(epicenter_dot, scale=0.5))
 
-        # 波紋エフェクト
-        for _ in range(3):
-            wave = Circle(radius=0.1, color=RED, stroke_width=3)
-            wave.move_to(epicenter_dot.get_center())
-            self.play(
-                wave.animate.scale(10).set_opacity(0),
-                run_time=1,
-            )
-            self.remove(wave)
+        # 波紋エフェクト（重なり合いながら広がる）
+        ripples = RippleEmitter.periodic(
+            epicenter_dot.get_center(),
+            count=3,
+            interval=0.75,
+            speed=0.6,
+            lifetime=1.5,
+            color=RED,
+            stroke_width=3,
+        )
+        self.play(Emit(ripples))
 
         self.wait(0.5)
         self.play(
@@ -107,9 +115,9 @@ class LisbonEarthquakeIntro(Scene):
 
         # 最終まとめ
         summary = VGroup(
-            Text("• ポルトガルの首都リスボンを襲った大地震", font_size=32),
-            Text("• 発生日時: 1755年11月1日 午前9時40分頃", font_size=32),
-            Text("• 震源: 大西洋、サン・ヴィンセント岬沖 約220km", font_size=32),
+            FittedText(_("• ポルトガルの首都リスボンを襲った大地震"), font_size=32),
+            FittedText(_("• 発生日時: 1755年11月1日 午前9時40分頃"), font_size=32),
+            FittedText(_("• 震源: 大西洋、サン・ヴィンセント岬沖 約220km"), font_size=32),
         ).arrange(DOWN, buff=0.5, aligned_edge=LEFT)
         summary.move_to(ORIGIN)
 
@@ -136,32 +144,33 @@ class LisbonEarthquakeIntroSimple(Scene):
     """シンプル版：テキストのみのアニメーション"""
 
     def construct(self):
-        Text.set_default(font="Hiragino Sans")
+        apply_scene_fonts()
 
         # タイトル
-        title = Text("リスボン大震災", font_size=64, color=WHITE)
+        title = FittedText(_("リスボン大震災"), font_size=64, color=WHITE)
         self.play(Write(title))
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # 箇条書き項目
         items = [
-            ("概要", "ポルトガルの首都リスボンを襲った大地震", WHITE),
-            ("発生日時", "1755年11月1日 午前9時40分頃", ORANGE),
-            ("震源", "大西洋、サン・ヴィンセント岬沖 約220km", BLUE),
+            (_("概要"), _("ポルトガルの首都リスボンを襲った大地震"), WHITE),
+            (_("発生日時"), _("1755年11月1日 午前9時40分頃"), ORANGE),
+            (_("震源"), _("大西洋、サン・ヴィンセント岬沖 約220km"), BLUE),
         ]
 
         bullet_group = VGroup()
 
         for i, (label, value, color) in enumerate(items):
             # ラベル部分
-            label_text = Text(f"• {label}:", font_size=32, color=YELLOW)
+            label_text = FittedText(f"• {label}:", font_size=32, color=YELLOW)
             # 値部分
-            value_text = Text(value, font_size=32, color=color)
+            value_text = FittedText(value, font_size=32, color=color)
             value_text.next_to(label_text, DOWN, aligned_edge=LEFT, buff=0.15)
 
             item_group = VGroup(label_text, value_text)
             item_group.shift(DOWN * (i * 1.8) + UP * 1 + LEFT * 2)
+            fit_to_frame(item_group)
 
             bullet_group.add(item_group)
 
@@ -11,16 +11,29 @@
 
 from manim import *
 
+from fonts import apply_scene_fonts
+from i18n import _
+from seismic import (
+    MALLET_GRID,
+    MALLET_LAYERS,
+    MALLET_RECEIVER,
+    MALLET_SOURCE,
+    Propagate,
+    Wavefront,
+    travel_time_field,
+)
+from text_fit import FittedText, fit_to_frame
+
 
 class MalletExperiment(Scene):
     """マレットの爆破実験をアニメーション表示するシーン"""
 
     def construct(self):
-        # 日本語フォント設定
-        Text.set_default(font="Hiragino Sans")
+        # フォント設定（言語ごとのフォールバックつき）
+        apply_scene_fonts()
 
         # タイトル
-        title = Text("マレットの爆破実験 (1849年)", font_size=48, color=WHITE)
+        title = FittedText(_("マレットの爆破実験 (1849年)"), font_size=48, color=WHITE)
         self.play(Write(title), run_time=1.5)
         self.wait(0.5)
         self.play(title.animate.scale(0.7).to_edge(UP))
@@ -34,27 +47,38 @@ class MalletExperiment(Scene):
         )
         ground.move_to(DOWN * 1)
 
-        # 地下部分（媒質）
-        underground = Rectangle(
+        # 地下部分（媒質）：上が濡れた砂、下が花崗岩（1単位 = 100m）
+        sand_depth = MALLET_LAYERS[0].bottom / 100
+        sand_layer = Rectangle(
             width=12,
-            height=2,
-            color=DARK_BROWN,
-            fill_opacity=0.3,
+            height=sand_depth,
+            color=GOLD,
+            fill_opacity=0.25,
+            stroke_width=0,
+        )
+        granite_layer = Rectangle(
+            width=12,
+            height=2 - sand_depth,
+            color=GRAY_B,
+            fill_opacity=0.25,
             stroke_width=0,
         )
+        underground = VGroup(sand_layer, granite_layer).arrange(DOWN, buff=0)
         underground.move_to(DOWN * 2)
 
         self.play(Create(ground), FadeIn(underground))
 
         # 爆発地点
         explosion_point = Dot(point=LEFT * 4 + DOWN * 1.5, color=RED, radius=0.15)
-        explosion_label = Text("💣 爆薬", font_size=24, color=RED)
+        explosion_label = FittedText(_("💣 爆薬"), font_size=24, color=RED)
         explosion_label.next_to(explosion_point, DOWN, buff=0.2)
+        fit_to_frame(explosion_label)
 
         # 測定地点
         measure_point = Dot(point=RIGHT * 4 + DOWN * 1, color=BLUE, radius=0.15)
-        measure_label = Text("📡 測定地点", font_size=24, color=BLUE)
+        measure_label = FittedText(_("📡 測定地点"), font_size=24, color=BLUE)
         measure_label.next_to(measure_point, UP, buff=0.2)
+        fit_to_frame(measure_label)
 
         # 距離表示
         distance_line = Line(
@@ -63,7 +87,7 @@ class MalletExperiment(Scene):
             color=YELLOW,
             stroke_width=2,
         )
-        distance_label = Text("約800m", font_size=24, color=YELLOW)
+        distance_label = FittedText(_("約800m"), font_size=24, color=YELLOW)
         distance_label.next_to(distance_line, UP, buff=0.1)
 
         self.play(
@@ -85,21 +109,25 @@ class MalletExperiment(Scene):
         )
         self.remove(explosion)
 
-        # 地震波の伝播
-        for _ in range(2):
-            wave = Circle(radius=0.1, color=ORANGE, stroke_width=3)
-            wave.move_to(explosion_point.get_center())
-            self.play(
-                wave.animate.scale(50).set_opacity(0),
-                run_time=1.5,
-                rate_func=linear,
-            )
-            self.remove(wave)
+        # 地震波の伝播（層の速さから計算した波面、花崗岩を回り込んだ波が先に届く）
+        field = travel_time_field(MALLET_LAYERS, MALLET_GRID, MALLET_SOURCE)
+        wavefront = Wavefront(field, color=ORANGE)
+        wavefront.move_to(underground.get_center())
+        arrival = 3 * field.arrival(*MALLET_RECEIVER) / field.max_time
+
+        self.play(
+            Propagate(wavefront, run_time=3),
+            Succession(
+                Wait(run_time=arrival),
+                Indicate(measure_point, color=ORANGE, run_time=0.5),
+            ),
+        )
 
         # フェードアウト
         self.play(
             FadeOut(ground),
             FadeOut(underground),
+            FadeOut(wavefront),
             FadeOut(explosion_point),
             FadeOut(explosion_label),
             FadeOut(measure_point),
@@ -109,16 +137,17 @@ class MalletExperiment(Scene):
         )
 
         # 測定結果
-        result_title = Text("測定結果", font_size=40, color=YELLOW)
+        result_title = FittedText(_("測定結果"), font_size=40, color=YELLOW)
         result_title.move_to(UP * 2)
         self.play(FadeIn(result_title, shift=UP))
 
         # 媒質ごとの速度比較
         # 濡れた砂
-        sand_label = Text("濡れた砂:", font_size=32, color=GOLD)
-        sand_value = Text("秒速 約251m", font_size=40, color=GOLD)
+        sand_label = FittedText(_("濡れた砂:"), font_size=32, color=GOLD)
+        sand_value = FittedText(_("秒速 約251m"), font_size=40, color=GOLD)
         sand_group = VGroup(sand_label, sand_value).arrange(RIGHT, buff=0.5)
         sand_group.move_to(UP * 0.5)
+        fit_to_frame(sand_group)
 
         # 棒グラフ（砂）
         sand_bar = Rectangle(
@@ -130,10 +159,11 @@ class MalletExperiment(Scene):
         sand_bar.move_to(UP * 0.5 + RIGHT * 1.5)
 
         # 花崗岩
-        granite_label = Text("花崗岩:", font_size=32, color=GRAY_B)
-        granite_value = Text("秒速 約427m", font_size=40, color=GRAY_B)
+        granite_label = FittedText(_("花崗岩:"), font_size=32, color=GRAY_B)
+        granite_value = FittedText(_("秒速 約427m"), font_size=40, color=GRAY_B)
         granite_group = VGroup(granite_label, granite_value).arrange(RIGHT, buff=0.5)
         granite_group.move_to(DOWN * 0.8)
+        fit_to_frame(granite_group)
 
         # 棒グラフ（花崗岩）
         granite_bar = Rectangle(
@@ -157,8 +187,8 @@ class MalletExperiment(Scene):
         )
 
         # 結論
-        conclusion = Text(
-            "媒質によって伝播速度が異なることを実証",
+        conclusion = FittedText(
+            _("媒質によって伝播速度が異なることを実証"),
             font_size=36,
             color=GREEN,
         )
@@ -170,8 +200,8 @@ class MalletExperiment(Scene):
         box = SurroundingRectangle(conclusion, color=GREEN, buff=0.3)
         self.play(Create(box))
 
-        significance = Text(
-            "→ 地震波の性質を理解する重要な発見",
+        significance = FittedText(
+            _("→ 地震波の性質を理解する重要な発見"),
             font_size=28,
             color=GRAY_A,
         )
@@ -185,17 +215,17 @@ class MalletExperimentSimple(Scene):
     """シンプル版"""
 
     def construct(self):
-        Text.set_default(font="Hiragino Sans")
+        apply_scene_fonts()
 
         # タイトル
-        title = Text("マレットの爆破実験 (1849年)", font_size=40, color=WHITE)
+        title = FittedText(_("マレットの爆破実験 (1849年)"), font_size=40, color=WHITE)
         self.play(Write(title))
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # 実験概要
-        overview = Text(
-            "地下で爆薬を爆破し、約800m離れた場所で地震波を測定",
+        overview = FittedText(
+            _("地下で爆薬を爆破し、約800m離れた場所で地震波を測定"),
             font_size=28,
             color=GRAY_A,
         )
@@ -205,8 +235,8 @@ class MalletExperimentSimple(Scene):
 
         # 測定結果
         results = VGroup(
-            Text("• 濡れた砂: 秒速 約251m", font_size=32, color=GOLD),
-            Text("• 花崗岩:   秒速 約427m", font_size=32, color=GRAY_B),
+            FittedText(_("• 濡れた砂: 秒速 約251m"), font_size=32, color=GOLD),
+            FittedText(_("• 花崗岩:   秒速 約427m"), font_size=32, color=GRAY_B),
         ).arrange(DOWN, buff=0.5, aligned_edge=LEFT)
         results.move_to(UP * 0.2)
 
@@ -217,8 +247,8 @@ class MalletExperimentSimple(Scene):
         self.wait(1)
 
         # 結論
-        conclusion = Text(
-            "→ 媒質によって伝播速度が異なることを実証",
+        conclusion = FittedText(
+            _("→ 媒質によって伝播速度が異なることを実証"),
             font_size=32,
             color=GREEN,
         )
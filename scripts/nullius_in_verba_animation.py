@@ -6,20 +6,25 @@ Nullius in verba（権威を鵜呑みにするな）のManimアニメーショ
 
 from manim import *
 
+from fonts import apply_scene_fonts
+from i18n import _
+from text_cache import CachedText
+from text_fit import FittedText
+
 
 class NulliusInVerba(Scene):
     """Nullius in verbaをアニメーション表示するシーン"""
 
     def construct(self):
-        # 日本語フォント設定
-        Text.set_default(font="Hiragino Sans")
+        # フォント設定（言語ごとのフォールバックつき）
+        apply_scene_fonts()
 
         # 背景的な装飾（王立協会を象徴）
         emblem = Circle(radius=2.5, color=GOLD, stroke_width=2, stroke_opacity=0.3)
         self.play(Create(emblem), run_time=1)
 
         # メインのラテン語テキスト
-        latin_text = Text(
+        latin_text = CachedText(
             "Nullius in verba",
             font_size=72,
             color=GOLD,
@@ -40,8 +45,8 @@ class NulliusInVerba(Scene):
         self.play(Create(underline), run_time=0.5)
 
         # 日本語訳を表示
-        japanese_text = Text(
-            "「権威を鵜呑みにするな」",
+        japanese_text = FittedText(
+            _("「権威を鵜呑みにするな」"),
             font_size=48,
             color=WHITE,
         )
@@ -51,8 +56,8 @@ class NulliusInVerba(Scene):
         self.wait(1)
 
         # 補足情報
-        info = Text(
-            "— 英国王立協会モットー (1660年)",
+        info = FittedText(
+            _("— 英国王立協会モットー (1660年)"),
             font_size=28,
             color=GRAY_A,
         )
@@ -87,13 +92,13 @@ class NulliusInVerbaSimple(Scene):
     """シンプル版"""
 
     def construct(self):
-        Text.set_default(font="Hiragino Sans")
+        apply_scene_fonts()
 
         # ラテン語
-        latin = Text("Nullius in verba", font_size=64, color=GOLD)
+        latin = CachedText("Nullius in verba", font_size=64, color=GOLD)
 
         # 日本語訳
-        japanese = Text("「権威を鵜呑みにするな」", font_size=40, color=WHITE)
+        japanese = FittedText(_("「権威を鵜呑みにするな」"), font_size=40, color=WHITE)
         japanese.next_to(latin, DOWN, buff=0.5)
 
         group = VGroup(latin, japanese)
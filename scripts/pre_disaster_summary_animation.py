@@ -9,39 +9,46 @@
 
 from manim import *
 
+from fonts import apply_scene_fonts
+from i18n import _
+from text_cache import CachedText
+from text_fit import FittedText, fit_to_frame
+
 
 class PreDisasterSummary(Scene):
     """リスボン大震災以前のまとめをアニメーション表示するシーン"""
 
     def construct(self):
-        # 日本語フォント設定
-        Text.set_default(font="Hiragino Sans")
+        # フォント設定（言語ごとのフォールバックつき）
+        apply_scene_fonts()
 
         # タイトル
-        title = Text("ここまでのまとめ", font_size=56, color=YELLOW)
+        title = FittedText(_("ここまでのまとめ"), font_size=56, color=YELLOW)
         self.play(Write(title), run_time=1)
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # サブタイトル
-        subtitle = Text("リスボン大震災以前の準備期間", font_size=32, color=GRAY_A)
+        subtitle = FittedText(_("リスボン大震災以前の準備期間"), font_size=32, color=GRAY_A)
         subtitle.next_to(title, DOWN, buff=0.3)
         self.play(FadeIn(subtitle, shift=UP))
 
         # まとめ項目1: 観察記録の蓄積
-        item1_icon = Text("📖", font_size=48)
-        item1_text = Text("観察記録の蓄積", font_size=36, color=WHITE)
+        item1_icon = CachedText("📖", font_size=48)
+        item1_text = FittedText(_("観察記録の蓄積"), font_size=36, color=WHITE)
         item1 = VGroup(item1_icon, item1_text).arrange(RIGHT, buff=0.3)
         item1.move_to(UP * 0.5)
+        fit_to_frame(item1)
 
         self.play(FadeIn(item1, shift=RIGHT), run_time=0.8)
         self.wait(0.5)
 
         # まとめ項目2: 経験則
-        item2_icon = Text("🌊", font_size=48)
-        item2_text = Text("「地震は移動する現象」という経験則", font_size=32, color=WHITE)
+        item2_icon = CachedText("🌊", font_size=48)
+        item2_text = FittedText(_("「地震は移動する現象」という経験則"), font_size=32, color=WHITE)
         item2 = VGroup(item2_icon, item2_text).arrange(RIGHT, buff=0.3)
         item2.move_to(DOWN * 0.5)
+        fit_to_frame(item2)
 
         self.play(FadeIn(item2, shift=RIGHT), run_time=0.8)
         self.wait(1)
@@ -56,8 +63,8 @@ class PreDisasterSummary(Scene):
         self.play(GrowArrow(arrow), run_time=0.5)
 
         # 結論
-        conclusion = Text(
-            "災害後の科学的調査を可能にする土台",
+        conclusion = FittedText(
+            _("災害後の科学的調査を可能にする土台"),
             font_size=36,
             color=GREEN,
         )
@@ -81,13 +88,13 @@ class PreDisasterSummary(Scene):
         )
 
         # 次章への導入
-        next_title = Text("では次に...", font_size=48, color=WHITE)
+        next_title = FittedText(_("では次に..."), font_size=48, color=WHITE)
         next_title.move_to(UP * 0.5)
         self.play(FadeIn(next_title))
         self.wait(0.5)
 
-        question = Text(
-            "実際に大震災が起きたとき、\n人々はどう反応したのか？",
+        question = FittedText(
+            _("実際に大震災が起きたとき、\n人々はどう反応したのか？"),
             font_size=40,
             color=ORANGE,
         )
@@ -107,18 +114,18 @@ class PreDisasterSummarySimple(Scene):
     """シンプル版"""
 
     def construct(self):
-        Text.set_default(font="Hiragino Sans")
+        apply_scene_fonts()
 
         # まとめタイトル
-        title = Text("ここまでのまとめ", font_size=48, color=YELLOW)
+        title = FittedText(_("ここまでのまとめ"), font_size=48, color=YELLOW)
         self.play(Write(title))
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # まとめ項目
         items = VGroup(
-            Text("📖 観察記録の蓄積", font_size=36),
-            Text("🌊 「地震は移動する現象」という経験則", font_size=32),
+            FittedText(_("📖 観察記録の蓄積"), font_size=36),
+            FittedText(_("🌊 「地震は移動する現象」という経験則"), font_size=32),
         ).arrange(DOWN, buff=0.5, aligned_edge=LEFT)
         items.move_to(UP * 0.3)
 
@@ -127,8 +134,8 @@ class PreDisasterSummarySimple(Scene):
             self.wait(0.3)
 
         # 結論
-        conclusion = Text(
-            "→ 災害後の科学的調査を可能にする土台",
+        conclusion = FittedText(
+            _("→ 災害後の科学的調査を可能にする土台"),
             font_size=32,
             color=GREEN,
         )
@@ -140,8 +147,8 @@ class PreDisasterSummarySimple(Scene):
         self.play(FadeOut(items), FadeOut(conclusion))
 
         # 次章導入
-        next_text = Text(
-            "では次に、実際に大震災が起きたとき\n人々はどう反応したのか見ていきましょう",
+        next_text = FittedText(
+            _("では次に、実際に大震災が起きたとき\n人々はどう反応したのか見ていきましょう"),
             font_size=32,
             color=WHITE,
         )
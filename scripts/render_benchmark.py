@@ -0,0 +1,204 @@
+"""
+シーンごとのレンダリングベンチマーク
+
+各シーンを固定の画質で1つずつ描画し、次の値を JSON に記録する：
+- 経過時間（--repeat 回のうち最短）
+- 描画したフレーム数と毎秒フレーム数
+- manim プロセスの最大常駐メモリ（peak RSS）
+- 出力ファイルのサイズ
+
+manim のアニメーション単位のキャッシュは無効にして毎回すべてを描画する。
+計測値が乱れないよう、シーンは並列にせず順番に描画する。
+記録した JSON 同士を compare で比べ、閾値を超えた悪化があれば終了コード 1 を返す。
+
+使い方:
+  python render_benchmark.py run -q l                      # media/benchmarks/<コミット>.json
+  python render_benchmark.py run DamageEstimation --repeat 3
+  python render_benchmark.py compare base.json new.json --threshold 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from batch_render import manim_command
+from ffmpeg_tools import probe_frame_count
+from render_cache import manim_version
+from scene_catalog import (
+    DEFAULT_MEDIA_DIR,
+    QUALITY_DIRS,
+    SCRIPTS_DIR,
+    SceneSpec,
+    discover_scenes,
+    select_scenes,
+)
+
+BENCHMARK_DIR = DEFAULT_MEDIA_DIR / "benchmarks"
+
+# compare で悪化とみなす指標（値が大きいほど悪い）
+REGRESSION_METRICS = ("seconds", "peak_rss_mb")
+
+
+def _git_revision() -> str:
+    try:
+        rev = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=SCRIPTS_DIR,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=SCRIPTS_DIR,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{rev}-dirty" if dirty else rev
+
+
+def _peak_rss_mb(rusage) -> float:
+    """ru_maxrss を MiB に換算する（Linux は KiB、macOS はバイト単位）"""
+    if sys.platform == "darwin":
+        return rusage.ru_maxrss / (1024 * 1024)
+    return rusage.ru_maxrss / 1024
+
+
+def measure_scene(spec: SceneSpec, quality: str, media_dir: Path, log_path: Path) -> dict:
+    """1シーンを1回描画して計測する"""
+    command = manim_command(spec, quality, media_dir, ("--disable_caching",))
+    start = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        proc = subprocess.Popen(command, cwd=spec.path.parent, stdout=log, stderr=subprocess.STDOUT)
+        # wait4 でこのプロセス単体のリソース使用量を受け取る
+        _, status, rusage = os.wait4(proc.pid, 0)
+    seconds = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{spec.name} の描画に失敗しました: {log_path}")
+
+    output = spec.output_path(media_dir, quality)
+    frames = probe_frame_count(output)
+    return {
+        "seconds": seconds,
+        "frames": frames,
+        "fps": frames / seconds,
+        "peak_rss_mb": _peak_rss_mb(rusage),
+        "output_bytes": output.stat().st_size,
+    }
+
+
+def run_benchmark(
+    specs: list[SceneSpec],
+    quality: str = "l",
+    repeat: int = 1,
+    media_dir: Path = BENCHMARK_DIR / "media",
+) -> dict:
+    """全シーンを計測し、JSON に保存する形の辞書を返す"""
+    media_dir = Path(media_dir).resolve()
+    log_dir = media_dir / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    scenes = {}
+    for spec in specs:
+        runs = [
+            measure_scene(spec, quality, media_dir, log_dir / f"{spec.name}.log")
+            for _ in range(repeat)
+        ]
+        best = min(runs, key=lambda run: run["seconds"])
+        best["peak_rss_mb"] = max(run["peak_rss_mb"] for run in runs)
+        scenes[spec.name] = best
+        print(
+            f"{spec.name:<32} {best['seconds']:>7.2f}秒 {best['frames']:>5}フレーム"
+            f" {best['fps']:>7.1f}fps {best['peak_rss_mb']:>7.1f}MiB"
+        )
+
+    return {
+        "revision": _git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "quality": QUALITY_DIRS[quality],
+        "repeat": repeat,
+        "machine": {
+            "node": platform.node(),
+            "cpus": os.cpu_count(),
+            "python": platform.python_version(),
+            "manim": manim_version(),
+        },
+        "scenes": scenes,
+    }
+
+
+def compare(base: dict, new: dict, threshold: float) -> list[str]:
+    """2つの計測結果を比べて表を表示し、悪化したシーンの一覧を返す"""
+    print(f"基準 {base['revision']} ({base['quality']}) → 比較 {new['revision']} ({new['quality']})")
+    print(f"{'シーン':<29} {'時間(秒)':>18} {'変化':>7} {'peak RSS(MiB)':>18} {'変化':>7}")
+
+    regressions = []
+    for name, after in new["scenes"].items():
+        before = base["scenes"].get(name)
+        if before is None:
+            print(f"{name:<32} （基準に記録なし）")
+            continue
+        ratios = {key: after[key] / before[key] - 1 for key in REGRESSION_METRICS}
+        worse = [key for key, ratio in ratios.items() if ratio > threshold]
+        mark = " ← 悪化" if worse else ""
+        print(
+            f"{name:<32} {before['seconds']:>8.2f} → {after['seconds']:>6.2f}"
+            f" {ratios['seconds']:>+7.1%}"
+            f" {before['peak_rss_mb']:>8.1f} → {after['peak_rss_mb']:>6.1f}"
+            f" {ratios['peak_rss_mb']:>+7.1%}{mark}"
+        )
+        if worse:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="シーンごとのレンダリングベンチマーク")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="計測して JSON に保存する")
+    run_parser.add_argument("scenes", nargs="*", help="計測するシーン名（省略時は全シーン）")
+    run_parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default="l")
+    run_parser.add_argument("--repeat", type=int, default=1, help="シーンごとの計測回数")
+    run_parser.add_argument("-o", "--output", type=Path, default=None)
+
+    compare_parser = commands.add_parser("compare", help="2つの計測結果を比較する")
+    compare_parser.add_argument("base", type=Path)
+    compare_parser.add_argument("new", type=Path)
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="悪化とみなす増加率（既定: 0.1 = 10%%）"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        base = json.loads(args.base.read_text(encoding="utf-8"))
+        new = json.loads(args.new.read_text(encoding="utf-8"))
+        regressions = compare(base, new, args.threshold)
+        if regressions:
+            print(f"{len(regressions)}シーンが {args.threshold:.0%} 以上悪化: {', '.join(regressions)}")
+            return 1
+        return 0
+
+    specs = select_scenes(discover_scenes(), args.scenes)
+    result = run_benchmark(specs, args.quality, args.repeat)
+    output = args.output or BENCHMARK_DIR / f"{result['revision']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"保存しました: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
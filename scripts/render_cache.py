@@ -0,0 +1,238 @@
+"""
+内容ハッシュによるインクリメンタルレンダリングキャッシュ
+
+シーンのソースとレンダリング条件からキーを計算し、
+出力済みの動画が有効であればレンダリングを省略する：
+- construct() と、そこから self.xxx で呼ばれるメソッド（推移的に）
+- クラス属性、モジュールの import・定数・関数
+- scripts/ 内のローカルモジュールを import していればその全ソース
+- シーンクラスが data_files() で宣言したデータファイル（字幕など）の内容
+- 画質フラグ（解像度・フレームレート）、manim のバージョン、追加パラメータ
+- 言語ごとの描画では、言語・訳のカタログ・解決したフォントの連鎖（scene_cache_key）
+
+ソースは AST を正規化してからハッシュするので、コメントや空行だけの変更では
+キャッシュは無効にならない。
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+
+from fonts import scene_font
+from i18n import catalog_digest
+from scene_catalog import QUALITY_DIRS, SCRIPTS_DIR, SceneSpec, load_scene_class
+
+MANIFEST_NAME = "render_cache.json"
+
+
+@lru_cache(maxsize=None)
+def _parse(path: Path) -> ast.Module:
+    return ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+    """if __name__ == "__main__": ブロックかどうか"""
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Compare)
+        and isinstance(node.test.left, ast.Name)
+        and node.test.left.id == "__name__"
+    )
+
+
+def _local_imports(tree: ast.Module, directory: Path) -> list[Path]:
+    """scripts/ 内のモジュールを指す import を列挙する"""
+    paths = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names = [node.module]
+        elif isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        else:
+            continue
+        for name in names:
+            path = directory / f"{name.split('.')[0]}.py"
+            if path.exists():
+                paths.append(path)
+    return sorted(set(paths))
+
+
+@lru_cache(maxsize=None)
+def module_digest(path: Path) -> str:
+    """ローカルモジュール（とその依存）全体の正規化ソースのハッシュ"""
+    tree = _parse(path)
+    digest = hashlib.sha256(ast.unparse(tree).encode("utf-8"))
+    for dependency in _local_imports(tree, path.parent):
+        if dependency != path:
+            digest.update(module_digest(dependency).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _called_methods(node: ast.AST) -> set[str]:
+    """関数本体から self.xxx として参照されている名前を集める"""
+    return {
+        child.attr
+        for child in ast.walk(node)
+        if isinstance(child, ast.Attribute)
+        and isinstance(child.value, ast.Name)
+        and child.value.id == "self"
+    }
+
+
+def scene_source(spec: SceneSpec) -> str:
+    """シーンの描画結果に影響するソースを正規化して連結する"""
+    tree = _parse(spec.path)
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+    scene_class = classes[spec.name]
+
+    # 同じモジュール内の基底クラスのメソッドも対象にする（派生側を優先）
+    lineage = [scene_class]
+    for base in scene_class.bases:
+        if isinstance(base, ast.Name) and base.id in classes:
+            lineage.append(classes[base.id])
+
+    methods: dict[str, ast.FunctionDef] = {}
+    class_body: list[ast.stmt] = []
+    for cls in reversed(lineage):
+        for node in cls.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                methods[node.name] = node
+            elif not isinstance(node, ast.Expr):  # docstring は除外
+                class_body.append(node)
+
+    # construct() から推移的に呼ばれるメソッドだけを集める
+    used: list[str] = []
+    pending = ["construct", "setup"]
+    while pending:
+        name = pending.pop()
+        if name in used or name not in methods:
+            continue
+        used.append(name)
+        pending.extend(sorted(_called_methods(methods[name])))
+
+    module_body = [
+        node
+        for node in tree.body
+        if not isinstance(node, (ast.ClassDef, ast.Expr)) and not _is_main_guard(node)
+    ]
+
+    parts = [ast.unparse(node) for node in module_body]
+    parts += [ast.unparse(node) for node in class_body]
+    parts += [ast.unparse(methods[name]) for name in sorted(used)]
+    return "\n".join(parts)
+
+
+@lru_cache(maxsize=None)
+def data_digests(spec: SceneSpec) -> dict[str, str]:
+    """シーンクラスの data_files() が返すファイルの内容のハッシュ
+
+    宣言はクラスにあるので、ここだけはシーンのモジュールを import する。
+    """
+    data_files = getattr(load_scene_class(spec), "data_files", None)
+    if data_files is None:
+        return {}
+    return {
+        Path(path).name: hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        for path in data_files()
+    }
+
+
+def manim_version() -> str:
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def cache_key(spec: SceneSpec, quality: str, params: dict | None = None) -> str:
+    """シーンとレンダリング条件からキャッシュキーを計算する"""
+    tree = _parse(spec.path)
+    payload = {
+        "scene": f"{spec.module}.{spec.name}",
+        "source": scene_source(spec),
+        "dependencies": {
+            path.name: module_digest(path)
+            for path in _local_imports(tree, spec.path.parent)
+        },
+        "data": data_digests(spec),
+        "quality": QUALITY_DIRS[quality],
+        "manim": manim_version(),
+        "params": params or {},
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def scene_cache_key(spec: SceneSpec, quality: str, language: str) -> str:
+    """language の訳で描いたシーンのキャッシュキー（batch_render と segment_render で共通）"""
+    return cache_key(
+        spec,
+        quality,
+        # フォントの連鎖はマシンごとに違いうるので、解決結果もキーに入れる
+        {"language": language, "catalog": catalog_digest(language), "fonts": scene_font(language)},
+    )
+
+
+@dataclass
+class RenderCache:
+    """media/render_cache.json に保存するレンダリング結果の台帳"""
+
+    media_dir: Path
+
+    def __post_init__(self) -> None:
+        self.media_dir = Path(self.media_dir)
+        self.path = self.media_dir / MANIFEST_NAME
+        try:
+            self.entries: dict[str, dict] = json.loads(self.path.read_text("utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+
+    @staticmethod
+    def _slot(spec: SceneSpec, quality: str) -> str:
+        return f"{spec.module}.{spec.name}@{quality}"
+
+    def is_fresh(self, spec: SceneSpec, quality: str, key: str) -> bool:
+        """キーが一致し、出力ファイルが記録時のまま残っていれば True"""
+        entry = self.entries.get(self._slot(spec, quality))
+        if entry is None or entry["key"] != key:
+            return False
+        output = spec.output_path(self.media_dir, quality)
+        try:
+            stat = output.stat()
+        except FileNotFoundError:
+            return False
+        return stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]
+
+    def record(self, spec: SceneSpec, quality: str, key: str) -> None:
+        output = spec.output_path(self.media_dir, quality)
+        stat = output.stat()
+        self.entries[self._slot(spec, quality)] = {
+            "key": key,
+            "output": str(output.relative_to(self.media_dir)),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def save(self) -> None:
+        """一時ファイルに書いてから置き換える（中断しても台帳が壊れない）"""
+        self.media_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps(self.entries, indent=2, sort_keys=True, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+
+
+if __name__ == "__main__":
+    from scene_catalog import discover_scenes
+
+    for spec in discover_scenes(SCRIPTS_DIR):
+        print(f"{cache_key(spec, 'l')[:12]}  {spec.name}")
@@ -0,0 +1,177 @@
+"""
+常駐レンダリングサーバー
+
+manim の import、フォント一覧の取得、シーンのフォントの読み込みを一度だけ済ませた
+プロセスを常駐させ、ローカルの Unix ソケット経由でレンダリング要求を受け付ける：
+- 要求ごとに常駐プロセスを fork し、子プロセスでシーンを読み込んで描画する
+  （読み込み済みの manim とフォントキャッシュをそのまま引き継ぐ）
+- シーンのソースは要求のたびに読み直すので、編集後すぐに再レンダリングできる
+- 子プロセスで描画するため、シーン側の状態変更がサーバーに残らない
+- 画面の文字列の言語は要求ごとに選べる（子プロセスで LISBON_LANG を設定してから読み込む）
+
+使い方:
+  python render_server.py serve &
+  python render_server.py render nullius_in_verba_animation.py NulliusInVerbaSimple -q l -p
+  python render_server.py render why_vs_how_animation.py WhyVsHow --lang en
+  python render_server.py stop
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import i18n
+from fonts import scene_font
+from i18n import LANGUAGE_ENV, language_media_dir
+from scene_catalog import DEFAULT_MEDIA_DIR, QUALITY_NAMES, SceneSpec, render_in_process
+from subtitles import LANGUAGES
+
+SOCKET_PATH = DEFAULT_MEDIA_DIR / "render_server.sock"
+
+# 起動時に一度描画してフォントを読み込んでおく文字列（連鎖の各フォントを通る）
+WARMUP_TEXT = "リスボン大震災 Nullius in verba 1755 Лиссабон 리스본 里斯本 🌊"
+
+
+def warm_up(media_dir: Path) -> None:
+    """manim とフォントを読み込み、Pango/fontconfig のキャッシュを温める"""
+    import manimpango
+    from manim import Text, tempconfig
+
+    manimpango.list_fonts()
+    with tempconfig({"media_dir": str(media_dir)}):
+        Text(WARMUP_TEXT, font=scene_font(), warn_missing_font=False)
+
+
+def _render_child(request: dict, media_dir: Path, conn) -> None:
+    """fork した子プロセスでの処理：描画して結果をパイプで返す"""
+    try:
+        language = request.get("language")
+        if language is not None:
+            # シーンのモジュールは読み込み時に i18n._ を取り込むので、その前に差し替える
+            os.environ[LANGUAGE_ENV] = language
+            i18n._ = i18n.translator(language)
+        spec = SceneSpec(Path(request["file"]).resolve(), request["scene"], 0)
+        output = render_in_process(
+            spec,
+            request.get("quality", "l"),
+            language_media_dir(media_dir, language),
+            preview=bool(request.get("preview")),
+        )
+        conn.send({"ok": True, "output": str(output)})
+    except BaseException:
+        conn.send({"ok": False, "error": traceback.format_exc()})
+    finally:
+        conn.close()
+
+
+def handle_render(request: dict, media_dir: Path) -> dict:
+    """1件のレンダリング要求を fork した子プロセスで処理する"""
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    start = time.perf_counter()
+    process = context.Process(target=_render_child, args=(request, media_dir, sender))
+    process.start()
+    sender.close()
+    try:
+        response = receiver.recv()
+    except EOFError:
+        response = {"ok": False, "error": "レンダリングプロセスが異常終了しました"}
+    process.join()
+    response["seconds"] = time.perf_counter() - start
+    return response
+
+
+def serve(socket_path: Path = SOCKET_PATH, media_dir: Path = DEFAULT_MEDIA_DIR) -> None:
+    """要求を1件ずつ受け付けるサーバーを起動する（stop 要求で終了）"""
+    start = time.perf_counter()
+    warm_up(media_dir)
+    print(f"ウォームアップ完了 ({time.perf_counter() - start:.1f}秒)")
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(socket_path))
+        server.listen()
+        print(f"待ち受け中: {socket_path}")
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn, conn.makefile("rwb") as stream:
+                    request = json.loads(stream.readline())
+                    command = request.get("command", "render")
+                    if command == "render":
+                        response = handle_render(request, media_dir)
+                    else:
+                        response = {"ok": True}
+                    stream.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+                    stream.flush()
+                if command == "stop":
+                    break
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def send_request(request: dict, socket_path: Path = SOCKET_PATH) -> dict:
+    """サーバーに要求を送り、応答を待つ"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        with client.makefile("rwb") as stream:
+            stream.write(json.dumps(request, ensure_ascii=False).encode() + b"\n")
+            stream.flush()
+            return json.loads(stream.readline())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="常駐レンダリングサーバー")
+    parser.add_argument("--socket", type=Path, default=SOCKET_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="サーバーを起動する")
+    serve_parser.add_argument("--media-dir", type=Path, default=DEFAULT_MEDIA_DIR)
+
+    render_parser = commands.add_parser("render", help="シーンのレンダリングを依頼する")
+    render_parser.add_argument("file", help="シーンを定義したスクリプト")
+    render_parser.add_argument("scene", help="シーンのクラス名")
+    render_parser.add_argument("-q", "--quality", choices=sorted(QUALITY_NAMES), default="l")
+    render_parser.add_argument("-p", "--preview", action="store_true", help="描画後に再生する")
+    render_parser.add_argument("--lang", choices=LANGUAGES, default=None, help="画面の文字列の言語")
+
+    commands.add_parser("stop", help="サーバーを停止する")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket, args.media_dir.resolve())
+        return 0
+
+    if args.command == "stop":
+        send_request({"command": "stop"}, args.socket)
+        return 0
+
+    response = send_request(
+        {
+            "command": "render",
+            "file": str(Path(args.file).resolve()),
+            "scene": args.scene,
+            "quality": args.quality,
+            "preview": args.preview,
+            "language": args.lang,
+        },
+        args.socket,
+    )
+    if not response["ok"]:
+        print(response["error"], file=sys.stderr)
+        return 1
+    print(f"{response['output']} ({response['seconds']:.1f}秒)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
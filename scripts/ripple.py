@@ -0,0 +1,111 @@
+"""
+重なり合う波紋をまとめて描く
+
+Circle を作って scale しながら消す play をループで繰り返すと、波紋は1つずつしか出ず、
+1本ごとに部分動画ができる。RippleEmitter は波紋ごとの
+（発生時刻, 広がる速さ, 消えるまでの時間）の配列を先に持っておき、
+時刻を与えると全部の波紋の点列を1回の NumPy の計算で作る：
+- 波紋はいくつでも同時に広がり、重なってよい
+- 円の形（単位円の点列）は1回だけ作り、各波紋はそれを半径倍して中心に置くだけ
+- まだ出ていない・消えた波紋は点を持たせないので、描画の対象にもならない
+
+Emit で1回の play として再生し、終わると場面から取り除かれる。
+
+使い方:
+  ripples = RippleEmitter.periodic(epicenter.get_center(), count=3, interval=0.75,
+                                   speed=0.6, lifetime=1.5, color=RED)
+  self.play(Emit(ripples))                      # ripples.duration 秒
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from manim import ORIGIN, WHITE, Animation, Circle, VMobject, linear
+
+
+class RippleEmitter(VMobject):
+    """配列で与えた波紋を、時刻ごとにまとめて描く mobject
+
+    各波紋の半径は start_radius + speed * 経過時間、不透明度は
+    1 - 経過時間 / lifetime（0 になったら消える）。
+    births・speeds・lifetimes はスカラーでも配列でもよい（同じ長さにそろえる）。
+    """
+
+    def __init__(
+        self,
+        center: np.ndarray = ORIGIN,
+        births: np.ndarray | float = 0.0,
+        speeds: np.ndarray | float = 1.0,
+        lifetimes: np.ndarray | float = 1.0,
+        start_radius: float = 0.1,
+        color=WHITE,
+        stroke_width: float = 3,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.births, self.speeds, self.lifetimes = (
+            np.array(array, dtype=float)
+            for array in np.broadcast_arrays(*map(np.atleast_1d, (births, speeds, lifetimes)))
+        )
+        self.origin = np.array(center, dtype=float)
+        self.start_radius = start_radius
+        self.unit_circle = Circle(radius=1).points
+        self.add(
+            *(
+                VMobject(stroke_color=color, stroke_width=stroke_width, fill_opacity=0)
+                for _birth in self.births
+            )
+        )
+        self.set_time(0.0)
+
+    @classmethod
+    def periodic(
+        cls,
+        center: np.ndarray,
+        count: int,
+        interval: float,
+        speed: float,
+        lifetime: float,
+        **kwargs,
+    ) -> RippleEmitter:
+        """同じ速さ・寿命の波紋を interval 秒ごとに count 個出す"""
+        return cls(center, np.arange(count) * interval, speed, lifetime, **kwargs)
+
+    @property
+    def duration(self) -> float:
+        """最後の波紋が消えるまでの時間"""
+        return float((self.births + self.lifetimes).max())
+
+    def set_time(self, t: float) -> RippleEmitter:
+        age = t - self.births
+        alive = (age >= 0) & (age < self.lifetimes)
+        radii = self.start_radius + self.speeds * np.maximum(age, 0)
+        opacities = np.clip(1 - age / self.lifetimes, 0, 1)
+        # 全波紋の点列を一度に作る（波紋の数, 単位円の点の数, 3）
+        points = self.origin + radii[:, None, None] * self.unit_circle[None]
+        for ring, ring_points, visible, opacity in zip(
+            self.submobjects, points, alive, opacities
+        ):
+            if visible:
+                ring.points = ring_points
+                ring.stroke_rgbas[:, 3] = opacity
+            else:
+                ring.points = np.zeros((0, 3))
+        return self
+
+
+class Emit(Animation):
+    """RippleEmitter の波紋を最初から最後まで再生する（終わると場面から取り除く）
+
+    run_time を変えると波紋全体が同じ比率で速く・遅くなる。
+    rate_func（既定は linear）は波紋の時間の進み方に掛かる。
+    """
+
+    def __init__(self, emitter: RippleEmitter, **kwargs) -> None:
+        kwargs.setdefault("run_time", emitter.duration)
+        kwargs.setdefault("rate_func", linear)
+        kwargs.setdefault("remover", True)
+        super().__init__(emitter, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        self.mobject.set_time(self.rate_func(alpha) * self.mobject.duration)
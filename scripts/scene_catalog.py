@@ -0,0 +1,183 @@
+"""
+シーンカタログ
+
+scripts/ 以下のアニメーションスクリプトから Scene サブクラスを検出する：
+- manim を import せず AST だけを解析するので、検出は一瞬で終わる
+- 他のモジュールで定義した Scene 派生クラスを継承していても辿れる
+- 出力先（media/videos/<モジュール名>/<画質>/<クラス名>.mp4）を求める
+- 同一プロセス内でレンダリングするツール向けに、シーンクラスを読み込む
+- self.play / self.wait を呼んだシーンのファイル内の行を探す
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib.util
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+DEFAULT_MEDIA_DIR = SCRIPTS_DIR / "media"
+
+# manim が提供する Scene 系の基底クラス
+MANIM_SCENE_BASES = {
+    "Scene",
+    "MovingCameraScene",
+    "ThreeDScene",
+    "ZoomedScene",
+}
+
+# manim の -q フラグと出力ディレクトリ名の対応
+QUALITY_DIRS = {
+    "l": "480p15",
+    "m": "720p30",
+    "h": "1080p60",
+    "p": "1440p60",
+    "k": "2160p60",
+}
+
+# manim の -q フラグと config.quality の値の対応
+QUALITY_NAMES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+@dataclass(frozen=True)
+class SceneSpec:
+    """検出したシーン（スクリプトのパスとクラス名）"""
+
+    path: Path
+    name: str
+    lineno: int
+
+    @property
+    def module(self) -> str:
+        return self.path.stem
+
+    def output_path(self, media_dir: Path, quality: str) -> Path:
+        """manim が書き出す動画ファイルのパス"""
+        return (
+            Path(media_dir)
+            / "videos"
+            / self.module
+            / QUALITY_DIRS[quality]
+            / f"{self.name}.mp4"
+        )
+
+
+def _base_names(node: ast.ClassDef) -> list[str]:
+    """クラス定義の基底クラス名（属性参照は末尾の名前）を返す"""
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
+def discover_scenes(
+    directory: Path = SCRIPTS_DIR,
+    pattern: str = "*_animation.py",
+) -> list[SceneSpec]:
+    """pattern に一致するスクリプト内の Scene サブクラスを列挙する
+
+    継承関係は directory 内の全モジュールをまたいで解決するので、
+    共通の基底シーンを別モジュールに置いても検出できる。
+    結果はファイル名順・定義順に並ぶ。
+    """
+    directory = Path(directory)
+    bases: dict[str, list[str]] = {}
+    candidates: list[SceneSpec] = []
+    targets = set(directory.glob(pattern))
+
+    for path in sorted(directory.glob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            bases.setdefault(node.name, []).extend(_base_names(node))
+            if path in targets:
+                candidates.append(SceneSpec(path, node.name, node.lineno))
+
+    # 継承関係を不動点まで辿って Scene 派生クラスを確定する
+    scene_classes = set(MANIM_SCENE_BASES)
+    changed = True
+    while changed:
+        changed = False
+        for name, parents in bases.items():
+            if name not in scene_classes and scene_classes.intersection(parents):
+                scene_classes.add(name)
+                changed = True
+
+    return [spec for spec in candidates if spec.name in scene_classes]
+
+
+def select_scenes(specs: list[SceneSpec], names: list[str]) -> list[SceneSpec]:
+    """クラス名で絞り込む（names が空なら全シーン）"""
+    if not names:
+        return specs
+    known = {spec.name for spec in specs}
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise SystemExit(f"不明なシーン: {', '.join(unknown)}")
+    return [spec for spec in specs if spec.name in names]
+
+
+def load_scene_class(spec: SceneSpec) -> type:
+    """シーンクラスを import する
+
+    manim の CLI と同じく、スクリプトのディレクトリを sys.path に加えてから
+    ファイルパス指定でモジュールを読み込む。呼ぶたびにソースを読み直す。
+    """
+    directory = str(spec.path.parent)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    module_spec = importlib.util.spec_from_file_location(spec.module, spec.path)
+    module = importlib.util.module_from_spec(module_spec)
+    sys.modules[spec.module] = module
+    module_spec.loader.exec_module(module)
+    return getattr(module, spec.name)
+
+
+def scene_call_site(scene_path: Path | str) -> str:
+    """呼び出し元を遡り、シーンのファイル内の「ファイル名:行番号」を返す（無ければ "?"）
+
+    CueSyncedScene.wait_until_cue のように別のモジュールを経由した呼び出しでも、
+    シーン側の行を返す。
+    """
+    scene_path = str(scene_path)
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_filename == scene_path:
+            return f"{Path(scene_path).name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return "?"
+
+
+def render_in_process(
+    spec: SceneSpec,
+    quality: str,
+    media_dir: Path,
+    **options,
+) -> Path:
+    """現在のプロセスでシーンをレンダリングし、出力した動画のパスを返す"""
+    from manim import tempconfig
+
+    scene_class = load_scene_class(spec)
+    settings = {
+        "quality": QUALITY_NAMES[quality],
+        "media_dir": str(media_dir),
+        # 出力ディレクトリ名（videos/<モジュール名>）は input_file から決まる
+        "input_file": str(spec.path),
+        **options,
+    }
+    with tempconfig(settings):
+        scene = scene_class()
+        scene.render()
+        return Path(scene.renderer.file_writer.movie_file_path)
@@ -0,0 +1,213 @@
+"""
+アニメーション単位のプロファイラ
+
+シーンの self.play / self.wait を呼び出し位置（ファイル:行）ごとに計測し、
+どのアニメーションが重いかを一覧にする：
+- フレーム数と合計時間
+- mobject の更新（アニメーションの補間と updater）にかかった時間
+- ラスタライズ（Cairo での描画）にかかった時間
+- ffmpeg へのフレーム書き出しにかかった時間
+- 呼び出し時点のサブオブジェクト数
+
+manim のクラスに計測用のラッパーを差し込むので、このスクリプトから
+レンダリングしたときだけ有効になる（通常の manim 実行には影響しない）。
+
+使い方:
+  python scene_profiler.py MalletExperiment -q l
+  python scene_profiler.py ScientificQuestionnaire --top 10 --json profile.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import json
+import sys
+import time
+import unicodedata
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from scene_catalog import (
+    DEFAULT_MEDIA_DIR,
+    QUALITY_DIRS,
+    discover_scenes,
+    render_in_process,
+    scene_call_site,
+    select_scenes,
+)
+
+
+@dataclass
+class CallProfile:
+    """1つの呼び出し位置の計測結果（ループで複数回呼ばれたら合算）"""
+
+    site: str
+    kind: str
+    calls: int = 0
+    frames: int = 0
+    seconds: float = 0.0
+    update_seconds: float = 0.0
+    raster_seconds: float = 0.0
+    write_seconds: float = 0.0
+    submobjects: int = 0
+    animations: list[str] = field(default_factory=list)
+
+    @property
+    def other_seconds(self) -> float:
+        return self.seconds - self.update_seconds - self.raster_seconds - self.write_seconds
+
+
+def _family_size(scene) -> int:
+    return sum(len(mobject.get_family()) for mobject in scene.mobjects)
+
+
+class SceneProfiler:
+    """manim の描画処理に計測用のラッパーを差し込む"""
+
+    def __init__(self) -> None:
+        self.profiles: dict[tuple[str, str], CallProfile] = {}
+        self._current: CallProfile | None = None
+        self._patches: list[tuple[type, str, object]] = []
+
+    def _patch(self, owner: type, name: str, make_wrapper) -> None:
+        original = getattr(owner, name)
+        setattr(owner, name, functools.wraps(original)(make_wrapper(original)))
+        self._patches.append((owner, name, original))
+
+    def _timed(self, attribute: str):
+        """実行時間を現在の呼び出しの attribute に加算するラッパー"""
+
+        def make_wrapper(original):
+            def wrapper(*args, **kwargs):
+                profile = self._current
+                if profile is None:
+                    return original(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    elapsed = time.perf_counter() - start
+                    setattr(profile, attribute, getattr(profile, attribute) + elapsed)
+
+            return wrapper
+
+        return make_wrapper
+
+    def _entry_point(self, kind: str):
+        """self.play / self.wait を呼び出し位置ごとに計測するラッパー"""
+
+        def make_wrapper(original):
+            def wrapper(scene, *args, **kwargs):
+                # wait() は内部で play() を呼ぶので、外側の呼び出しだけを数える
+                if self._current is not None:
+                    return original(scene, *args, **kwargs)
+                # CueSyncedScene などを経由しても、シーンのファイルの行で集計する
+                site = scene_call_site(sys.modules[type(scene).__module__].__file__)
+                profile = self.profiles.setdefault((site, kind), CallProfile(site, kind))
+                profile.submobjects = max(profile.submobjects, _family_size(scene))
+                self._current = profile
+                start = time.perf_counter()
+                try:
+                    return original(scene, *args, **kwargs)
+                finally:
+                    profile.seconds += time.perf_counter() - start
+                    profile.calls += 1
+                    for animation in getattr(scene, "animations", None) or []:
+                        name = type(animation).__name__
+                        if name not in profile.animations:
+                            profile.animations.append(name)
+                    self._current = None
+
+            return wrapper
+
+        return make_wrapper
+
+    def _count_frames(self, original):
+        def wrapper(renderer, frame, num_frames=1):
+            if self._current is not None and not renderer.skip_animations:
+                self._current.frames += num_frames
+            return original(renderer, frame, num_frames)
+
+        return wrapper
+
+    def install(self) -> None:
+        from manim import Scene
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from manim.scene.scene_file_writer import SceneFileWriter
+
+        self._patch(Scene, "play", self._entry_point("play"))
+        self._patch(Scene, "wait", self._entry_point("wait"))
+        self._patch(Scene, "update_to_time", self._timed("update_seconds"))
+        self._patch(CairoRenderer, "update_frame", self._timed("raster_seconds"))
+        self._patch(CairoRenderer, "get_frame", self._timed("raster_seconds"))
+        self._patch(CairoRenderer, "add_frame", self._count_frames)
+        self._patch(SceneFileWriter, "write_frame", self._timed("write_seconds"))
+
+    def uninstall(self) -> None:
+        for owner, name, original in reversed(self._patches):
+            setattr(owner, name, original)
+        self._patches.clear()
+
+    def __enter__(self) -> SceneProfiler:
+        self.install()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.uninstall()
+
+    def hottest(self) -> list[CallProfile]:
+        """合計時間の長い順に並べた計測結果"""
+        return sorted(self.profiles.values(), key=lambda p: p.seconds, reverse=True)
+
+
+def _rjust(text: str, width: int) -> str:
+    """全角文字を2桁として右寄せする"""
+    wide = sum(unicodedata.east_asian_width(c) in "WF" for c in text)
+    return text.rjust(width - wide)
+
+
+def print_report(profiles: list[CallProfile], top: int) -> None:
+    total = sum(p.seconds for p in profiles)
+    columns = [("回数", 4), ("フレーム", 8), ("合計秒", 9), ("更新", 9), ("描画", 9)]
+    columns += [("書出", 9), ("他", 8), ("部品数", 9)]
+    print(
+        "呼び出し位置".ljust(40 - 6) + "種別".ljust(6 - 2)
+        + "".join(_rjust(title, width) for title, width in columns)
+        + "  アニメーション"
+    )
+    for p in profiles[:top]:
+        print(
+            f"{p.site:<40}{p.kind:<6}{p.calls:>4}{p.frames:>8}{p.seconds:>9.2f}"
+            f"{p.update_seconds:>9.2f}{p.raster_seconds:>9.2f}{p.write_seconds:>9.2f}"
+            f"{p.other_seconds:>8.2f}{p.submobjects:>9}  {', '.join(p.animations)}"
+        )
+    print(f"合計 {total:.2f}秒（{len(profiles)}箇所）")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="self.play / self.wait ごとの描画コストを計測する")
+    parser.add_argument("scene", help="シーンのクラス名")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default="l")
+    parser.add_argument("--top", type=int, default=20, help="表示する件数")
+    parser.add_argument("--json", type=Path, default=None, help="結果を JSON で保存する")
+    parser.add_argument("--media-dir", type=Path, default=DEFAULT_MEDIA_DIR / "profile")
+    args = parser.parse_args(argv)
+
+    (spec,) = select_scenes(discover_scenes(), [args.scene])
+    with SceneProfiler() as profiler:
+        # キャッシュされたアニメーションは描画されないので無効にする
+        render_in_process(spec, args.quality, args.media_dir.resolve(), disable_caching=True)
+
+    profiles = profiler.hottest()
+    print_report(profiles, args.top)
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(p) for p in profiles], indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+描画しないドライランでシーンのタイムラインを求める
+
+ラスタライズも動画の書き出しもしない NullRenderer で construct() を実行し、
+self.play / self.wait ごとの開始・終了時刻と全体の長さを出力する：
+- 時刻は実際の動画と同じくフレーム単位に丸めた値（画質のフレームレートに依存）
+- 呼び出し位置（ファイル:行）と、再生したアニメーションの種類も記録する
+- 複数のシーンはプロセスを分けて並列に実行する
+
+ナレーション（subtitles/*.srt）とタイミングを合わせるときに、
+動画を描画せずにシーンの長さを確認できる。
+
+使い方:
+  python scene_timeline.py DamageEstimation
+  python scene_timeline.py --summary                 # 全シーンの長さだけ
+  python scene_timeline.py -q h --json timeline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from scene_catalog import (
+    QUALITY_DIRS,
+    QUALITY_NAMES,
+    SceneSpec,
+    discover_scenes,
+    load_scene_class,
+    scene_call_site,
+    select_scenes,
+)
+
+
+@dataclass
+class TimelineEntry:
+    """self.play / self.wait 1回分の区間"""
+
+    index: int
+    kind: str
+    start: float
+    end: float
+    frames: int
+    site: str
+    animations: list[str]
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+def _null_renderer_class():
+    """manim を import してから NullRenderer を定義する"""
+    import numpy as np
+    from manim import Wait
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    class NullRenderer(CairoRenderer):
+        """ラスタライズも書き出しもせず、アニメーションの区間だけを記録するレンダラー
+
+        on_play を渡すと、各アニメーションの終了時に (scene, entry) で呼び出す。
+        """
+
+        def __init__(self, scene_path: Path, on_play=None, **kwargs):
+            super().__init__(skip_animations=True, **kwargs)
+            self.scene_path = str(scene_path)
+            self.on_play = on_play
+            self.timeline: list[TimelineEntry] = []
+            self.frame_count = 0
+
+        def play(self, scene, *args, **kwargs):
+            site = scene_call_site(self.scene_path)
+            super().play(scene, *args, **kwargs)
+
+            # 実際の描画と同じ規則でフレーム数を数える
+            dt = 1 / self.camera.frame_rate
+            duration = scene.duration
+            if scene.is_current_animation_frozen_frame():
+                frames = int(duration / dt)
+            else:
+                frames = len(np.arange(0, duration, dt))
+
+            animations = [type(animation).__name__ for animation in scene.animations]
+            entry = TimelineEntry(
+                index=len(self.timeline),
+                kind="wait" if all(isinstance(a, Wait) for a in scene.animations) else "play",
+                start=self.frame_count * dt,
+                end=(self.frame_count + frames) * dt,
+                frames=frames,
+                site=site,
+                animations=animations,
+            )
+            self.frame_count += frames
+            self.timeline.append(entry)
+            if self.on_play is not None:
+                self.on_play(scene, entry)
+
+        def update_frame(self, *args, **kwargs):
+            pass
+
+        def get_frame(self):
+            return None
+
+        def add_frame(self, frame, num_frames: int = 1):
+            pass
+
+        def freeze_current_frame(self, duration: float):
+            pass
+
+        def save_static_frame_data(self, scene, static_mobjects):
+            self.static_image = None
+
+        def scene_finished(self, scene):
+            pass
+
+    return NullRenderer
+
+
+def run_null(spec: SceneSpec, quality: str = "l", on_play=None):
+    """NullRenderer でシーンを最後まで実行し、レンダラーを返す"""
+    from manim import tempconfig
+
+    scene_class = load_scene_class(spec)
+    settings = {
+        "quality": QUALITY_NAMES[quality],
+        "dry_run": True,
+        "disable_caching": True,
+        "input_file": str(spec.path),
+    }
+    with tempconfig(settings):
+        renderer = _null_renderer_class()(spec.path, on_play=on_play)
+        scene = scene_class(renderer=renderer)
+        scene.render()
+    return renderer
+
+
+def scene_timeline(spec: SceneSpec, quality: str = "l") -> list[TimelineEntry]:
+    """シーンのタイムラインを求める"""
+    return run_null(spec, quality).timeline
+
+
+def _timeline_worker(args: tuple[SceneSpec, str]) -> list[dict]:
+    spec, quality = args
+    return [asdict(entry) for entry in scene_timeline(spec, quality)]
+
+
+def timelines(
+    specs: list[SceneSpec],
+    quality: str = "l",
+    jobs: int | None = None,
+) -> dict[str, list[TimelineEntry]]:
+    """複数シーンのタイムラインを並列に求める"""
+    jobs = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(_timeline_worker, [(spec, quality) for spec in specs])
+        return {
+            spec.name: [TimelineEntry(**entry) for entry in entries]
+            for spec, entries in zip(specs, results)
+        }
+
+
+def print_timeline(name: str, entries: list[TimelineEntry], summary: bool) -> None:
+    total = entries[-1].end if entries else 0.0
+    print(f"{name}: {total:.3f}秒（{len(entries)}アニメーション）")
+    if summary:
+        return
+    for e in entries:
+        print(
+            f"  {e.index:>3} {e.kind:<4} {e.start:>8.3f} → {e.end:>8.3f}"
+            f" ({e.duration:>5.2f}秒)  {e.site:<40} {', '.join(e.animations)}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="描画せずにシーンのタイムラインを求める")
+    parser.add_argument("scenes", nargs="*", help="対象のシーン名（省略時は全シーン）")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="並列数（既定: CPUコア数）")
+    parser.add_argument("--summary", action="store_true", help="シーンごとの長さだけを表示する")
+    parser.add_argument("--json", type=Path, default=None, help="タイムラインを JSON で保存する")
+    args = parser.parse_args(argv)
+
+    specs = select_scenes(discover_scenes(), args.scenes)
+    results = timelines(specs, args.quality, args.jobs)
+    for name, entries in results.items():
+        print_timeline(name, entries, args.summary)
+
+    if args.json:
+        payload = {
+            "quality": QUALITY_DIRS[args.quality],
+            "scenes": {
+                name: {
+                    "duration": entries[-1].end if entries else 0.0,
+                    "entries": [asdict(entry) for entry in entries],
+                }
+                for name, entries in results.items()
+            },
+        }
+        args.json.write_text(
+            json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
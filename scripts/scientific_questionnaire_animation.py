@@ -11,39 +11,64 @@
 
 from manim import *
 
+from fonts import apply_scene_fonts
+from i18n import _
+from text_cache import CachedText
+from text_fit import FittedText, column_width, fit_to_frame, frame_width
+
 
 class ScientificQuestionnaire(Scene):
     """科学的アンケートをアニメーション表示するシーン"""
 
     def construct(self):
-        # 日本語フォント設定
-        Text.set_default(font="Hiragino Sans")
+        # フォント設定（言語ごとのフォールバックつき）
+        apply_scene_fonts()
 
         # タイトル: 二つの対照的な反応
-        title = Text("二つの対照的な反応", font_size=56, color=WHITE)
+        title = FittedText(_("二つの対照的な反応"), font_size=56, color=WHITE)
         self.play(Write(title), run_time=1.5)
         self.wait(0.5)
         self.play(title.animate.scale(0.6).to_edge(UP))
 
         # 左側: マラグリダ（神罰説）
-        left_name = Text("マラグリダ", font_size=32, color=RED)
-        left_title = Text("(イエズス会宣教師)", font_size=20, color=GRAY_A)
+        left_name = FittedText(_("マラグリダ"), font_size=32, max_width=column_width(2), color=RED)
+        left_title = FittedText(
+            _("(イエズス会宣教師)"),
+            font_size=20,
+            max_width=column_width(2),
+            color=GRAY_A,
+        )
         left_title.next_to(left_name, DOWN, buff=0.1)
         left_header = VGroup(left_name, left_title)
         left_header.move_to(LEFT * 3.5 + UP * 2)
 
-        left_claim = Text("「市民の罪に対する\n神罰である」", font_size=28, color=RED_B)
+        left_claim = FittedText(
+            _("「市民の罪に対する\n神罰である」"),
+            font_size=28,
+            max_width=column_width(2),
+            color=RED_B,
+        )
         left_claim.set_line_spacing(1.2)
         left_claim.next_to(left_header, DOWN, buff=0.5)
 
         # 右側: ポンバル侯爵（科学的アンケート）
-        right_name = Text("ポンバル侯爵", font_size=32, color=BLUE)
-        right_title = Text("(宰相カルヴァーリョ)", font_size=20, color=GRAY_A)
+        right_name = FittedText(_("ポンバル侯爵"), font_size=32, max_width=column_width(2), color=BLUE)
+        right_title = FittedText(
+            _("(宰相カルヴァーリョ)"),
+            font_size=20,
+            max_width=column_width(2),
+            color=GRAY_A,
+        )
         right_title.next_to(right_name, DOWN, buff=0.1)
         right_header = VGroup(right_name, right_title)
         right_header.move_to(RIGHT * 3.5 + UP * 2)
 
-        right_label = Text("科学的アンケート", font_size=28, color=BLUE_B)
+        right_label = FittedText(
+            _("科学的アンケート"),
+            font_size=28,
+            max_width=column_width(2),
+            color=BLUE_B,
+        )
         right_label.next_to(right_header, DOWN, buff=0.5)
 
         # 中央の分割線
@@ -55,7 +80,7 @@ class ScientificQuestionnaire(Scene):
         )
 
         # VS表示
-        vs_text = Text("vs", font_size=36, color=YELLOW)
+        vs_text = CachedText("vs", font_size=36, color=YELLOW)
         vs_text.move_to(UP * 0.5)
 
         # 左右を表示
@@ -72,14 +97,14 @@ class ScientificQuestionnaire(Scene):
 
         # 科学的アンケートの質問を順番に表示
         questions = [
-            "「地震は何時に始まり、\n  どれくらい続いたか？」",
-            "「海水は引いたか、満ちたか？\n  高さはどの程度か？」",
-            "「建物の倒壊に\n  方向性はあったか？」",
+            _("「地震は何時に始まり、\n  どれくらい続いたか？」"),
+            _("「海水は引いたか、満ちたか？\n  高さはどの程度か？」"),
+            _("「建物の倒壊に\n  方向性はあったか？」"),
         ]
 
         question_group = VGroup()
         for i, q in enumerate(questions):
-            q_text = Text(q, font_size=22, color=WHITE)
+            q_text = FittedText(q, font_size=22, max_width=column_width(2), color=WHITE)
             q_text.set_line_spacing(1.1)
             question_group.add(q_text)
 
@@ -105,20 +130,22 @@ class ScientificQuestionnaire(Scene):
         )
 
         # 結論: 「なぜ」vs「どのように」
-        conclusion = Text(
-            "同じ災害に対する分岐点",
+        conclusion = FittedText(
+            _("同じ災害に対する分岐点"),
             font_size=40,
             color=WHITE,
         )
         conclusion.move_to(UP * 0.5)
         self.play(FadeIn(conclusion, shift=UP))
 
-        why_text = Text("「なぜ」", font_size=48, color=RED)
-        how_text = Text("「どのように」", font_size=48, color=BLUE)
-        vs_text2 = Text("vs", font_size=32, color=YELLOW)
+        why_text = FittedText(_("「なぜ」"), font_size=48, color=RED)
+        how_text = FittedText(_("「どのように」"), font_size=48, color=BLUE)
+        vs_text2 = CachedText("vs", font_size=32, color=YELLOW)
 
         comparison = VGroup(why_text, vs_text2, how_text).arrange(RIGHT, buff=0.5)
         comparison.move_to(DOWN * 1)
+        # 強調で 1.1 倍にしてもはみ出さないように
+        fit_to_frame(comparison, max_width=frame_width() / 1.1)
 
         self.play(
             FadeIn(why_text, shift=LEFT),
@@ -145,27 +172,27 @@ class ScientificQuestionnaireSimple(Scene):
     """シンプル版：アンケート質問のみ"""
 
     def construct(self):
-        Text.set_default(font="Hiragino Sans")
+        apply_scene_fonts()
 
         # タイトル
-        title = Text("ポンバル侯爵の科学的アンケート", font_size=40, color=BLUE)
+        title = FittedText(_("ポンバル侯爵の科学的アンケート"), font_size=40, color=BLUE)
         self.play(Write(title))
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # 質問リスト
         questions = [
-            "「地震は何時に始まり、どれくらい続いたか？」",
-            "「海水は引いたか、満ちたか？高さはどの程度か？」",
-            "「建物の倒壊に方向性はあったか？」",
+            _("「地震は何時に始まり、どれくらい続いたか？」"),
+            _("「海水は引いたか、満ちたか？高さはどの程度か？」"),
+            _("「建物の倒壊に方向性はあったか？」"),
         ]
 
         q_group = VGroup()
         for i, q in enumerate(questions):
-            icon = Text(f"Q{i+1}.", font_size=32, color=YELLOW)
-            text = Text(q, font_size=28, color=WHITE)
+            icon = CachedText(f"Q{i+1}.", font_size=32, color=YELLOW)
+            text = FittedText(q, font_size=28, color=WHITE)
             item = VGroup(icon, text).arrange(RIGHT, buff=0.3)
-            q_group.add(item)
+            q_group.add(fit_to_frame(item))
 
         q_group.arrange(DOWN, buff=0.6, aligned_edge=LEFT)
         q_group.move_to(UP * 0.3)
@@ -177,7 +204,7 @@ class ScientificQuestionnaireSimple(Scene):
         self.wait(1)
 
         # 補足: 全13項目
-        note = Text("...など全13項目のアンケート調査", font_size=24, color=GRAY_A)
+        note = FittedText(_("...など全13項目のアンケート調査"), font_size=24, color=GRAY_A)
         note.move_to(DOWN * 2)
         self.play(FadeIn(note, shift=UP))
 
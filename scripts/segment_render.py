@@ -0,0 +1,144 @@
+"""
+1シーンを self.play 境界で分割した並列レンダリング
+
+WhyChangedScience のように self.play / self.wait が長く連なるシーンを、
+アニメーション番号の連続区間に分けて複数の manim プロセスで同時に描画する：
+1. 描画しないドライラン（scene_timeline.py）で、各アニメーションの所要時間を求める
+2. 所要時間がほぼ均等になるよう連続区間に分割する
+3. 区間ごとに manim -n <開始>,<終了> で描画する
+   （開始までのアニメーションは描画せずに早送りされ、状態だけが進む）
+4. 各区間の動画を再エンコードせずに連結する
+
+区間ごとに別の media ディレクトリを使う。manim は partial_movie_files と
+その一覧ファイルをシーン名ごとのディレクトリに置くため、同じシーンを
+同じディレクトリで並列に描画すると互いのファイルを消し合ってしまう。
+
+使い方:
+  python segment_render.py WhyChangedScience -q h -j 8
+  LISBON_LANG=en python segment_render.py WhyChangedScience   # 英訳（media/i18n/en/ に出力）
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from batch_render import RenderResult, render_scene
+from ffmpeg_tools import concat_copy
+from i18n import current_language, language_media_dir
+from render_cache import RenderCache, scene_cache_key
+from scene_catalog import DEFAULT_MEDIA_DIR, QUALITY_DIRS, SceneSpec, discover_scenes, select_scenes
+from scene_timeline import scene_timeline
+
+
+def animation_durations(spec: SceneSpec, quality: str = "l") -> list[float]:
+    """描画せずにシーンを実行し、各アニメーションの所要時間を返す
+
+    skip_animations の実行では renderer.time が進まないので、NullRenderer が
+    実際の描画と同じ規則で数えたフレーム数から求める。
+    """
+    return [entry.duration for entry in scene_timeline(spec, quality)]
+
+
+def split_ranges(durations: list[float], parts: int) -> list[tuple[int, int]]:
+    """アニメーション番号の連続区間（両端を含む）に分割する
+
+    各区間の所要時間がほぼ均等になるように区切る。manim の -n は終了番号 0 を
+    「指定なし」と解釈するため、各区間には少なくとも2つのアニメーションを含める。
+    """
+    count = len(durations)
+    parts = max(1, min(parts, count // 2))
+    total = sum(durations)
+
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    elapsed = 0.0
+    for index, duration in enumerate(durations):
+        remaining = parts - len(ranges) - 1
+        if remaining == 0:
+            break
+        elapsed += duration
+        if (
+            elapsed >= total * (len(ranges) + 1) / parts
+            and index > start
+            and count - (index + 1) >= 2 * remaining
+        ):
+            ranges.append((start, index))
+            start = index + 1
+    ranges.append((start, count - 1))
+    return ranges
+
+
+def render_segments(
+    spec: SceneSpec,
+    quality: str = "l",
+    jobs: int | None = None,
+    media_dir: Path = DEFAULT_MEDIA_DIR,
+) -> Path:
+    """シーンを区間に分けて並列に描画し、連結した動画のパスを返す"""
+    media_dir = Path(media_dir).resolve()
+    jobs = jobs or os.cpu_count() or 1
+    ranges = split_ranges(animation_durations(spec, quality), jobs)
+    segment_root = media_dir / "segments" / spec.name
+
+    def render_part(index: int, first: int, last: int) -> RenderResult:
+        part_dir = segment_root / f"part{index:02d}"
+        part_dir.mkdir(parents=True, exist_ok=True)
+        # 最後の区間は終了番号を付けずにシーンの最後まで描画する
+        span = f"{first}" if last == ranges[-1][1] else f"{first},{last}"
+        return render_scene(
+            spec,
+            quality,
+            part_dir,
+            part_dir,
+            extra=("-n", span),
+            log_name="render",
+        )
+
+    with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+        results = list(
+            pool.map(lambda args: render_part(*args), [(i, *r) for i, r in enumerate(ranges)])
+        )
+
+    for (first, last), result in zip(ranges, results):
+        status = "完了" if result.ok else "失敗"
+        print(f"[{status}] アニメーション {first}〜{last} ({result.seconds:.1f}秒)")
+    failed = [result for result in results if not result.ok]
+    if failed:
+        raise RuntimeError(f"区間の描画に失敗しました: {failed[0].log_path}")
+
+    output = spec.output_path(media_dir, quality)
+    concat_copy([result.output for result in results], output)
+    return output
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="1シーンを区間に分けて並列にレンダリングする")
+    parser.add_argument("scene", help="シーンのクラス名")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITY_DIRS), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="区間数（既定: CPUコア数）")
+    parser.add_argument("--media-dir", type=Path, default=DEFAULT_MEDIA_DIR)
+    args = parser.parse_args(argv)
+
+    (spec,) = select_scenes(discover_scenes(), [args.scene])
+    # batch_render と同じく、原文以外の言語は言語ごとの media ディレクトリに描く
+    language = current_language()
+    media_dir = language_media_dir(args.media_dir.resolve(), language)
+
+    start = time.perf_counter()
+    output = render_segments(spec, args.quality, args.jobs, media_dir)
+    print(f"{output} ({time.perf_counter() - start:.1f}秒)")
+
+    # 通常の描画と同じ出力なので、一括レンダリングのキャッシュにも記録する
+    cache = RenderCache(media_dir)
+    cache.record(spec, args.quality, scene_cache_key(spec, args.quality, language))
+    cache.save()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
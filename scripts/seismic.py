@@ -0,0 +1,365 @@
+"""
+地震波の到達時刻の計算（層状の媒質のアイコナール方程式と、観測点ごとの到達）
+
+震源から各点に波が最初に届く時刻 T は |∇T| = 1 / v を満たす。
+速さ v を格子で与え、Godunov の風上差分で全格子点を同時に更新する反復（Jacobi 型）を
+NumPy の配列演算だけで収束まで回す：
+- 層の境界での屈折や、速い層を伝わって先回りする波（ヘッドウェーブ）も自然に出る
+- 計算した時刻の格子は media/seismic/<キー>.npz に保存し、同じモデル・格子・震源なら
+  次からは読むだけ
+- シーンでは Wavefront（画像）で、フレームごとに「T が今の時刻の前後にある点」を
+  しきい値で塗るだけにする
+
+観測点（地表の点）については station_arrivals が震源からの直線距離で
+到達時刻と減衰した揺れの強さを全点まとめて計算する。数千点でも1回の配列演算で、
+StationField（点群）はフレームごとに到達済みの点を光らせるだけにする。
+
+座標は地表を z=0、下向きを正とするメートル単位。
+
+使い方:
+  field = travel_time_field(MALLET_LAYERS, MALLET_GRID, MALLET_SOURCE)
+  wavefront = Wavefront(field, color=ORANGE).move_to(underground.get_center())
+  self.play(Propagate(wavefront), run_time=3)
+
+  arrivals = station_arrivals(epicenter, stations, HalfSpace(velocity=3500))
+  self.play(Propagate(StationField(points, arrivals)), run_time=4.5)
+
+  python seismic.py                  # マレットの実験の到達時刻を表示
+  python seismic.py --refresh        # キャッシュを作り直す
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import zipfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+from manim import (
+    ORANGE,
+    RESAMPLING_ALGORITHMS,
+    YELLOW,
+    Animation,
+    ImageMobject,
+    ManimColor,
+    PMobject,
+    linear,
+)
+
+from scene_catalog import DEFAULT_MEDIA_DIR
+
+CACHE_DIR = DEFAULT_MEDIA_DIR / "seismic"
+
+# 計算方法を変えたら上げる（古いキャッシュは別のキーになる）
+FORMAT_VERSION = 1
+
+# まだ届いていない点の時刻（inf だと差分の計算で nan になるので大きな有限値にする）
+UNREACHED = 1e10
+
+# 震源のまわりで直線の伝播時間で初期化する半径（格子間隔の倍数、点震源の誤差を抑える）
+SOURCE_RADIUS = 3
+
+
+@dataclass(frozen=True)
+class Layer:
+    """水平な1つの層"""
+
+    name: str
+    bottom: float  # 層の下端の深さ（m）
+    velocity: float  # 伝播速度（m/s）
+
+
+@dataclass(frozen=True)
+class Grid:
+    """x = -width/2 〜 width/2、z = 0 〜 depth の等間隔の格子（m）"""
+
+    width: float
+    depth: float
+    spacing: float
+
+    @property
+    def x(self) -> np.ndarray:
+        count = int(round(self.width / self.spacing)) + 1
+        return np.linspace(-self.width / 2, self.width / 2, count)
+
+    @property
+    def z(self) -> np.ndarray:
+        return np.linspace(0, self.depth, int(round(self.depth / self.spacing)) + 1)
+
+    def index(self, x: float, z: float) -> tuple[int, int]:
+        """点に一番近い格子点の（行, 列）"""
+        row = int(np.clip(round(z / self.spacing), 0, len(self.z) - 1))
+        col = int(np.clip(round((x + self.width / 2) / self.spacing), 0, len(self.x) - 1))
+        return row, col
+
+
+# マレットの実験（1849年）：濡れた砂の下に花崗岩、約800m離れた地表で測定
+MALLET_LAYERS = (
+    Layer("wet sand", bottom=80.0, velocity=251.0),
+    Layer("granite", bottom=float("inf"), velocity=427.0),
+)
+MALLET_GRID = Grid(width=1200.0, depth=200.0, spacing=5.0)
+MALLET_SOURCE = (-400.0, 50.0)
+MALLET_RECEIVER = (400.0, 0.0)
+
+
+def velocity_field(layers: tuple[Layer, ...], grid: Grid) -> np.ndarray:
+    """格子点ごとの速さ（行 = 深さ、列 = x）"""
+    bottoms = np.array([layer.bottom for layer in layers])
+    velocities = np.array([layer.velocity for layer in layers])
+    rows = np.minimum(np.searchsorted(bottoms, grid.z, side="right"), len(layers) - 1)
+    return np.repeat(velocities[rows][:, None], len(grid.x), axis=1)
+
+
+def solve_eikonal(
+    velocity: np.ndarray,
+    spacing: float,
+    source: tuple[int, int],
+    tolerance: float = 1e-7,
+) -> np.ndarray:
+    """震源の格子点からの初到達時刻（Godunov の風上差分を全点同時に反復）"""
+    slowness = spacing / velocity
+    rows, cols = np.indices(velocity.shape)
+    distance = np.hypot(rows - source[0], cols - source[1]) * spacing
+    times = np.full(velocity.shape, UNREACHED)
+    near = distance <= SOURCE_RADIUS * spacing
+    times[near] = distance[near] / velocity[source]
+
+    for _iteration in range(4 * sum(velocity.shape)):
+        padded = np.pad(times, 1, constant_values=UNREACHED)
+        a = np.minimum(padded[:-2, 1:-1], padded[2:, 1:-1])  # 上下の小さい方
+        b = np.minimum(padded[1:-1, :-2], padded[1:-1, 2:])  # 左右の小さい方
+        gap = np.abs(a - b)
+        one_sided = np.minimum(a, b) + slowness
+        two_sided = (a + b + np.sqrt(np.maximum(2 * slowness**2 - gap**2, 0))) / 2
+        updated = np.minimum(times, np.where(gap >= slowness, one_sided, two_sided))
+        if np.max(times - updated) < tolerance:
+            return updated
+        times = updated
+    return times
+
+
+@dataclass
+class TimeField:
+    """格子点ごとの初到達時刻（秒）"""
+
+    times: np.ndarray  # (深さ方向の点の数, x 方向の点の数)
+    grid: Grid
+
+    @property
+    def max_time(self) -> float:
+        return float(self.times.max())
+
+    def arrival(self, x: float, z: float) -> float:
+        """点に一番近い格子点に波が届く時刻"""
+        return float(self.times[self.grid.index(x, z)])
+
+
+def _field_key(layers: tuple[Layer, ...], grid: Grid, source: tuple[float, float]) -> str:
+    payload = [[asdict(layer) for layer in layers], asdict(grid), list(source), FORMAT_VERSION]
+    return hashlib.sha256(json.dumps(payload).encode()).hexdigest()[:24]
+
+
+def travel_time_field(
+    layers: tuple[Layer, ...],
+    grid: Grid,
+    source: tuple[float, float],
+    cache_dir: Path = CACHE_DIR,
+    refresh: bool = False,
+) -> TimeField:
+    """層状の媒質での震源からの初到達時刻（ディスクのキャッシュがあればそれを使う）"""
+    path = Path(cache_dir) / f"{_field_key(layers, grid, source)}.npz"
+    if not refresh:
+        try:
+            with np.load(path) as data:
+                return TimeField(data["times"], grid)
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            pass
+
+    times = solve_eikonal(velocity_field(layers, grid), grid.spacing, grid.index(*source))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.stem}.{os.getpid()}.tmp.npz")
+    try:
+        np.savez(tmp, times=times)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return TimeField(times, grid)
+
+
+@dataclass(frozen=True)
+class HalfSpace:
+    """一様な媒質（波は直進し、距離による幾何減衰と媒質の内部減衰を受ける）"""
+
+    velocity: float  # 伝播速度（m/s）
+    quality: float = 300.0  # Q 値（大きいほど減衰しにくい）
+    frequency: float = 1.0  # 揺れの代表的な周波数（Hz）
+    spreading: float = 1.0  # 幾何減衰の指数（実体波 1、表面波 0.5）
+
+
+@dataclass
+class Arrivals:
+    """観測点ごとの震源距離・到達時刻・揺れの強さ（震源から reference の距離で 1）"""
+
+    distances: np.ndarray  # (観測点の数,)、m
+    times: np.ndarray  # (観測点の数,)、秒
+    intensities: np.ndarray  # (観測点の数,)
+
+
+# 1750年ロンドン地震：地表近くを伝わる揺れ（S 波程度の速さ、表面波として減衰）
+LONDON_MODEL = HalfSpace(velocity=3500.0, spreading=0.5)
+
+
+def station_arrivals(
+    epicenter: np.ndarray,
+    stations: np.ndarray,
+    model: HalfSpace,
+    depth: float = 0.0,
+    origin_time: float = 0.0,
+    reference: float = 1000.0,
+) -> Arrivals:
+    """全観測点の到達時刻と揺れの強さを1回の配列演算で求める
+
+    epicenter は震央の (x, y)、stations は (観測点の数, 2) の地表の座標（m）。
+    depth は震源の深さで、距離は震源からの直線距離になる。
+    """
+    offsets = np.atleast_2d(np.asarray(stations, dtype=float)) - np.asarray(epicenter, dtype=float)
+    distances = np.hypot(np.hypot(offsets[:, 0], offsets[:, 1]), depth)
+    spreading = (reference / np.maximum(distances, reference)) ** model.spreading
+    absorption = np.exp(-np.pi * model.frequency * distances / (model.quality * model.velocity))
+    return Arrivals(
+        distances=distances,
+        times=origin_time + distances / model.velocity,
+        intensities=spreading * absorption,
+    )
+
+
+def on_frames(times: np.ndarray, frame_rate: float) -> np.ndarray:
+    """時刻をフレームの境目に丸める（その時刻を含むフレームで始まるように）"""
+    return np.ceil(np.asarray(times) * frame_rate - 1e-9) / frame_rate
+
+
+class Wavefront(ImageMobject):
+    """到達時刻の格子を、今の時刻の波面として塗る画像
+
+    T が今の時刻から band 秒以内の点を濃く、すでに通り過ぎた点を trail の濃さで塗る。
+    画像の大きさは meters_per_unit（manim の1単位あたりのメートル）で決まる。
+    """
+
+    def __init__(
+        self,
+        field: TimeField,
+        color=ORANGE,
+        band: float = 0.12,
+        trail: float = 0.15,
+        meters_per_unit: float = 100.0,
+        **kwargs,
+    ) -> None:
+        self.field = field
+        self.band = band
+        self.trail = trail
+        pixels = np.zeros((*field.times.shape, 4), dtype=np.uint8)
+        pixels[..., :3] = (np.array(ManimColor(color).to_rgb()) * 255).astype(np.uint8)
+        super().__init__(pixels, **kwargs)
+        self.set_resampling_algorithm(RESAMPLING_ALGORITHMS["bilinear"])
+        self.stretch_to_fit_width(field.grid.width / meters_per_unit)
+        self.stretch_to_fit_height(field.grid.depth / meters_per_unit)
+
+    @property
+    def max_time(self) -> float:
+        return self.field.max_time
+
+    def set_time(self, t: float) -> Wavefront:
+        passed = t - self.field.times
+        alpha = np.where(passed >= 0, np.maximum(1 - passed / self.band, self.trail), 0)
+        self.pixel_array[..., 3] = (alpha * 255).astype(np.uint8)
+        return self
+
+
+class StationField(PMobject):
+    """観測点の点群（波が届いた点が強さに応じて光り、少しずつ落ち着く）
+
+    points は観測点の画面上の位置 (観測点の数, 3)。強さは全点の最大で割って使う。
+    点群は画素に直接書かれて透明度が効かないので、明るさは色を暗くして表す。
+    """
+
+    def __init__(
+        self,
+        points: np.ndarray,
+        arrivals: Arrivals,
+        color=YELLOW,
+        dim: float = 0.15,
+        settle: float = 0.4,
+        flash: float = 2.0,
+        stroke_width: float = 3,
+        **kwargs,
+    ) -> None:
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        self.arrivals = arrivals
+        self.strength = arrivals.intensities / arrivals.intensities.max()
+        self.base_rgb = np.array(ManimColor(color).to_rgb())
+        self.dim = dim
+        self.settle = settle
+        self.flash = flash  # 光ってから落ち着くまでの時定数（到達時刻と同じ秒）
+        self.add_points(np.asarray(points, dtype=float), color=color)
+        self.set_time(0.0)
+
+    @property
+    def max_time(self) -> float:
+        return float(self.arrivals.times.max())
+
+    def fade(self, darkness: float = 0.5, family: bool = True) -> StationField:
+        # PMobject は fade で何もしないので、FadeOut で消えるように色を暗くする
+        self.rgbas[:, :3] *= 1 - darkness
+        return super().fade(darkness, family)
+
+    def set_time(self, t: float) -> StationField:
+        passed = t - self.arrivals.times
+        glow = self.settle + (1 - self.settle) * np.exp(-np.maximum(passed, 0) / self.flash)
+        brightness = np.where(passed >= 0, np.maximum(self.strength * glow, self.dim), self.dim)
+        self.rgbas[:, :3] = self.base_rgb * brightness[:, None]
+        self.rgbas[:, 3] = 1.0
+        return self
+
+
+class Propagate(Animation):
+    """Wavefront・StationField の時刻を 0 から until 秒（既定: 全点に届くまで）まで進める
+
+    run_time は再生時間で、until とは別に決められる（ゆっくり見せるときは長くする）。
+    """
+
+    def __init__(
+        self,
+        mobject: Wavefront | StationField,
+        until: float | None = None,
+        **kwargs,
+    ) -> None:
+        self.until = mobject.max_time if until is None else until
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(mobject, **kwargs)
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        self.mobject.set_time(alpha * self.until)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="マレットの実験の地震波の到達時刻を計算する")
+    parser.add_argument("--refresh", action="store_true", help="キャッシュを使わずに計算し直す")
+    args = parser.parse_args(argv)
+
+    field = travel_time_field(MALLET_LAYERS, MALLET_GRID, MALLET_SOURCE, refresh=args.refresh)
+    distance = float(np.hypot(*np.subtract(MALLET_RECEIVER, MALLET_SOURCE)))
+    print(f"格子 {field.times.shape[1]}×{field.times.shape[0]}（間隔 {MALLET_GRID.spacing:g}m）")
+    print(f"測定地点までの到達時刻: {field.arrival(*MALLET_RECEIVER):.2f}秒")
+    for layer in MALLET_LAYERS:
+        print(f"  {layer.name} だけを直進した場合: {distance / layer.velocity:.2f}秒")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+字幕の焼き込み（ハードサブ）
+
+ソフトサブを表示できない再生環境向けに、言語ごとに字幕を焼き込んだ動画を作る：
+- 字幕は subtitle_convert.py の ASS（言語ごとのフォントと候補からの選択つき）で描く
+- 元の動画のデコードは1回だけで、split フィルタで全言語に分けて並行にエンコードする
+  （言語の数だけ元の動画をデコードし直さない）
+- 終了後に言語ごとのフレーム数・ファイルサイズと、全言語をまとめた毎秒フレーム数を表示する
+
+1つの ffmpeg が全言語を同じフレームずつ進めるので、毎秒フレーム数は言語ごとには
+測れない（一番遅いエンコードに揃う）。表示する fps は言語ごとの値ではなく、
+元動画のデコードと全言語の出力を合わせた全体の値で、出力にもそう明記する。
+
+使い方:
+  python subtitle_burn.py media/final.mp4                    # media/deliverables/ に全言語
+  python subtitle_burn.py media/final.mp4 -l jp -l zh --crf 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from ffmpeg_tools import probe_frame_count, run_ffmpeg
+from subtitle_convert import OUTPUT_DIR as ASS_DIR
+from subtitle_convert import convert_all
+from subtitle_mux import OUTPUT_DIR
+from subtitles import DEFAULT_VIDEO, LANGUAGES, subtitle_path
+
+
+def _filter_path(path: Path) -> str:
+    """フィルタグラフの引数に入れるパスをエスケープする"""
+    text = Path(path).resolve().as_posix()
+    for char in ("\\", ":", "'", ",", ";", "[", "]"):
+        text = text.replace(char, "\\" + char)
+    return text
+
+
+def burn_command(
+    video: Path,
+    subtitles: dict[str, Path],
+    outputs: dict[str, Path],
+    crf: int = 18,
+    preset: str = "medium",
+    fonts_dir: Path | None = None,
+) -> list[str]:
+    """1回のデコードから全言語の焼き込み動画を作る ffmpeg の引数"""
+    languages = list(outputs)
+    fonts = f":fontsdir={_filter_path(fonts_dir)}" if fonts_dir else ""
+    graph = [
+        f"[0:v]split={len(languages)}" + "".join(f"[src{i}]" for i in range(len(languages)))
+    ]
+    for i, lang in enumerate(languages):
+        graph.append(f"[src{i}]ass=filename={_filter_path(subtitles[lang])}{fonts}[out{i}]")
+
+    args = ["-i", str(video), "-filter_complex", ";".join(graph)]
+    for i, lang in enumerate(languages):
+        args += [
+            "-map", f"[out{i}]", "-map", "0:a?",
+            "-c:v", "libx264", "-crf", str(crf), "-preset", preset, "-pix_fmt", "yuv420p",
+            "-c:a", "copy", "-movflags", "+faststart",
+            str(outputs[lang]),
+        ]
+    return args
+
+
+def burn_all(
+    video: Path,
+    languages: list[str],
+    output_dir: Path = OUTPUT_DIR,
+    subtitle_video: str = DEFAULT_VIDEO,
+    crf: int = 18,
+    preset: str = "medium",
+    fonts_dir: Path | None = None,
+) -> tuple[dict[str, Path], float]:
+    """全言語の焼き込み動画を作り、（出力, 経過秒数）を返す"""
+    sources = [subtitle_path(lang, subtitle_video) for lang in languages]
+    ass_files = convert_all(sources, ["ass"])
+    subtitles = {lang: output for lang, (output, _) in zip(languages, ass_files)}
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    outputs = {lang: output_dir / f"{video.stem}-{lang}-burned.mp4" for lang in languages}
+    start = time.perf_counter()
+    run_ffmpeg(burn_command(video, subtitles, outputs, crf, preset, fonts_dir))
+    return outputs, time.perf_counter() - start
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="言語ごとに字幕を焼き込んだ動画を作る")
+    parser.add_argument("video", type=Path, help="完成した動画")
+    parser.add_argument(
+        "-l", "--language", dest="languages", action="append", choices=LANGUAGES,
+        help="焼き込む言語（複数指定可、既定: すべて）",
+    )
+    parser.add_argument("-o", "--output-dir", type=Path, default=OUTPUT_DIR)
+    parser.add_argument("--subtitles", default=DEFAULT_VIDEO, help="字幕ファイル名の動画部分")
+    parser.add_argument("--crf", type=int, default=18)
+    parser.add_argument("--preset", default="medium", help="libx264 のプリセット")
+    parser.add_argument("--fonts-dir", type=Path, default=None, help="libass が探すフォントのディレクトリ")
+    args = parser.parse_args(argv)
+
+    outputs, seconds = burn_all(
+        args.video,
+        args.languages or list(LANGUAGES),
+        args.output_dir,
+        args.subtitles,
+        args.crf,
+        args.preset,
+        args.fonts_dir,
+    )
+    print(f"字幕ファイル: {ASS_DIR}")
+    frames = {}
+    for lang, output in outputs.items():
+        frames[lang] = probe_frame_count(output)
+        size = output.stat().st_size / 1024 / 1024
+        print(f"{lang}: {frames[lang]}フレーム {size:>7.1f}MiB  {output}")
+    # 全言語を1回の ffmpeg でまとめて作るので、速さは言語ごとではなく全体の値しか測れない
+    source_frames = max(frames.values(), default=0)
+    print(
+        f"全体 {seconds:.1f}秒（デコード1回、{len(outputs)}言語を同時にエンコード）:"
+        f" 元動画 {source_frames / seconds:.1f}fps、"
+        f"全言語の出力の合計 {sum(frames.values()) / seconds:.1f}fps"
+    )
+    print("※ fps は全言語をまとめた値です（言語ごとのエンコード速度は測っていません）")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
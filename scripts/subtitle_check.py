@@ -0,0 +1,260 @@
+"""
+多言語字幕の整合性チェック
+
+subtitles/ の字幕は言語ごとにキューが1対1で対応しているはずなので、
+動画ごと（ファイル名の「<動画>-<言語>.srt」）に全言語を NumPy 配列へ読み込み、
+キュー番号で揃えてから一括で検査する：
+- count     : キュー数が基準言語と違う
+- missing   : 基準言語にあるキュー番号が無い（duplicate: 同じ番号が複数ある）
+- drift     : 開始・終了時刻が基準言語とずれている
+- duration  : 終了が開始より前
+- overlap   : 次のキューと表示時間が重なる
+- gap       : 次のキューとの間隔が短すぎる（ちらつく）／長すぎる
+- cps       : 1秒あたりの文字数が言語ごとの上限を超える（読み切れない）
+
+count / missing / duplicate / drift / duration / overlap はエラー、gap と cps は警告とし、
+エラーがあれば終了コード 1 を返す。
+
+使い方:
+  python subtitle_check.py                       # subtitles/ の全ファイル
+  python subtitle_check.py --cps jp=6 --max-gap 4000
+  python subtitle_check.py path/to/*.srt --json report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+from subtitles import SUBTITLES_DIR, SubtitleTrack, format_timestamp
+
+# 時刻合わせの基準にする言語（ナレーション原稿）
+REFERENCE_LANGUAGE = "jp"
+
+# 1秒あたりの文字数の上限の目安（改行は数えない）
+CPS_LIMITS = {"en": 20.0, "es": 20.0, "ru": 20.0, "jp": 8.0, "ko": 12.0, "zh": 9.0}
+DEFAULT_CPS_LIMIT = 20.0
+
+ERROR_KINDS = ("count", "missing", "duplicate", "drift", "duration", "overlap")
+
+
+@dataclass
+class Issue:
+    video: str
+    language: str
+    cue: int | None
+    kind: str
+    message: str
+
+    @property
+    def is_error(self) -> bool:
+        return self.kind in ERROR_KINDS
+
+
+@dataclass
+class VideoSubtitles:
+    """1つの動画の全言語の字幕（行: 言語、列: キュー番号 - 1）"""
+
+    video: str
+    languages: list[str]
+    starts: np.ndarray
+    ends: np.ndarray
+    chars: np.ndarray
+    present: np.ndarray
+    counts: np.ndarray
+    duplicates: list[tuple[int, int]]
+
+
+def split_name(path: Path) -> tuple[str, str]:
+    """「1755-lisbon-earthquake-jp.srt」を（動画, 言語）に分ける"""
+    video, _, language = path.stem.rpartition("-")
+    return video, language
+
+
+def group_files(paths: list[Path]) -> dict[str, dict[str, Path]]:
+    """字幕ファイルを動画ごとにまとめる"""
+    videos: dict[str, dict[str, Path]] = defaultdict(dict)
+    for path in sorted(paths):
+        video, language = split_name(path)
+        videos[video][language] = path
+    return dict(videos)
+
+
+def load_video(video: str, files: dict[str, Path]) -> VideoSubtitles:
+    """全言語の字幕を読み、キュー番号の位置に揃えた配列にする"""
+    languages = sorted(files)
+    tracks = [SubtitleTrack.from_file(files[language]) for language in languages]
+    width = max((max(track.numbers, default=0) for track in tracks), default=0)
+
+    shape = (len(languages), width)
+    starts = np.zeros(shape, dtype=np.int64)
+    ends = np.zeros(shape, dtype=np.int64)
+    chars = np.zeros(shape, dtype=np.int64)
+    present = np.zeros(shape, dtype=bool)
+    counts = np.array([len(track) for track in tracks], dtype=np.int64)
+    duplicates = []
+
+    for row, track in enumerate(tracks):
+        columns = np.frombuffer(track.numbers, dtype=np.int64) - 1
+        starts[row, columns] = np.frombuffer(track.starts, dtype=np.int64)
+        ends[row, columns] = np.frombuffer(track.ends, dtype=np.int64)
+        # 本文の長さから改行の数を引いて表示文字数にする
+        lengths = np.diff(np.frombuffer(track.text_offsets, dtype=np.int64))
+        newlines = np.array([track.text(i).count("\n") for i in range(len(track))])
+        chars[row, columns] = lengths - newlines.astype(np.int64)
+        present[row, columns] = True
+        numbers, occurrences = np.unique(columns + 1, return_counts=True)
+        duplicates += [(row, int(n)) for n in numbers[occurrences > 1]]
+
+    return VideoSubtitles(video, languages, starts, ends, chars, present, counts, duplicates)
+
+
+def check_video(
+    subs: VideoSubtitles,
+    reference: str = REFERENCE_LANGUAGE,
+    drift_tolerance: int = 100,
+    min_gap: int = 67,
+    max_gap: int = 5000,
+    cps_limits: dict[str, float] | None = None,
+) -> list[Issue]:
+    """1つの動画の全言語を一括で検査する（時刻はミリ秒）"""
+    cps_limits = {**CPS_LIMITS, **(cps_limits or {})}
+    languages = subs.languages
+    ref = languages.index(reference) if reference in languages else 0
+    starts, ends, present = subs.starts, subs.ends, subs.present
+    issues: list[Issue] = []
+
+    def report(kind: str, mask: np.ndarray, describe) -> None:
+        for row, column in zip(*np.nonzero(mask)):
+            issues.append(
+                Issue(subs.video, languages[row], int(column) + 1, kind, describe(row, column))
+            )
+
+    for row in np.nonzero(subs.counts != subs.counts[ref])[0]:
+        issues.append(
+            Issue(
+                subs.video,
+                languages[row],
+                None,
+                "count",
+                f"キュー数 {subs.counts[row]}（{languages[ref]} は {subs.counts[ref]}）",
+            )
+        )
+    for row, number in subs.duplicates:
+        issues.append(Issue(subs.video, languages[row], number, "duplicate", "番号が重複しています"))
+
+    report("missing", ~present & present[ref], lambda r, c: "キューがありません")
+
+    # 基準言語とのずれ
+    both = present & present[ref]
+    drift = np.maximum(np.abs(starts - starts[ref]), np.abs(ends - ends[ref]))
+    report(
+        "drift",
+        both & (drift > drift_tolerance),
+        lambda r, c: (
+            f"{format_timestamp(starts[r, c])} --> {format_timestamp(ends[r, c])}"
+            f"（{languages[ref]}: {format_timestamp(starts[ref, c])}"
+            f" --> {format_timestamp(ends[ref, c])}）"
+        ),
+    )
+
+    durations = ends - starts
+    report(
+        "duration",
+        present & (durations <= 0),
+        lambda r, c: f"終了 {format_timestamp(ends[r, c])} が開始より前です",
+    )
+
+    # 次のキューとの関係（番号順に隣り合う2つがともにある所だけ）
+    pairs = present[:, :-1] & present[:, 1:]
+    gaps = starts[:, 1:] - ends[:, :-1]
+    report(
+        "overlap",
+        pairs & (gaps < 0),
+        lambda r, c: f"次のキューと {-gaps[r, c]}ms 重なっています",
+    )
+    report(
+        "gap",
+        pairs & (((gaps > 0) & (gaps < min_gap)) | (gaps > max_gap)),
+        lambda r, c: f"次のキューまで {gaps[r, c]}ms",
+    )
+
+    # 読む速さ（文字数 / 表示秒数）
+    limits = np.array([cps_limits.get(lang, DEFAULT_CPS_LIMIT) for lang in languages])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cps = subs.chars * 1000 / durations
+    report(
+        "cps",
+        present & (durations > 0) & (cps > limits[:, None]),
+        lambda r, c: f"{cps[r, c]:.1f}文字/秒（上限 {limits[r]:g}）",
+    )
+
+    return issues
+
+
+def parse_cps(values: list[str]) -> dict[str, float]:
+    limits = {}
+    for value in values:
+        language, _, limit = value.partition("=")
+        limits[language] = float(limit)
+    return limits
+
+
+def collect_files(inputs: list[Path]) -> list[Path]:
+    files = []
+    for path in inputs or [SUBTITLES_DIR]:
+        files += sorted(path.glob("*.srt")) if path.is_dir() else [path]
+    return files
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="多言語字幕の整合性をチェックする")
+    parser.add_argument("inputs", nargs="*", type=Path, help="字幕ファイルかディレクトリ（既定: subtitles/）")
+    parser.add_argument("--reference", default=REFERENCE_LANGUAGE, help="基準にする言語")
+    parser.add_argument("--drift-tolerance", type=int, default=100, help="許容する時刻のずれ（ミリ秒）")
+    parser.add_argument("--min-gap", type=int, default=67, help="これより短い間隔を警告する（ミリ秒）")
+    parser.add_argument("--max-gap", type=int, default=5000, help="これより長い間隔を警告する（ミリ秒）")
+    parser.add_argument(
+        "--cps", action="append", default=[], metavar="LANG=N", help="言語ごとの文字数/秒の上限"
+    )
+    parser.add_argument("--json", type=Path, default=None, help="結果を JSON で保存する")
+    args = parser.parse_args(argv)
+
+    issues: list[Issue] = []
+    for video, files in group_files(collect_files(args.inputs)).items():
+        subs = load_video(video, files)
+        found = check_video(
+            subs,
+            args.reference,
+            args.drift_tolerance,
+            args.min_gap,
+            args.max_gap,
+            parse_cps(args.cps),
+        )
+        errors = sum(issue.is_error for issue in found)
+        print(
+            f"{video}: {len(subs.languages)}言語 {subs.present.shape[1]}キュー"
+            f"  エラー {errors}件 / 警告 {len(found) - errors}件"
+        )
+        for issue in found:
+            level = "エラー" if issue.is_error else "警告"
+            cue = f"#{issue.cue}" if issue.cue is not None else "-"
+            print(f"  [{level}] {issue.language} {cue:>5} {issue.kind:<9} {issue.message}")
+        issues += found
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(issue) for issue in issues], indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8",
+        )
+    return 1 if any(issue.is_error for issue in issues) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
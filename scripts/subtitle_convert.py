@@ -0,0 +1,181 @@
+"""
+字幕の形式変換（SRT → WebVTT / ASS / TTML）
+
+配信先ごとに求められる字幕形式を subtitles/*.srt から生成する：
+- vtt  : WebVTT（YouTube・ブラウザ）
+- ass  : Advanced SubStation Alpha（言語ごとのフォントと表示位置つき、焼き込みにも使う）
+- ttml : TTML（イベント・VR プラットフォーム向け）
+
+SRT はキューを1つずつ読みながら書き出し、全言語・全形式を並列に変換する。
+出力は実行のたびに同じバイト列になり、内容が変わらないファイルは書き換えない
+（更新時刻も変わらないので、後段のキャッシュが無効にならない）。
+
+使い方:
+  python subtitle_convert.py                      # media/subtitles/ に全形式
+  python subtitle_convert.py -f vtt -f ass
+  python subtitle_convert.py subtitles/1755-lisbon-earthquake-jp.srt -o out/
+"""
+
+from __future__ import annotations
+
+import argparse
+import filecmp
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+from fonts import LANGUAGE_SCRIPTS, primary_font
+from scene_catalog import DEFAULT_MEDIA_DIR
+from subtitles import LANGUAGE_TAGS, SUBTITLES_DIR, Cue, format_timestamp, iter_cues
+
+OUTPUT_DIR = DEFAULT_MEDIA_DIR / "subtitles"
+
+# 1920x1080 を基準にした字幕の見た目（下中央、白文字に黒縁）
+PLAY_RES = (1920, 1080)
+FONT_SIZE = 54
+OUTLINE = 3
+MARGIN_V = 60
+
+
+def subtitle_font(language: str) -> str:
+    """言語の字幕フォント（シーンと同じ連鎖の先頭、知らない言語は日本語のもの）"""
+    return primary_font(language if language in LANGUAGE_SCRIPTS else "jp")
+
+
+def _language(path: Path) -> str:
+    return path.stem.rpartition("-")[2]
+
+
+def write_vtt(cues: Iterable[Cue], out: TextIO, language: str) -> None:
+    out.write("WEBVTT\n")
+    for cue in cues:
+        text = cue.text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        out.write(
+            f"\n{cue.index}\n"
+            f"{format_timestamp(cue.start, '.')} --> {format_timestamp(cue.end, '.')}\n"
+            f"{text}\n"
+        )
+
+
+def _ass_time(ms: int) -> str:
+    """ASS の時刻（H:MM:SS.cc、1/100秒）"""
+    centis = (ms + 5) // 10
+    seconds, centis = divmod(centis, 100)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}.{centis:02d}"
+
+
+def write_ass(cues: Iterable[Cue], out: TextIO, language: str) -> None:
+    width, height = PLAY_RES
+    out.write(
+        "[Script Info]\n"
+        "ScriptType: v4.00+\n"
+        f"PlayResX: {width}\n"
+        f"PlayResY: {height}\n"
+        "WrapStyle: 0\n"
+        "ScaledBorderAndShadow: yes\n"
+        "\n"
+        "[V4+ Styles]\n"
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour,"
+        " BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle,"
+        " BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding\n"
+        f"Style: Default,{subtitle_font(language)},{FONT_SIZE},&H00FFFFFF,&H000000FF,"
+        f"&H00000000,&H80000000,0,0,0,0,100,100,0,0,1,{OUTLINE},0,2,60,60,{MARGIN_V},1\n"
+        "\n"
+        "[Events]\n"
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text\n"
+    )
+    for cue in cues:
+        text = cue.text.replace("{", "\\{").replace("}", "\\}").replace("\n", "\\N")
+        out.write(
+            f"Dialogue: 0,{_ass_time(cue.start)},{_ass_time(cue.end)},Default,,0,0,0,,{text}\n"
+        )
+
+
+def write_ttml(cues: Iterable[Cue], out: TextIO, language: str) -> None:
+    tag = LANGUAGE_TAGS.get(language, language)
+    out.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<tt xmlns="http://www.w3.org/ns/ttml"'
+        ' xmlns:tts="http://www.w3.org/ns/ttml#styling"'
+        f" xml:lang={quoteattr(tag)}>\n"
+        "  <head>\n"
+        "    <styling>\n"
+        f'      <style xml:id="default" tts:fontFamily={quoteattr(subtitle_font(language))}'
+        f' tts:fontSize="{FONT_SIZE * 100 // PLAY_RES[1]}%" tts:color="white"'
+        ' tts:textOutline="black 5%"/>\n'
+        "    </styling>\n"
+        "    <layout>\n"
+        '      <region xml:id="bottom" tts:origin="10% 80%" tts:extent="80% 15%"'
+        ' tts:textAlign="center" tts:displayAlign="after"/>\n'
+        "    </layout>\n"
+        "  </head>\n"
+        '  <body style="default" region="bottom">\n'
+        "    <div>\n"
+    )
+    for cue in cues:
+        text = "<br/>".join(escape(line) for line in cue.text.split("\n"))
+        out.write(
+            f'      <p xml:id="c{cue.index}" begin="{format_timestamp(cue.start, ".")}"'
+            f' end="{format_timestamp(cue.end, ".")}">{text}</p>\n'
+        )
+    out.write("    </div>\n  </body>\n</tt>\n")
+
+
+WRITERS = {"vtt": write_vtt, "ass": write_ass, "ttml": write_ttml}
+
+
+def convert(path: Path, fmt: str, output_dir: Path = OUTPUT_DIR) -> tuple[Path, bool]:
+    """1ファイルを変換する。内容が変わったときだけ置き換え、（出力, 更新したか）を返す"""
+    output = output_dir / f"{path.stem}.{fmt}"
+    tmp = output.with_name(f".{output.name}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8", newline="\n") as out:
+            WRITERS[fmt](iter_cues(path), out, _language(path))
+        if output.exists() and filecmp.cmp(tmp, output, shallow=False):
+            tmp.unlink()
+            return output, False
+        os.replace(tmp, output)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return output, True
+
+
+def convert_all(
+    paths: list[Path],
+    formats: list[str],
+    output_dir: Path = OUTPUT_DIR,
+    jobs: int | None = None,
+) -> list[tuple[Path, bool]]:
+    """全ファイル・全形式を並列に変換する（結果は入力と形式の順）"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [(path, fmt) for path in paths for fmt in formats]
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        return list(pool.map(lambda task: convert(*task, output_dir), tasks))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="SRT 字幕を WebVTT / ASS / TTML に変換する")
+    parser.add_argument("files", nargs="*", type=Path, help="字幕ファイル（既定: subtitles/*.srt）")
+    parser.add_argument(
+        "-f", "--format", dest="formats", action="append", choices=sorted(WRITERS),
+        help="出力形式（複数指定可、既定: すべて）",
+    )
+    parser.add_argument("-o", "--output-dir", type=Path, default=OUTPUT_DIR)
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="並列数（既定: CPUコア数）")
+    args = parser.parse_args(argv)
+
+    paths = args.files or sorted(SUBTITLES_DIR.glob("*.srt"))
+    formats = args.formats or list(WRITERS)
+    for output, updated in convert_all(paths, formats, args.output_dir, args.jobs):
+        print(f"{'更新' if updated else '変更なし'}: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
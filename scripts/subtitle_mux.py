@@ -0,0 +1,109 @@
+"""
+字幕トラックの多重化（ソフトサブ）
+
+完成した動画に subtitles/*.srt を切り替え可能な字幕トラックとして付け、
+言語ごとの納品ファイルを作る：
+- 映像・音声はストリームコピー（再エンコードしない）
+- MP4 は mov_text、MKV は srt のまま字幕トラックにする
+- 各トラックに ISO 639-2 の言語コードと表示名を付ける
+- 納品ファイルごとにその言語のトラックを先頭に置き、既定（default）にする
+
+コピーだけなので、全言語分を並列に作っても数秒で終わる。
+
+使い方:
+  python subtitle_mux.py media/final.mp4                     # media/deliverables/ に MP4
+  python subtitle_mux.py media/final.mp4 --container mkv -l jp -l en
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from ffmpeg_tools import run_ffmpeg
+from scene_catalog import DEFAULT_MEDIA_DIR
+from subtitles import DEFAULT_VIDEO, ISO639_2, LANGUAGE_NAMES, LANGUAGES, subtitle_path
+
+OUTPUT_DIR = DEFAULT_MEDIA_DIR / "deliverables"
+
+# コンテナごとの字幕コーデック
+SUBTITLE_CODECS = {"mp4": "mov_text", "mkv": "srt"}
+
+
+def mux_command(
+    video: Path,
+    subtitles: dict[str, Path],
+    default: str,
+    output: Path,
+    container: str,
+) -> list[str]:
+    """字幕トラックを付ける ffmpeg の引数（default の言語を先頭・既定にする）"""
+    languages = [default] + [lang for lang in subtitles if lang != default]
+    args = ["-i", str(video)]
+    for lang in languages:
+        args += ["-i", str(subtitles[lang])]
+    args += ["-map", "0:v", "-map", "0:a?"]
+    for number in range(1, len(languages) + 1):
+        args += ["-map", f"{number}:s"]
+    args += ["-c", "copy", "-c:s", SUBTITLE_CODECS[container]]
+    for index, lang in enumerate(languages):
+        args += [
+            f"-metadata:s:s:{index}", f"language={ISO639_2.get(lang, lang)}",
+            f"-metadata:s:s:{index}", f"title={LANGUAGE_NAMES.get(lang, lang)}",
+            f"-disposition:s:{index}", "default" if lang == default else "0",
+        ]
+    if container == "mp4":
+        args += ["-movflags", "+faststart"]
+    return [*args, str(output)]
+
+
+def mux_all(
+    video: Path,
+    languages: list[str],
+    container: str = "mp4",
+    output_dir: Path = OUTPUT_DIR,
+    subtitle_video: str = DEFAULT_VIDEO,
+    jobs: int | None = None,
+) -> dict[str, Path]:
+    """言語ごとの納品ファイルを並列に作る"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    subtitles = {lang: subtitle_path(lang, subtitle_video) for lang in LANGUAGES}
+    outputs = {lang: output_dir / f"{video.stem}-{lang}.{container}" for lang in languages}
+
+    def mux(lang: str) -> None:
+        run_ffmpeg(mux_command(video, subtitles, lang, outputs[lang], container))
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        list(pool.map(mux, languages))
+    return outputs
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="完成動画に全言語の字幕トラックを付ける")
+    parser.add_argument("video", type=Path, help="完成した動画")
+    parser.add_argument("--container", choices=sorted(SUBTITLE_CODECS), default="mp4")
+    parser.add_argument(
+        "-l", "--language", dest="languages", action="append", choices=LANGUAGES,
+        help="納品ファイルを作る言語（複数指定可、既定: すべて）",
+    )
+    parser.add_argument("-o", "--output-dir", type=Path, default=OUTPUT_DIR)
+    parser.add_argument("--subtitles", default=DEFAULT_VIDEO, help="字幕ファイル名の動画部分")
+    args = parser.parse_args(argv)
+
+    outputs = mux_all(
+        args.video,
+        args.languages or list(LANGUAGES),
+        args.container,
+        args.output_dir,
+        args.subtitles,
+    )
+    for lang, output in outputs.items():
+        print(f"{lang}: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
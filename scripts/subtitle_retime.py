@@ -0,0 +1,200 @@
+"""
+字幕の一括リタイミング
+
+全言語の字幕ファイルに同じ時刻の編集をまとめて適用する：
+- offset  : 全体を Δ ミリ秒ずらす
+- stretch : 基準時刻を中心に倍率をかけて伸縮する
+- ripple  : 時刻 t 以降を Δ ミリ秒ずらす（シーンの長さが変わったとき）
+
+各ファイルは1回だけ先頭から読み、時刻の行だけを書き換えて一時ファイルに書き出し、
+os.replace で置き換える。キュー番号・本文・改行コード（CRLF）・BOM はバイト単位で保つ。
+
+scene_timeline.py --json の新旧2つの出力を渡すと、長さの変わったシーンごとに
+「そのシーンの次のナレーションが始まるキュー」から ripple をかける。
+
+使い方:
+  python subtitle_retime.py --offset 500
+  python subtitle_retime.py --ripple 00:11:45,900=+1200 --stretch 1.001@0
+  python scene_timeline.py --json old.json     # 編集前
+  python scene_timeline.py --json new.json     # 編集後
+  python subtitle_retime.py --timeline old.json new.json --scene-cue DamageEstimation=17
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from subtitles import SUBTITLES_DIR, SubtitleTrack, format_timestamp, parse_timestamp, subtitle_path
+
+TIMING_LINE = re.compile(
+    rb"^(?P<head>\s*)(?P<start>\d+:\d{2}:\d{2}(?P<sep>[,.])\d{3})"
+    rb"(?P<arrow>\s*-->\s*)(?P<end>\d+:\d{2}:\d{2}[,.]\d{3})(?P<tail>.*)$",
+    re.DOTALL,
+)
+
+
+@dataclass(frozen=True)
+class Edit:
+    """時刻の編集1つ（時刻はミリ秒）"""
+
+    kind: str
+    amount: float
+    at: int = 0
+
+    def apply(self, ms: int) -> int:
+        if self.kind == "offset":
+            ms += self.amount
+        elif self.kind == "stretch":
+            ms = self.at + (ms - self.at) * self.amount
+        elif self.kind == "ripple":
+            if ms >= self.at:
+                ms += self.amount
+        else:
+            raise ValueError(f"不明な編集です: {self.kind}")
+        return max(0, round(ms))
+
+
+def apply_edits(edits: list[Edit], ms: int) -> int:
+    for edit in edits:
+        ms = edit.apply(ms)
+    return ms
+
+
+def parse_time(text: str) -> int:
+    """「00:11:45,900」か「11:45.900」かミリ秒の整数を受け付ける"""
+    text = text.strip()
+    if text.lstrip("+-").isdigit():
+        return int(text)
+    if text.count(":") == 1:
+        text = "0:" + text
+    return parse_timestamp(text)
+
+
+def retime_file(path: Path, edits: list[Edit], dry_run: bool = False) -> int:
+    """1ファイルの時刻の行を書き換え、変わったキューの数を返す"""
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(path, "rb") as src, open(os.devnull if dry_run else tmp, "wb") as dst:
+            changed = _retime_lines(src, dst, edits)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    if not dry_run:
+        os.replace(tmp, path)
+    return changed
+
+
+def _retime_lines(src, dst, edits: list[Edit]) -> int:
+    changed = 0
+    for line in src:
+        match = TIMING_LINE.match(line)
+        if match is None:
+            dst.write(line)
+            continue
+        start = parse_timestamp(match["start"].decode())
+        end = parse_timestamp(match["end"].decode())
+        new_start = apply_edits(edits, start)
+        new_end = max(new_start, apply_edits(edits, end))
+        if (new_start, new_end) == (start, end):
+            dst.write(line)
+            continue
+        changed += 1
+        sep = match["sep"].decode()
+        dst.write(
+            match["head"]
+            + format_timestamp(new_start, sep).encode()
+            + match["arrow"]
+            + format_timestamp(new_end, sep).encode()
+            + match["tail"]
+        )
+    return changed
+
+
+def timeline_ripples(
+    old: dict,
+    new: dict,
+    scene_cues: dict[str, int],
+    reference: SubtitleTrack,
+) -> list[Edit]:
+    """新旧のタイムラインから、長さの変わったシーンごとの ripple を求める"""
+    edits = []
+    for scene, cue in scene_cues.items():
+        before = old["scenes"][scene]["duration"]
+        after = new["scenes"][scene]["duration"]
+        delta = round((after - before) * 1000)
+        if delta:
+            at = reference.starts[reference.position_of(cue)]
+            edits.append(Edit("ripple", delta, at))
+    # 後ろの編集から適用すれば、前の ripple で基準時刻がずれない
+    return sorted(edits, key=lambda edit: edit.at, reverse=True)
+
+
+class _EditAction(argparse.Action):
+    """--offset / --stretch / --ripple を指定した順に1つのリストへ集める"""
+
+    def __call__(self, parser, namespace, value, option_string=None):
+        edits = getattr(namespace, self.dest) or []
+        kind = option_string.lstrip("-")
+        try:
+            if kind == "offset":
+                edit = Edit("offset", parse_time(value))
+            elif kind == "stretch":
+                factor, _, anchor = value.partition("@")
+                edit = Edit("stretch", float(factor), parse_time(anchor) if anchor else 0)
+            else:
+                at, _, delta = value.partition("=")
+                edit = Edit("ripple", parse_time(delta), parse_time(at))
+        except ValueError as error:
+            parser.error(f"{option_string} {value}: {error}")
+        setattr(namespace, self.dest, [*edits, edit])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="全言語の字幕の時刻をまとめて編集する")
+    parser.add_argument("files", nargs="*", type=Path, help="字幕ファイル（既定: subtitles/*.srt）")
+    parser.add_argument("--offset", dest="edits", action=_EditAction, metavar="MS", help="全体をずらす")
+    parser.add_argument(
+        "--stretch", dest="edits", action=_EditAction, metavar="倍率[@基準時刻]", help="伸縮する"
+    )
+    parser.add_argument(
+        "--ripple", dest="edits", action=_EditAction, metavar="時刻=MS", help="時刻以降をずらす"
+    )
+    parser.add_argument(
+        "--timeline", nargs=2, type=Path, metavar=("OLD", "NEW"), help="scene_timeline.py の JSON"
+    )
+    parser.add_argument(
+        "--scene-cue", action="append", default=[], metavar="シーン=キュー番号",
+        help="シーンの次のナレーションが始まるキュー",
+    )
+    parser.add_argument("--reference", default="jp", help="--timeline で時刻を引く字幕の言語")
+    parser.add_argument("--dry-run", action="store_true", help="書き換えずに件数だけ表示する")
+    args = parser.parse_args(argv)
+
+    edits = list(args.edits or [])
+    if args.timeline:
+        old, new = (json.loads(path.read_text(encoding="utf-8")) for path in args.timeline)
+        scene_cues = {}
+        for item in args.scene_cue:
+            scene, _, cue = item.partition("=")
+            scene_cues[scene] = int(cue)
+        reference = SubtitleTrack.from_file(subtitle_path(args.reference))
+        edits += timeline_ripples(old, new, scene_cues, reference)
+    if not edits:
+        parser.error("編集が指定されていません")
+
+    for edit in edits:
+        print(f"{edit.kind:<7} {edit.amount:+g} @ {format_timestamp(edit.at)}")
+    for path in args.files or sorted(SUBTITLES_DIR.glob("*.srt")):
+        changed = retime_file(path, edits, args.dry_run)
+        print(f"{path.name}: {changed}キュー")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+字幕のキューに合わせてアニメーションの長さを決める
+
+シーンの時刻 0 を字幕のキューに対応付け（subtitle_origin_cue）、
+以降の self.play / self.wait の長さを「何番のキューまで」で指定できるようにする：
+- wait_until_cue(n)       : キュー n の開始まで待つ
+- play_until_cue(n, ...)  : キュー n の開始で終わるように run_time を決めて再生する
+- cue_time(n)             : キュー n のシーン内の時刻（秒）
+
+長さは描画前にキューの時刻から求め、実際の動画と同じくフレーム単位で数える
+（manim のアニメーションキャッシュや -n で飛ばした区間があってもずれない）。
+字幕ファイルは data_files() で宣言しているので、キューを打ち直すとレンダリングの
+キャッシュも無効になる。
+既にキューの時刻を過ぎていたら警告を出し、1フレームだけ再生する。
+
+キューに合わせた区切りは記録しておき、このスクリプトを実行すると scene_timeline.py の
+NullRenderer で CueSyncedScene のシーンを描画せずに最後まで実行し、各区切りが
+字幕の時刻（半フレーム以内）に終わっているかを確かめる。
+
+使い方:
+  from manim import *
+  from subtitle_timing import CueSyncedScene
+
+  class TripleDisaster(CueSyncedScene):
+      subtitle_origin_cue = 17        # シーンの 0 秒 = キュー17の開始
+
+      def construct(self):
+          ...
+          self.wait_until_cue(18, offset=-1.0)   # キュー18の1秒前まで待つ
+          self.wait_until_cue(20, edge="end")
+
+  python subtitle_timing.py                    # CueSyncedScene の全シーンを確認
+  python subtitle_timing.py TripleDisaster
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from manim import Scene, Wait, config, logger
+
+from scene_catalog import discover_scenes, load_scene_class, select_scenes
+from subtitles import SubtitleTrack, subtitle_path
+
+# タイミングの基準にする字幕（ナレーション原稿の日本語版）
+DEFAULT_SUBTITLE_FILE = subtitle_path("jp")
+
+_TRACK_CACHE: dict[Path, SubtitleTrack] = {}
+
+
+def load_track(path: Path) -> SubtitleTrack:
+    """字幕ファイルを読む（プロセス内でキャッシュ）"""
+    path = Path(path).resolve()
+    if path not in _TRACK_CACHE:
+        _TRACK_CACHE[path] = SubtitleTrack.from_file(path)
+    return _TRACK_CACHE[path]
+
+
+@dataclass
+class CueMark:
+    """キューに合わせた区切り1つ（target はシーン内の時刻、秒）"""
+
+    cue: int
+    edge: str
+    offset: float
+    target: float
+    site: str = ""
+    actual: float | None = None  # 検査で求めた、その play / wait の終了時刻
+    frame_dt: float = 0.0  # 検査したときの1フレームの長さ
+
+    @property
+    def on_time(self) -> bool:
+        """終了時刻が目標から半フレーム以内か"""
+        return abs(self.actual - self.target) <= self.frame_dt / 2
+
+
+class CueSyncedScene(Scene):
+    """字幕のキューを基準に play / wait の長さを決めるシーン"""
+
+    # 字幕ファイルと、シーンの 0 秒に対応するキュー番号
+    subtitle_file: Path = DEFAULT_SUBTITLE_FILE
+    subtitle_origin_cue: int = 1
+    # シーンの開始をキューの開始からずらす秒数（負ならキューより前に始まる）
+    subtitle_origin_offset: float = 0.0
+
+    @classmethod
+    def data_files(cls) -> list[Path]:
+        """描画結果に影響するデータファイル（render_cache がキャッシュキーに入れる）"""
+        return [Path(cls.subtitle_file)]
+
+    def setup(self):
+        super().setup()
+        self.subtitles = load_track(self.subtitle_file)
+        self.elapsed_frames = 0
+        self.cue_marks: list[CueMark] = []
+
+    @property
+    def frame_dt(self) -> float:
+        return 1 / config.frame_rate
+
+    def cue_time(self, index: int, edge: str = "start", offset: float = 0.0) -> float:
+        """キューの開始（edge="end" なら終了）のシーン内の時刻"""
+        if edge not in ("start", "end"):
+            raise ValueError(f"edge は start か end です: {edge!r}")
+        track = self.subtitles
+        times = track.starts if edge == "start" else track.ends
+        origin = track.starts[track.position_of(self.subtitle_origin_cue)] / 1000
+        origin += self.subtitle_origin_offset
+        return times[track.position_of(index)] / 1000 - origin + offset
+
+    def _frames_until(self, index: int, edge: str, offset: float) -> int:
+        """キューの時刻までの残りフレーム数（過ぎていれば警告して 1）"""
+        target = round(self.cue_time(index, edge, offset) / self.frame_dt)
+        frames = target - self.elapsed_frames
+        if frames < 1:
+            logger.warning(
+                "%s: キュー%d（%s）を %.2f秒 過ぎています",
+                type(self).__name__,
+                index,
+                edge,
+                (1 - frames) * self.frame_dt,
+            )
+            frames = 1
+        return frames
+
+    def play(self, *args, **kwargs):
+        super().play(*args, **kwargs)
+        # 実際の描画と同じ規則でフレーム数を数える
+        if self.is_current_animation_frozen_frame():
+            self.elapsed_frames += int(self.duration / self.frame_dt)
+        else:
+            self.elapsed_frames += len(np.arange(0, self.duration, self.frame_dt))
+
+    def _has_time_based_updaters(self) -> bool:
+        return bool(
+            self.always_update_mobjects
+            or self.updaters
+            or any(mob.has_time_based_updater() for mob in self.get_mobject_family_members())
+        )
+
+    def wait_until_cue(self, index: int, edge: str = "start", offset: float = 0.0) -> None:
+        """キューの時刻まで待つ"""
+        frames = self._frames_until(index, edge, offset)
+        self._mark(index, edge, offset)
+        frozen = not self._has_time_based_updaters()
+        # フレーム数の数え方（切り捨て / 切り上げ）に合わせて半フレームずらす
+        duration = (frames + 0.5 if frozen else frames - 0.5) * self.frame_dt
+        self.play(Wait(run_time=duration, frozen_frame=frozen))
+
+    def play_until_cue(
+        self,
+        index: int,
+        *animations,
+        edge: str = "start",
+        offset: float = 0.0,
+        **kwargs,
+    ) -> None:
+        """キューの時刻に終わるように run_time を決めて再生する"""
+        frames = self._frames_until(index, edge, offset)
+        self._mark(index, edge, offset)
+        self.play(*animations, run_time=(frames - 0.5) * self.frame_dt, **kwargs)
+
+    def _mark(self, index: int, edge: str, offset: float) -> None:
+        self.cue_marks.append(CueMark(index, edge, offset, self.cue_time(index, edge, offset)))
+
+
+def check_cues(spec) -> list[CueMark]:
+    """描画せずにシーンを実行し、キューに合わせた各区切りの実際の終了時刻を求める"""
+    from scene_timeline import run_null
+
+    marks: list[CueMark] = []
+
+    def on_play(scene, entry) -> None:
+        # wait_until_cue / play_until_cue は play の前に区切りを記録する
+        pending = scene.cue_marks[len(marks) :]
+        if pending:
+            mark = pending[-1]
+            mark.actual = entry.end
+            mark.site = entry.site
+            mark.frame_dt = 1 / config.frame_rate
+            marks.append(mark)
+
+    run_null(spec, "l", on_play=on_play)
+    return marks
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="字幕のキューとシーンのタイミングのずれを調べる")
+    parser.add_argument(
+        "scenes", nargs="*", help="対象のシーン名（省略時は CueSyncedScene の全シーン）"
+    )
+    args = parser.parse_args(argv)
+
+    # スクリプトとして実行するとこのモジュールは __main__ になり、シーンが継承する
+    # subtitle_timing.CueSyncedScene とは別のクラスになるので名前で判定する
+    specs = [
+        spec
+        for spec in select_scenes(discover_scenes(), args.scenes)
+        if any(cls.__name__ == "CueSyncedScene" for cls in load_scene_class(spec).__mro__)
+    ]
+    failures = 0
+    for spec in specs:
+        marks = check_cues(spec)
+        print(f"{spec.name}: {len(marks)}か所")
+        for mark in marks:
+            failures += not mark.on_time
+            status = "OK" if mark.on_time else "NG"
+            print(
+                f"  {status} キュー{mark.cue}（{mark.edge}{mark.offset:+.2f}秒）"
+                f" 目標 {mark.target:7.3f}秒 実際 {mark.actual:7.3f}秒 {mark.site}"
+            )
+    print(f"{len(specs)}シーン: ずれ {failures}か所")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
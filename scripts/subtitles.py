@@ -0,0 +1,195 @@
+"""
+字幕ファイル（subtitles/*.srt）の読み込みと検索
+
+SRT を1行ずつ読みながらキュー（番号・開始・終了・本文）を返す。
+時刻はミリ秒単位の整数で扱う。
+
+SubtitleTrack は1ファイル分のキューを配列にまとめて保持する：
+- 番号・開始・終了は array('q')、本文は1つの文字列とオフセットの配列
+- 開始時刻の二分探索と「終了時刻の累積最大」で、ある時刻に表示中のキューや
+  ある区間に重なるキューを O(log n + 件数) で求める
+
+使い方:
+  track = SubtitleTrack.load("jp")
+  track.active_at(81_500)            # 81.5秒に表示中のキューの位置
+  track.overlapping(60_000, 90_000)  # 1:00〜1:30 に重なるキューの位置
+  track.cue(track.position_of(13))   # キュー番号13
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+SUBTITLES_DIR = Path(__file__).resolve().parent.parent / "subtitles"
+DEFAULT_VIDEO = "1755-lisbon-earthquake"
+LANGUAGES = ("en", "es", "jp", "ko", "ru", "zh")
+
+# ファイル名の言語コードと BCP 47 の言語タグ（中国語字幕は繁体字）
+LANGUAGE_TAGS = {"en": "en", "es": "es", "jp": "ja", "ko": "ko", "ru": "ru", "zh": "zh-Hant"}
+# 動画コンテナのトラックに付ける ISO 639-2 の言語コードと表示名
+ISO639_2 = {"en": "eng", "es": "spa", "jp": "jpn", "ko": "kor", "ru": "rus", "zh": "zho"}
+LANGUAGE_NAMES = {
+    "en": "English",
+    "es": "Español",
+    "jp": "日本語",
+    "ko": "한국어",
+    "ru": "Русский",
+    "zh": "中文（繁體）",
+}
+
+TIMESTAMP = re.compile(r"(\d+):(\d{2}):(\d{2})[,.](\d{3})")
+ARROW = "-->"
+
+
+@dataclass(frozen=True)
+class Cue:
+    """字幕の1キュー（時刻はミリ秒）"""
+
+    index: int
+    start: int
+    end: int
+    text: str
+
+
+def parse_timestamp(text: str) -> int:
+    """「00:01:21,433」をミリ秒に変換する"""
+    match = TIMESTAMP.fullmatch(text.strip())
+    if match is None:
+        raise ValueError(f"時刻の形式が不正です: {text!r}")
+    hours, minutes, seconds, millis = map(int, match.groups())
+    return ((hours * 60 + minutes) * 60 + seconds) * 1000 + millis
+
+
+def format_timestamp(ms: int, separator: str = ",") -> str:
+    """ミリ秒を「00:01:21,433」の形式にする"""
+    seconds, millis = divmod(ms, 1000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{separator}{millis:03d}"
+
+
+def subtitle_path(language: str, video: str = DEFAULT_VIDEO) -> Path:
+    """言語コードから字幕ファイルのパスを求める"""
+    return SUBTITLES_DIR / f"{video}-{language}.srt"
+
+
+def iter_cues(path: Path) -> Iterator[Cue]:
+    """SRT ファイルを1行ずつ読み、キューを順に返す"""
+    # utf-8-sig で BOM を、universal newlines で CRLF を吸収する
+    with open(path, encoding="utf-8-sig") as fp:
+        index = None
+        timing: tuple[int, int] | None = None
+        lines: list[str] = []
+        for raw in fp:
+            line = raw.rstrip("\n")
+            if index is None:
+                if line.strip():
+                    index = int(line)
+            elif timing is None:
+                head, _, tail = line.partition(ARROW)
+                timing = parse_timestamp(head), parse_timestamp(tail.split()[0])
+            elif line.strip():
+                lines.append(line)
+            else:
+                yield Cue(index, *timing, "\n".join(lines))
+                index = timing = None
+                lines = []
+        if index is not None and timing is not None:
+            yield Cue(index, *timing, "\n".join(lines))
+
+
+class SubtitleTrack:
+    """1つの字幕ファイルのキューを開始時刻順に配列で保持する"""
+
+    def __init__(self, cues: Iterable[Cue], path: Path | None = None) -> None:
+        self.path = path
+        self.numbers = array("q")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.text_offsets = array("q", [0])
+        pieces: list[str] = []
+        length = 0
+        for cue in cues:
+            self.numbers.append(cue.index)
+            self.starts.append(cue.start)
+            self.ends.append(cue.end)
+            pieces.append(cue.text)
+            length += len(cue.text)
+            self.text_offsets.append(length)
+        self._text = "".join(pieces)
+
+        if any(a > b for a, b in zip(self.starts, self.starts[1:])):
+            self._sort_by_start()
+
+        # max_ends[i] = max(ends[0..i])。単調増加なので二分探索できる
+        self.max_ends = array("q")
+        running = -1
+        for end in self.ends:
+            running = max(running, end)
+            self.max_ends.append(running)
+
+    def _sort_by_start(self) -> None:
+        order = sorted(range(len(self.starts)), key=self.starts.__getitem__)
+        texts = [self.text(i) for i in order]
+        self.numbers = array("q", (self.numbers[i] for i in order))
+        self.starts = array("q", (self.starts[i] for i in order))
+        self.ends = array("q", (self.ends[i] for i in order))
+        self.text_offsets = array("q", [0])
+        length = 0
+        for text in texts:
+            length += len(text)
+            self.text_offsets.append(length)
+        self._text = "".join(texts)
+
+    @classmethod
+    def from_file(cls, path: Path) -> SubtitleTrack:
+        return cls(iter_cues(path), Path(path))
+
+    @classmethod
+    def load(cls, language: str, video: str = DEFAULT_VIDEO) -> SubtitleTrack:
+        return cls.from_file(subtitle_path(language, video))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Cue]:
+        return (self.cue(i) for i in range(len(self)))
+
+    def text(self, position: int) -> str:
+        return self._text[self.text_offsets[position] : self.text_offsets[position + 1]]
+
+    def cue(self, position: int) -> Cue:
+        """position 番目（0 始まり、開始時刻順）のキュー"""
+        return Cue(
+            self.numbers[position],
+            self.starts[position],
+            self.ends[position],
+            self.text(position),
+        )
+
+    def position_of(self, number: int) -> int:
+        """キュー番号から位置を求める"""
+        # 番号は通常 1 から連番なので、まずその位置を確かめる
+        guess = number - 1
+        if 0 <= guess < len(self) and self.numbers[guess] == number:
+            return guess
+        try:
+            return self.numbers.index(number)
+        except ValueError:
+            raise KeyError(f"キュー番号 {number} がありません") from None
+
+    def active_at(self, ms: int) -> list[int]:
+        """時刻 ms に表示中のキューの位置（start <= ms < end）"""
+        return self.overlapping(ms, ms + 1)
+
+    def overlapping(self, start: int, end: int) -> list[int]:
+        """区間 [start, end) に重なるキューの位置"""
+        # start 以前に終わるキューは累積最大で、end 以降に始まるキューは開始時刻で除く
+        lo = bisect_right(self.max_ends, start)
+        hi = bisect_left(self.starts, end)
+        return [i for i in range(lo, hi) if self.ends[i] > start]
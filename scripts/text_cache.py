@@ -0,0 +1,232 @@
+"""
+Text の形状キャッシュ（シーン・実行をまたいで共有）
+
+manim の Text は毎回 Pango の SVG を読み直して、グリフごとのパスを点列に変換する。
+同じ文字列・フォント・サイズ・太さ・行間・色の Text は同じ点列になるので、
+変換後の点列とスタイルを media/text_cache/<キー>.npz に保存して使い回す：
+- キャッシュにあれば SVG の生成も読み込みもせず、点列をそのまま submobject にする
+- プロセス内ではさらに最近使ったものをメモリに持つ
+- ディスクの合計が上限を超えたら、最後に使われたのが古いものから消す（LRU）
+
+*Simple の版は通常版と同じ見出しや箇条書きを描くので、後から描く方はほぼすべて
+キャッシュから読み込まれる。
+
+使い方:
+  from text_cache import CachedText
+  title = CachedText(_("被害想定"), font_size=72, color=WHITE)   # Text と同じ引数
+
+  python text_cache.py               # エントリ数と合計サイズを表示
+  python text_cache.py --clear       # キャッシュを消す
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from manim import Text, VMobject, config
+from manim.utils.color import ManimColor
+
+from render_cache import manim_version
+from scene_catalog import DEFAULT_MEDIA_DIR
+
+CACHE_DIR = DEFAULT_MEDIA_DIR / "text_cache"
+
+# ディスクに置く合計サイズの上限と、メモリに持つエントリ数
+MAX_BYTES = 256 * 1024 * 1024
+MEMORY_ENTRIES = 512
+
+# 保存形式を変えたら上げる（古いエントリは別のキーになる）
+FORMAT_VERSION = 1
+
+# キャッシュにあるときに Text に渡す空の SVG（manim が読み書きするだけで描画には使わない）
+_EMPTY_SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="0" height="0"></svg>\n'
+
+
+@dataclass
+class Glyphs:
+    """1つの Text のグリフごとの点列とスタイル"""
+
+    points: np.ndarray  # (点の数, 3)、全グリフを連結
+    offsets: np.ndarray  # (グリフ数 + 1,)、points の区切り
+    fill: np.ndarray  # (グリフ数, 4)、RGBA
+    stroke: np.ndarray  # (グリフ数, 4)、RGBA
+    stroke_width: np.ndarray  # (グリフ数,)
+
+    @classmethod
+    def from_mobjects(cls, mobjects: list[VMobject]) -> Glyphs:
+        counts = [len(mob.points) for mob in mobjects]
+        points = [mob.points for mob in mobjects] or [np.zeros((0, 3))]
+        return cls(
+            points=np.concatenate(points),
+            offsets=np.concatenate([[0], np.cumsum(counts)]).astype(np.int64),
+            fill=np.array(
+                [[*mob.get_fill_color().to_rgb(), mob.get_fill_opacity()] for mob in mobjects]
+            ).reshape(-1, 4),
+            stroke=np.array(
+                [[*mob.get_stroke_color().to_rgb(), mob.get_stroke_opacity()] for mob in mobjects]
+            ).reshape(-1, 4),
+            stroke_width=np.array([mob.get_stroke_width() for mob in mobjects], dtype=float),
+        )
+
+    def to_mobjects(self) -> list[VMobject]:
+        mobjects = []
+        for i, (start, end) in enumerate(zip(self.offsets[:-1], self.offsets[1:])):
+            mob = VMobject()
+            mob.set_points(self.points[start:end].copy())
+            mob.set_style(
+                fill_color=ManimColor(self.fill[i, :3]),
+                fill_opacity=float(self.fill[i, 3]),
+                stroke_color=ManimColor(self.stroke[i, :3]),
+                stroke_opacity=float(self.stroke[i, 3]),
+                stroke_width=float(self.stroke_width[i]),
+            )
+            mobjects.append(mob)
+        return mobjects
+
+
+class GlyphCache:
+    """npz ファイルとメモリの2段の LRU キャッシュ"""
+
+    def __init__(
+        self,
+        directory: Path = CACHE_DIR,
+        max_bytes: int = MAX_BYTES,
+        memory_entries: int = MEMORY_ENTRIES,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.memory: OrderedDict[str, Glyphs] = OrderedDict()
+
+    def path(self, key: str) -> Path:
+        return self.directory / f"{key}.npz"
+
+    def empty_svg(self) -> Path:
+        path = self.directory / "empty.svg"
+        if not path.exists():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path.write_text(_EMPTY_SVG, encoding="utf-8")
+        return path
+
+    def get(self, key: str) -> Glyphs | None:
+        glyphs = self.memory.get(key)
+        if glyphs is not None:
+            self.memory.move_to_end(key)
+            return glyphs
+        path = self.path(key)
+        try:
+            with np.load(path) as data:
+                glyphs = Glyphs(**{name: data[name] for name in data.files})
+            # 最後に使った時刻として更新時刻を進める（LRU の順序に使う）
+            os.utime(path)
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # 無い・他のプロセスが消した・壊れている、はどれも未登録として扱う
+            return None
+        self._remember(key, glyphs)
+        return glyphs
+
+    def put(self, key: str, glyphs: Glyphs) -> None:
+        self._remember(key, glyphs)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key)
+        tmp = path.with_name(f".{key}.{os.getpid()}.tmp.npz")
+        try:
+            np.savez(tmp, **vars(glyphs))
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self.evict()
+
+    def _remember(self, key: str, glyphs: Glyphs) -> None:
+        self.memory[key] = glyphs
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def entries(self) -> list[tuple[Path, os.stat_result]]:
+        """ディスクのエントリを最後に使われたのが古い順に返す"""
+        entries = []
+        for path in self.directory.glob("*.npz"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        entries.sort(key=lambda entry: entry[1].st_mtime_ns)
+        return entries
+
+    def evict(self) -> int:
+        """合計が上限を超えていれば古いエントリから消し、消した数を返す"""
+        entries = self.entries()
+        total = sum(stat.st_size for _, stat in entries)
+        removed = 0
+        for path, stat in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            removed += 1
+        return removed
+
+
+_cache = GlyphCache()
+
+
+class CachedText(Text):
+    """形状をキャッシュする Text（引数・見た目は Text と同じ）"""
+
+    def _text2svg(self, color) -> str:
+        self._glyph_key = self._geometry_key(color)
+        self._cached_glyphs = _cache.get(self._glyph_key)
+        if self._cached_glyphs is not None:
+            return str(_cache.empty_svg())
+        return super()._text2svg(color)
+
+    def _geometry_key(self, color) -> str:
+        """manim の SVG のキー（文字列・フォント・サイズ・太さ・行間・色など）に描画方式を加える"""
+        payload = [
+            self._text2hash(color),
+            str(config.renderer),
+            manim_version(),
+            FORMAT_VERSION,
+        ]
+        return hashlib.sha256(json.dumps(payload).encode()).hexdigest()[:24]
+
+    def init_svg_mobject(self, use_svg_cache: bool) -> None:
+        if self._cached_glyphs is not None:
+            self.add(*self._cached_glyphs.to_mobjects())
+            return
+        super().init_svg_mobject(use_svg_cache)
+        # この後 Text が点列を閉じて縮尺を掛けるので、その前の状態を保存する
+        _cache.put(self._glyph_key, Glyphs.from_mobjects(list(self.submobjects)))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Text の形状キャッシュを管理する")
+    parser.add_argument("--clear", action="store_true", help="キャッシュを消す")
+    args = parser.parse_args(argv)
+
+    entries = _cache.entries()
+    if args.clear:
+        for path, _ in entries:
+            path.unlink(missing_ok=True)
+        print(f"{len(entries)}件を削除: {CACHE_DIR}")
+        return 0
+    total = sum(stat.st_size for _, stat in entries)
+    print(
+        f"{len(entries)}件 {total / 1024 / 1024:.1f}MiB"
+        f"（上限 {MAX_BYTES / 1024 / 1024:.0f}MiB）: {CACHE_DIR}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+訳文に合わせた文字サイズの自動調整
+
+訳文は日本語の原文より長くなることが多く、原文に合わせた font_size のままだと
+画面や枠からはみ出す。枠（幅・高さ）に収まる最大の font_size を選ぶ：
+- Pango の描画結果の大きさは font_size に比例するので、文字列ごとに基準サイズで
+  1回だけ測り、候補のサイズはそこから計算する（候補ごとに Text を作らない）
+- 測った大きさは media/text_metrics.json に保存し、次の実行からは Text を作らずに済む
+- 収まるときは指定どおりの font_size のまま（原文の見た目は変わらない）
+- ラベルと本文を横に並べた行は1つずつ収めても合わせてはみ出しうるので、
+  並べて置いた後のグループを fit_to_frame でまとめて縮める
+
+使い方:
+  from text_fit import FittedText, column_width, fit_to_frame
+  line = FittedText(_("• 震源: 大西洋、サン・ヴィンセント岬沖 約220km"), font_size=32)
+  left = FittedText(_("神学的解釈"), font_size=36, max_width=column_width(2))
+
+  size = fit_font_size(_("被害想定"), 72, max_width=6.0)   # サイズだけ欲しいとき
+
+  row = VGroup(label, value).arrange(RIGHT, buff=0.3).move_to(UP)
+  fit_to_frame(row)                        # 並べた行が画面からはみ出すときだけ縮めて寄せる
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+
+from manim import DEFAULT_FONT_SIZE, LEFT, NORMAL, RIGHT, Mobject, config, logger
+
+from fonts import scene_font
+from render_cache import manim_version
+from scene_catalog import DEFAULT_MEDIA_DIR
+from text_cache import CachedText
+
+METRICS_PATH = DEFAULT_MEDIA_DIR / "text_metrics.json"
+
+# 大きさを測るときの font_size
+REFERENCE_SIZE = DEFAULT_FONT_SIZE
+
+# 画面の左右・上下に空ける余白（manim の単位）
+FRAME_MARGIN = 0.5
+
+# これより小さくはしない（読めなくなるので、はみ出しは layout_check で見つける）
+MIN_FONT_SIZE = 14
+
+# 選んだサイズはこの刻みに切り下げる（形状キャッシュのキーが揺れないように）
+SIZE_STEP = 0.5
+
+
+class TextMetrics:
+    """基準サイズで測った文字列の大きさ（幅, 高さ）のディスクキャッシュ"""
+
+    def __init__(self, path: Path = METRICS_PATH) -> None:
+        self.path = Path(path)
+        self._extents: dict[str, list[float]] | None = None
+
+    @property
+    def extents(self) -> dict[str, list[float]]:
+        if self._extents is None:
+            self._extents = self._read()
+        return self._extents
+
+    def _read(self) -> dict[str, list[float]]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def measure(
+        self,
+        text: str,
+        font: str,
+        weight: str = NORMAL,
+        slant: str = NORMAL,
+        line_spacing: float = -1,
+    ) -> tuple[float, float]:
+        """基準サイズでの（幅, 高さ）"""
+        key = hashlib.sha256(
+            json.dumps([text, font, weight, slant, line_spacing, manim_version()]).encode()
+        ).hexdigest()[:24]
+        extent = self.extents.get(key)
+        if extent is None:
+            mob = CachedText(
+                text,
+                font_size=REFERENCE_SIZE,
+                font=font,
+                weight=weight,
+                slant=slant,
+                line_spacing=line_spacing,
+                warn_missing_font=False,
+            )
+            extent = [mob.width, mob.height]
+            self.extents[key] = extent
+            self._save(key, extent)
+        return extent[0], extent[1]
+
+    def _save(self, key: str, extent: list[float]) -> None:
+        # 並列のレンダリングが書いた分を消さないよう、ディスクの内容に足して書き戻す
+        merged = self._read()
+        merged[key] = extent
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(merged, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+_metrics = TextMetrics()
+
+
+def frame_width() -> float:
+    """余白を除いた画面の幅"""
+    return config.frame_width - 2 * FRAME_MARGIN
+
+
+def frame_height() -> float:
+    """余白を除いた画面の高さ"""
+    return config.frame_height - 2 * FRAME_MARGIN
+
+
+def column_width(columns: int, gutter: float = 0.5) -> float:
+    """画面を columns 列に分けたときの1列の幅"""
+    return (frame_width() - gutter * (columns - 1)) / columns
+
+
+def fit_font_size(
+    text: str,
+    font_size: float = DEFAULT_FONT_SIZE,
+    max_width: float | None = None,
+    max_height: float | None = None,
+    min_font_size: float = MIN_FONT_SIZE,
+    font: str | None = None,
+    weight: str = NORMAL,
+    slant: str = NORMAL,
+    line_spacing: float = -1,
+) -> float:
+    """枠に収まる最大の font_size（font_size より大きくはしない）
+
+    max_width を省略すると画面の幅（余白を除く）に収める。
+    """
+    width, height = _metrics.measure(text, font or scene_font(), weight, slant, line_spacing)
+    limits = [font_size]
+    if width > 0:
+        limits.append(REFERENCE_SIZE * (max_width or frame_width()) / width)
+    if max_height is not None and height > 0:
+        limits.append(REFERENCE_SIZE * max_height / height)
+    fitted = min(limits)
+    if fitted >= font_size:
+        return font_size
+    fitted = math.floor(fitted / SIZE_STEP) * SIZE_STEP
+    if fitted < min_font_size:
+        logger.warning(f"{text!r} は font_size={min_font_size} でも枠に収まりません")
+        return min_font_size
+    return fitted
+
+
+class FittedText(CachedText):
+    """枠に収まるように font_size を下げる CachedText（収まれば指定どおり）"""
+
+    def __init__(
+        self,
+        text: str,
+        font_size: float = DEFAULT_FONT_SIZE,
+        max_width: float | None = None,
+        max_height: float | None = None,
+        **kwargs,
+    ) -> None:
+        font_size = fit_font_size(
+            text,
+            font_size,
+            max_width,
+            max_height,
+            font=kwargs.get("font"),
+            weight=kwargs.get("weight", NORMAL),
+            slant=kwargs.get("slant", NORMAL),
+            line_spacing=kwargs.get("line_spacing", -1),
+        )
+        super().__init__(text, font_size=font_size, **kwargs)
+
+
+def fit_to_frame(mobject: Mobject, max_width: float | None = None) -> Mobject:
+    """並べて置いたグループを画面の幅（余白を除く）に収める（収まっていれば何もしない）
+
+    幅が max_width を超えるなら中心を保って全体を縮め、それでも左右にはみ出すなら
+    内側へずらす。
+    """
+    limit = min(max_width or frame_width(), frame_width())
+    if mobject.width > limit:
+        mobject.scale_to_fit_width(limit)
+    half = frame_width() / 2
+    overflow_left = -half - mobject.get_left()[0]
+    overflow_right = mobject.get_right()[0] - half
+    if overflow_left > 0:
+        mobject.shift(RIGHT * overflow_left)
+    elif overflow_right > 0:
+        mobject.shift(LEFT * overflow_right)
+    return mobject
@@ -10,27 +10,34 @@
 
 from manim import *
 
+from fonts import apply_scene_fonts
+from i18n import _
+from ripple import Emit, RippleEmitter
+from seismic import LONDON_MODEL, Propagate, StationField, on_frames, station_arrivals
+from text_cache import CachedText
+from text_fit import FittedText, fit_to_frame, frame_width
+
 
 class TheoryEmergence(Scene):
     """理論の萌芽をアニメーション表示するシーン"""
 
     def construct(self):
-        # 日本語フォント設定
-        Text.set_default(font="Hiragino Sans")
+        # フォント設定（言語ごとのフォールバックつき）
+        apply_scene_fonts()
 
         # タイトル表示
-        title = Text("理論の萌芽", font_size=72, color=WHITE)
+        title = FittedText(_("理論の萌芽"), font_size=72, color=WHITE)
         self.play(Write(title), run_time=1.5)
         self.wait(0.5)
         self.play(title.animate.scale(0.6).to_edge(UP))
 
         # サブタイトル
-        subtitle = Text("1750年ロンドン地震の観察", font_size=36, color=YELLOW)
+        subtitle = FittedText(_("1750年ロンドン地震の観察"), font_size=36, color=YELLOW)
         subtitle.next_to(title, DOWN, buff=0.3)
         self.play(FadeIn(subtitle, shift=UP))
 
         # 地震の「軌道」概念を視覚化
-        concept_text = Text("地震の「軌道」概念", font_size=40, color=ORANGE)
+        concept_text = FittedText(_("地震の「軌道」概念"), font_size=40, color=ORANGE)
         concept_text.move_to(UP * 1)
         self.play(Write(concept_text), run_time=1)
         self.wait(0.5)
@@ -38,17 +45,17 @@ class TheoryEmergence(Scene):
 
         # 震源から波が広がるアニメーション
         epicenter = Dot(point=LEFT * 3, color=RED, radius=0.15)
-        epicenter_label = Text("震源", font_size=20, color=RED)
+        epicenter_label = FittedText(_("震源"), font_size=20, color=RED)
         epicenter_label.next_to(epicenter, DOWN, buff=0.2)
 
         # 観測点を配置
         observers = VGroup()
         observer_positions = [LEFT * 1, ORIGIN, RIGHT * 1.5, RIGHT * 3]
-        observer_labels = ["A地点", "B地点", "C地点", "D地点"]
+        observer_labels = [_("A地点"), _("B地点"), _("C地点"), _("D地点")]
 
         for pos, label in zip(observer_positions, observer_labels):
             dot = Dot(point=pos + DOWN * 0.5, color=BLUE, radius=0.1)
-            text = Text(label, font_size=16, color=BLUE_B)
+            text = FittedText(label, font_size=16, color=BLUE_B)
             text.next_to(dot, DOWN, buff=0.1)
             observers.add(VGroup(dot, text))
 
@@ -58,20 +65,55 @@ class TheoryEmergence(Scene):
         )
         self.play(FadeIn(observers))
 
-        # 波の伝播アニメーション（D地点まで到達する大きさ）
-        for i in range(3):
-            wave = Circle(radius=0.1, color=ORANGE, stroke_width=2)
-            wave.move_to(epicenter.get_center())
-            self.play(
-                wave.animate.scale(65).set_opacity(0),
-                run_time=1.5,
-                rate_func=linear,
+        # 波の伝播アニメーション（1単位 = 10km、到達時刻と強さは震源からの距離で計算）
+        meters_per_unit = 10_000
+        epicenter_xy = epicenter.get_center()[:2] * meters_per_unit
+        observer_xy = np.array([observer[0].get_center()[:2] for observer in observers])
+        arrivals = station_arrivals(epicenter_xy, observer_xy * meters_per_unit, LONDON_MODEL)
+
+        # 多数の仮想の観測点を帯状に並べ、波が届いた順に強さに応じて光らせる
+        rng = np.random.default_rng(1750)
+        count = 3000
+        synthetic = np.column_stack(
+            [rng.uniform(-6.5, 6.5, count), rng.uniform(-1.3, 0.5, count), np.zeros(count)]
+        )
+        stations = StationField(
+            synthetic,
+            station_arrivals(epicenter_xy, synthetic[:, :2] * meters_per_unit, LONDON_MODEL),
+            color=ORANGE,
+        )
+
+        # 4.5秒で最後の観測点まで届くように再生し、波面の輪も同じ速さで広げる
+        run_time = 4.5
+        until = stations.max_time
+        wave = RippleEmitter(
+            epicenter.get_center(),
+            speeds=LONDON_MODEL.velocity / meters_per_unit * until / run_time,
+            lifetimes=run_time,
+            start_radius=0,
+            color=ORANGE,
+            stroke_width=2,
+        )
+
+        # A〜D地点は到達したフレームで光らせる（輪の大きさは揺れの強さ）
+        starts = on_frames(arrivals.times * run_time / until, config.frame_rate)
+        strengths = arrivals.intensities / arrivals.intensities.max()
+        highlights = [
+            Succession(
+                Wait(run_time=start),
+                Flash(observer[0], color=YELLOW, flash_radius=0.2 + 0.3 * strength, run_time=0.5),
             )
-            self.remove(wave)
+            for observer, start, strength in zip(observers, starts, strengths)
+        ]
+        self.play(
+            Propagate(stations, run_time=run_time),
+            Emit(wave),
+            *highlights,
+        )
 
         # 説明テキスト
-        explanation1 = Text(
-            "場所によって揺れの到達時刻・強度が異なる",
+        explanation1 = FittedText(
+            _("場所によって揺れの到達時刻・強度が異なる"),
             font_size=28,
             color=WHITE,
         )
@@ -86,7 +128,7 @@ class TheoryEmergence(Scene):
             color=GREEN,
             buff=0,
         )
-        arrow_label = Text("地震は「移動する現象」", font_size=24, color=GREEN)
+        arrow_label = FittedText(_("地震は「移動する現象」"), font_size=24, color=GREEN)
         arrow_label.next_to(arrow, DOWN, buff=0.2)
 
         self.play(GrowArrow(arrow), run_time=1)
@@ -99,14 +141,15 @@ class TheoryEmergence(Scene):
             FadeOut(epicenter),
             FadeOut(epicenter_label),
             FadeOut(observers),
+            FadeOut(stations),
             FadeOut(explanation1),
             FadeOut(arrow),
             FadeOut(arrow_label),
         )
 
         # 現代との接続
-        modern_text = Text(
-            "現代の「震源からの地震波伝播」が経験則として認識",
+        modern_text = FittedText(
+            _("現代の「震源からの地震波伝播」が経験則として認識"),
             font_size=30,
             color=WHITE,
         )
@@ -116,14 +159,16 @@ class TheoryEmergence(Scene):
         self.play(FadeOut(modern_text))
 
         # 結論
-        conclusion_icon = Text("💡", font_size=64)
-        conclusion_text = Text(
-            "地震を科学的に解釈しようとする萌芽",
+        conclusion_icon = CachedText("💡", font_size=64)
+        conclusion_text = FittedText(
+            _("地震を科学的に解釈しようとする萌芽"),
             font_size=40,
             color=YELLOW,
         )
         conclusion = VGroup(conclusion_icon, conclusion_text).arrange(RIGHT, buff=0.3)
         conclusion.move_to(ORIGIN)
+        # 強調で 1.1 倍にしてもはみ出さないように
+        fit_to_frame(conclusion, max_width=frame_width() / 1.1)
 
         self.play(FadeIn(conclusion, scale=0.8))
 
@@ -138,25 +183,25 @@ class TheoryEmergenceSimple(Scene):
     """シンプル版：テキストのみのアニメーション"""
 
     def construct(self):
-        Text.set_default(font="Hiragino Sans")
+        apply_scene_fonts()
 
         # タイトル
-        title = Text("理論の萌芽", font_size=64, color=WHITE)
+        title = FittedText(_("理論の萌芽"), font_size=64, color=WHITE)
         self.play(Write(title))
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # 1750年ロンドン地震
-        header = Text("1750年ロンドン地震の観察", font_size=36, color=YELLOW)
+        header = FittedText(_("1750年ロンドン地震の観察"), font_size=36, color=YELLOW)
         header.next_to(title, DOWN, buff=0.5)
         self.play(FadeIn(header, shift=UP))
 
         # 箇条書き
         items = VGroup(
-            Text("• 地震の「軌道」概念", font_size=32, color=ORANGE),
-            Text("• 場所によって揺れの到達時刻・強度が異なる", font_size=28, color=WHITE),
-            Text("  → 地震は「移動する現象」", font_size=28, color=GREEN),
-            Text("• 現代の「震源からの地震波伝播」の経験則", font_size=28, color=WHITE),
+            FittedText(_("• 地震の「軌道」概念"), font_size=32, color=ORANGE),
+            FittedText(_("• 場所によって揺れの到達時刻・強度が異なる"), font_size=28, color=WHITE),
+            FittedText(_("  → 地震は「移動する現象」"), font_size=28, color=GREEN),
+            FittedText(_("• 現代の「震源からの地震波伝播」の経験則"), font_size=28, color=WHITE),
         ).arrange(DOWN, buff=0.4, aligned_edge=LEFT)
         items.move_to(DOWN * 0.3)
 
@@ -169,10 +214,11 @@ class TheoryEmergenceSimple(Scene):
 
         # 結論
         conclusion = VGroup(
-            Text("💡", font_size=56),
-            Text("地震を科学的に解釈しようとする萌芽", font_size=36, color=YELLOW),
+            CachedText("💡", font_size=56),
+            FittedText(_("地震を科学的に解釈しようとする萌芽"), font_size=36, color=YELLOW),
         ).arrange(RIGHT, buff=0.3)
         conclusion.move_to(ORIGIN)
+        fit_to_frame(conclusion)
 
         self.play(FadeIn(conclusion, scale=0.9))
         self.wait(2)
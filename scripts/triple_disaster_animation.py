@@ -9,53 +9,67 @@
 
 from manim import *
 
+from fonts import apply_scene_fonts
+from i18n import _
+from subtitle_timing import CueSyncedScene
+from text_cache import CachedText
+from text_fit import FittedText, fit_to_frame
 
-class TripleDisaster(Scene):
-    """三重の災害を順番にアニメーション表示するシーン"""
+
+class TripleDisaster(CueSyncedScene):
+    """三重の災害を順番にアニメーション表示するシーン
+
+    ナレーションの字幕（キュー17〜20）に合わせて、各災害をその説明の開始時に表示する。
+    """
+
+    # シーンの 0 秒 = 「特に恐ろしかったのは、三重の災害でした。」の開始
+    subtitle_origin_cue = 17
 
     def construct(self):
-        # 日本語フォント設定（環境に応じて調整が必要な場合あり）
-        Text.set_default(font="Hiragino Sans")
+        # フォント設定（言語ごとのフォールバックつき）
+        apply_scene_fonts()
 
         # タイトル表示
-        title = Text("三重の災害", font_size=72, color=WHITE)
-        subtitle = Text("1755年リスボン大地震", font_size=36, color=GRAY)
+        title = FittedText(_("三重の災害"), font_size=72, color=WHITE)
+        subtitle = FittedText(_("1755年リスボン大地震"), font_size=36, color=GRAY)
         subtitle.next_to(title, DOWN, buff=0.5)
 
         self.play(Write(title), run_time=1.5)
         self.play(FadeIn(subtitle, shift=UP), run_time=1)
-        self.wait(1)
-        self.play(FadeOut(title), FadeOut(subtitle))
+        # 1つ目の災害の説明（キュー18）が始まるときに消え終わるように
+        self.wait_until_cue(18, offset=-1.0)
+        self.play(FadeOut(title), FadeOut(subtitle), run_time=1.0)
 
         # 災害リストの作成
         disasters = [
             {
                 "number": "1",
-                "title": "地震",
-                "description": "建物の倒壊（3回の大きな揺れ）",
+                "title": _("地震"),
+                "description": _("建物の倒壊（3回の大きな揺れ）"),
                 "color": ORANGE,
                 "icon": self.create_earthquake_icon(),
             },
             {
                 "number": "2",
-                "title": "津波",
-                "description": "海水が一度引いた後、巨大な波が襲来",
+                "title": _("津波"),
+                "description": _("海水が一度引いた後、巨大な波が襲来"),
                 "color": BLUE,
                 "icon": self.create_tsunami_icon(),
             },
             {
                 "number": "3",
-                "title": "火災",
-                "description": "調理器具の転倒などにより市内各所で発生",
+                "title": _("火災"),
+                "description": _("調理器具の転倒などにより市内各所で発生"),
                 "color": RED,
                 "icon": self.create_fire_icon(),
             },
         ]
 
-        # 各災害を順番に表示
+        # 各災害を順番に表示（地震・津波・火災の説明はキュー18・19・20）
         displayed_items = VGroup()
+        cues = [18, 19, 20]
 
-        for i, disaster in enumerate(disasters):
+        for i, (disaster, cue) in enumerate(zip(disasters, cues)):
             item = self.create_disaster_item(disaster, i)
             displayed_items.add(item)
 
@@ -76,7 +90,11 @@ class TripleDisaster(Scene):
                 run_time=0.3,
             )
 
-            self.wait(0.5)
+            # 次の災害の説明が始まるまで（最後は説明が終わるまで）待つ
+            if i + 1 < len(cues):
+                self.wait_until_cue(cues[i + 1])
+            else:
+                self.wait_until_cue(cue, edge="end")
 
         # 全体を少し待機
         self.wait(1)
@@ -101,16 +119,16 @@ class TripleDisaster(Scene):
         """災害項目のビジュアル要素を作成"""
         # 番号バッジ
         badge = Circle(radius=0.3, color=disaster["color"], fill_opacity=0.8)
-        number = Text(disaster["number"], font_size=24, color=WHITE)
+        number = CachedText(disaster["number"], font_size=24, color=WHITE)
         number.move_to(badge.get_center())
         badge_group = VGroup(badge, number)
 
         # タイトル（太字）
-        title = Text(disaster["title"], font_size=48, color=disaster["color"])
+        title = FittedText(disaster["title"], font_size=48, color=disaster["color"])
         title.next_to(badge_group, RIGHT, buff=0.3)
 
         # 説明文
-        description = Text(disaster["description"], font_size=28, color=GRAY_A)
+        description = FittedText(disaster["description"], font_size=28, color=GRAY_A)
         description.next_to(title, RIGHT, buff=0.3)
 
         # アイコン
@@ -123,7 +141,7 @@ class TripleDisaster(Scene):
         item.move_to(ORIGIN)
         item.shift(UP * (1.5 - index * 1.5))  # 縦に配置
 
-        return item
+        return fit_to_frame(item)
 
     def create_earthquake_icon(self) -> VGroup:
         """地震アイコン（揺れる建物）を作成"""
@@ -186,32 +204,33 @@ class TripleDisasterSimple(Scene):
     """シンプル版：テキストのみのアニメーション"""
 
     def construct(self):
-        Text.set_default(font="Hiragino Sans")
+        apply_scene_fonts()
 
         # タイトル
-        title = Text("三重の災害", font_size=64, color=WHITE)
+        title = FittedText(_("三重の災害"), font_size=64, color=WHITE)
         self.play(Write(title))
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # 箇条書き項目
         items = [
-            ("1. 地震", "建物の倒壊（3回の大きな揺れ）", ORANGE),
-            ("2. 津波", "海水が一度引いた後、巨大な波が襲来", BLUE),
-            ("3. 火災", "調理器具の転倒などにより市内各所で発生", RED),
+            (_("1. 地震"), _("建物の倒壊（3回の大きな揺れ）"), ORANGE),
+            (_("2. 津波"), _("海水が一度引いた後、巨大な波が襲来"), BLUE),
+            (_("3. 火災"), _("調理器具の転倒などにより市内各所で発生"), RED),
         ]
 
         bullet_group = VGroup()
 
         for i, (label, desc, color) in enumerate(items):
             # ラベル部分
-            label_text = Text(label, font_size=40, color=color)
+            label_text = FittedText(label, font_size=40, color=color)
             # 説明部分
-            desc_text = Text(desc, font_size=28, color=GRAY_A)
+            desc_text = FittedText(desc, font_size=28, color=GRAY_A)
             desc_text.next_to(label_text, DOWN, aligned_edge=LEFT, buff=0.2)
 
             item_group = VGroup(label_text, desc_text)
             item_group.shift(DOWN * (i * 1.8) + UP * 1.5 + LEFT * 2)
+            fit_to_frame(item_group)
 
             bullet_group.add(item_group)
 
@@ -8,34 +8,40 @@
 
 from manim import *
 
+from fonts import apply_scene_fonts
+from i18n import _
+from text_cache import CachedText
+from text_fit import FittedText, column_width, fit_to_frame
+
 
 class WhyVsHow(Scene):
     """「なぜ」vs「どのように」をアニメーション表示するシーン"""
 
     def construct(self):
-        # 日本語フォント設定
-        Text.set_default(font="Hiragino Sans")
+        # フォント設定（言語ごとのフォールバックつき）
+        apply_scene_fonts()
 
         # タイトル
-        title = Text("科学的探究の本質", font_size=56, color=WHITE)
+        title = FittedText(_("科学的探究の本質"), font_size=56, color=WHITE)
         self.play(Write(title), run_time=1.5)
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # 問いの転換を表示
-        old_question = Text(
-            "「なぜ神様はこんな災害を起こしたのか？」",
+        old_question = FittedText(
+            _("「なぜ神様はこんな災害を起こしたのか？」"),
             font_size=32,
             color=RED,
         )
         old_question.move_to(UP * 1)
 
-        self.play(FadeIn(old_question, shift=RIGHT))
-        self.wait(0.5)
-
         # 十字架アイコン（神学的）
-        cross_icon = Text("✝️", font_size=48)
+        cross_icon = CachedText("✝️", font_size=48)
         cross_icon.next_to(old_question, LEFT, buff=0.3)
+        fit_to_frame(VGroup(cross_icon, old_question))
+
+        self.play(FadeIn(old_question, shift=RIGHT))
+        self.wait(0.5)
         self.play(FadeIn(cross_icon), run_time=0.5)
 
         # 矢印で転換
@@ -49,8 +55,8 @@ class WhyVsHow(Scene):
         self.play(GrowArrow(arrow))
 
         # 新しい問い
-        new_question = Text(
-            "「どのように地震が起きたのか？」\n「どのような被害が起こったのか？」",
+        new_question = FittedText(
+            _("「どのように地震が起きたのか？」\n「どのような被害が起こったのか？」"),
             font_size=32,
             color=BLUE,
         )
@@ -58,8 +64,9 @@ class WhyVsHow(Scene):
         new_question.move_to(DOWN * 1.2)
 
         # グラフアイコン（科学的）
-        chart_icon = Text("📊", font_size=48)
+        chart_icon = CachedText("📊", font_size=48)
         chart_icon.next_to(new_question, LEFT, buff=0.3)
+        fit_to_frame(VGroup(chart_icon, new_question))
 
         self.play(FadeIn(new_question, shift=RIGHT), FadeIn(chart_icon))
         self.wait(1.5)
@@ -74,28 +81,43 @@ class WhyVsHow(Scene):
         )
 
         # 対比構造
-        comparison_title = Text("この違いが科学的探究の本質", font_size=36, color=YELLOW)
+        comparison_title = FittedText(_("この違いが科学的探究の本質"), font_size=36, color=YELLOW)
         comparison_title.move_to(UP * 2)
         self.play(FadeIn(comparison_title, shift=UP))
 
         # 左側: 神学的解釈
-        left_header = Text("神学的解釈", font_size=36, color=RED)
+        left_header = FittedText(_("神学的解釈"), font_size=36, max_width=column_width(2), color=RED)
         left_header.move_to(LEFT * 3 + UP * 0.8)
 
-        left_question = Text("「なぜ」", font_size=64, color=RED_B)
+        left_question = FittedText(_("「なぜ」"), font_size=64, max_width=column_width(2), color=RED_B)
         left_question.move_to(LEFT * 3)
 
-        left_detail = Text("神はこれを起こしたのか", font_size=24, color=GRAY_A)
+        left_detail = FittedText(
+            _("神はこれを起こしたのか"),
+            font_size=24,
+            max_width=column_width(2),
+            color=GRAY_A,
+        )
         left_detail.next_to(left_question, DOWN, buff=0.3)
 
         # 右側: 科学的アプローチ
-        right_header = Text("科学的アプローチ", font_size=36, color=BLUE)
+        right_header = FittedText(
+            _("科学的アプローチ"),
+            font_size=36,
+            max_width=column_width(2),
+            color=BLUE,
+        )
         right_header.move_to(RIGHT * 3 + UP * 0.8)
 
-        right_question = Text("「どのように」", font_size=56, color=BLUE_B)
+        right_question = FittedText(
+            _("「どのように」"),
+            font_size=56,
+            max_width=column_width(2),
+            color=BLUE_B,
+        )
         right_question.move_to(RIGHT * 3)
 
-        right_detail = Text("起きたのか", font_size=24, color=GRAY_A)
+        right_detail = FittedText(_("起きたのか"), font_size=24, max_width=column_width(2), color=GRAY_A)
         right_detail.next_to(right_question, DOWN, buff=0.3)
 
         # 中央の分割線
@@ -107,7 +129,7 @@ class WhyVsHow(Scene):
         )
 
         # VS
-        vs_text = Text("vs", font_size=40, color=YELLOW)
+        vs_text = CachedText("vs", font_size=40, color=YELLOW)
         vs_text.move_to(UP * 0.3)
 
         # 表示
@@ -141,28 +163,30 @@ class WhyVsHowSimple(Scene):
     """シンプル版"""
 
     def construct(self):
-        Text.set_default(font="Hiragino Sans")
+        apply_scene_fonts()
 
         # タイトル
-        title = Text("科学的探究の本質", font_size=48, color=WHITE)
+        title = FittedText(_("科学的探究の本質"), font_size=48, color=WHITE)
         self.play(Write(title))
         self.wait(0.5)
         self.play(title.animate.to_edge(UP))
 
         # 「なぜ」
-        why_label = Text("神学的解釈:", font_size=28, color=GRAY_A)
-        why_text = Text("「なぜ」神はこれを起こしたのか", font_size=36, color=RED)
+        why_label = FittedText(_("神学的解釈:"), font_size=28, color=GRAY_A)
+        why_text = FittedText(_("「なぜ」神はこれを起こしたのか"), font_size=36, color=RED)
         why_group = VGroup(why_label, why_text).arrange(RIGHT, buff=0.3)
         why_group.move_to(UP * 1)
+        fit_to_frame(why_group)
 
         self.play(FadeIn(why_group, shift=RIGHT))
         self.wait(0.5)
 
         # 「どのように」
-        how_label = Text("科学的アプローチ:", font_size=28, color=GRAY_A)
-        how_text = Text("「どのように」起きたのか", font_size=36, color=BLUE)
+        how_label = FittedText(_("科学的アプローチ:"), font_size=28, color=GRAY_A)
+        how_text = FittedText(_("「どのように」起きたのか"), font_size=36, color=BLUE)
         how_group = VGroup(how_label, how_text).arrange(RIGHT, buff=0.3)
         how_group.move_to(DOWN * 0.5)
+        fit_to_frame(how_group)
 
         self.play(FadeIn(how_group, shift=RIGHT))
         self.wait(1)